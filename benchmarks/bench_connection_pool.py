@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""
+Compare one-connection-per-request against the extractor's pooled session.
+
+Usage:
+    python benchmarks/bench_connection_pool.py --requests 500
+"""
+import argparse
+import os
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linkedin_decision_maker_extractor import LinkedInDecisionMakerExtractor, TokenBucketRateLimiter  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+
+def bench_unpooled(base_url: str, n: int) -> float:
+    start = time.perf_counter()
+    for page in range(n):
+        response = requests.get(f"{base_url}/company_employee", params={"page": page}, timeout=30)
+        response.raise_for_status()
+        response.json()
+    return time.perf_counter() - start
+
+
+def bench_pooled(base_url: str, n: int) -> float:
+    # Measure the transport only, not the default per-key rate limit
+    limiter = TokenBucketRateLimiter(rate=1e9, burst=10**9)
+    with LinkedInDecisionMakerExtractor("bench", rate_limiter=limiter) as extractor:
+        extractor.base_url = base_url
+        start = time.perf_counter()
+        for page in range(n):
+            extractor._make_request("company_employee", {"page": page})
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Connection pooling benchmark")
+    parser.add_argument("--requests", "-n", type=int, default=500, help="Requests per run")
+    args = parser.parse_args()
+
+    with StubServer() as server:
+        unpooled = bench_unpooled(server.base_url, args.requests)
+        pooled = bench_pooled(server.base_url, args.requests)
+
+    print(f"unpooled: {args.requests / unpooled:8.1f} req/s ({unpooled * 1000 / args.requests:.2f} ms/req)")
+    print(f"pooled:   {args.requests / pooled:8.1f} req/s ({pooled * 1000 / args.requests:.2f} ms/req)")
+    print(f"speedup:  {unpooled / pooled:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
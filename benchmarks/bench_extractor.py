@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+"""
+Measure end-to-end extraction throughput against the local fake LinkedIn API.
+
+Each mode runs in a fresh process so peak RSS is reported per mode:
+
+    sync      one extractor, companies one after another, pages fetched serially
+    threaded  one extractor shared by --concurrency threads, --prefetch-window pages in flight
+    async     AsyncLinkedInDecisionMakerExtractor, --concurrency companies at once
+
+Usage:
+    python benchmarks/bench_extractor.py --companies 20 --employees 1000 --latency 0.005
+    python benchmarks/bench_extractor.py --modes async --rate-limit-rate 0.02 --error-rate 0.01
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linkedin_decision_maker_extractor import (  # noqa: E402
+    AsyncLinkedInDecisionMakerExtractor, InFlightLimiter, LinkedInDecisionMakerExtractor, TokenBucketRateLimiter
+)
+from stub_server import StubServer  # noqa: E402
+
+MODES = ("sync", "threaded", "async")
+
+
+def peak_rss_mb() -> float:
+    if resource is None:
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def time_requests(extractor, latencies, is_async: bool = False) -> None:
+    # Record the latency of every _make_request call, retries included
+    make_request = extractor._make_request
+
+    if is_async:
+        async def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await make_request(*args, **kwargs)
+            finally:
+                latencies.append(time.perf_counter() - start)
+    else:
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return make_request(*args, **kwargs)
+            finally:
+                latencies.append(time.perf_counter() - start)
+
+    extractor._make_request = timed
+
+
+def run_mode(mode: str, base_url: str, company_urls, concurrency: int, prefetch_window: int,
+             retry_delay: float) -> dict:
+    """
+    Extract every company in one mode and return timings (runs in a child process).
+    """
+    logging.disable(logging.CRITICAL)
+    limiter = TokenBucketRateLimiter(rate=1e9, burst=10**9)
+    latencies = []
+    decision_makers = 0
+
+    if mode == "async":
+        import asyncio
+
+        async def run():
+            extractor = AsyncLinkedInDecisionMakerExtractor(
+                "bench", rate_limiter=limiter, prefetch_window=prefetch_window, max_connections=concurrency * prefetch_window
+            )
+            extractor.base_url = base_url
+            extractor.retry_delay = retry_delay
+            time_requests(extractor, latencies, is_async=True)
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def extract(url):
+                async with semaphore:
+                    return await extractor.extract_decision_makers(url)
+
+            try:
+                return await asyncio.gather(*(extract(url) for url in company_urls))
+            finally:
+                await extractor.close()
+
+        start = time.perf_counter()
+        results = asyncio.run(run())
+        elapsed = time.perf_counter() - start
+    else:
+        window = prefetch_window if mode == "threaded" else 1
+        workers = concurrency if mode == "threaded" else 1
+        with LinkedInDecisionMakerExtractor("bench", rate_limiter=limiter, prefetch_window=window,
+                                            pool_maxsize=workers * window,
+                                            in_flight_limiter=InFlightLimiter(workers * window)) as extractor:
+            extractor.base_url = base_url
+            extractor.retry_delay = retry_delay
+            time_requests(extractor, latencies)
+            start = time.perf_counter()
+            results = [result for _, result in extractor.extract_many(company_urls, max_workers=workers)]
+            elapsed = time.perf_counter() - start
+
+    decision_makers = sum(len(result) for result in results)
+    latencies.sort()
+    return {
+        "elapsed": elapsed,
+        "calls": len(latencies),
+        "decision_makers": decision_makers,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extractor throughput benchmark")
+    parser.add_argument("--modes", type=str, default=",".join(MODES), help="Comma-separated modes to run")
+    parser.add_argument("--companies", type=int, default=20, help="Companies extracted per mode")
+    parser.add_argument("--employees", type=int, default=1000, help="Employees per company (100 per page)")
+    parser.add_argument("--concurrency", "-j", type=int, default=8, help="Companies in flight (threaded, async)")
+    parser.add_argument("--prefetch-window", "-w", type=int, default=4, help="Pages in flight per company (threaded, async)")
+    parser.add_argument("--latency", type=float, default=0.005, help="Server latency per request in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra server latency in seconds")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument("--retry-delay", type=float, default=0.05, help="Extractor base retry delay in seconds")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for injected failures")
+    args = parser.parse_args()
+
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    unknown = set(modes) - set(MODES)
+    if unknown:
+        parser.error(f"unknown modes: {', '.join(sorted(unknown))}")
+    company_urls = [f"https://www.linkedin.com/company/bench-{i}/" for i in range(args.companies)]
+
+    print(f"{'mode':<9} {'req/s':>9} {'companies/min':>14} {'p50 ms':>8} {'p99 ms':>8} "
+          f"{'peak RSS MB':>12} {'429s':>6} {'errors':>7} {'decision makers':>16}")
+    with StubServer(employees_per_company=args.employees, latency=args.latency, latency_jitter=args.jitter,
+                    rate_limit_rate=args.rate_limit_rate, error_rate=args.error_rate, seed=args.seed) as server:
+        context = multiprocessing.get_context("spawn")
+        for mode in modes:
+            before = dict(server.stats)
+            # A fresh process per mode keeps peak RSS figures independent
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = executor.submit(run_mode, mode, server.base_url, company_urls, args.concurrency,
+                                         args.prefetch_window, args.retry_delay).result()
+            stats = {name: server.stats[name] - before[name] for name in before}
+
+            elapsed = result["elapsed"]
+            print(f"{mode:<9} {stats['requests'] / elapsed:>9.1f} {args.companies * 60 / elapsed:>14.1f} "
+                  f"{result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f} {result['peak_rss_mb']:>12.1f} "
+                  f"{stats['rate_limited']:>6} {stats['errors']:>7} {result['decision_makers']:>16}")
+
+
+if __name__ == "__main__":
+    main()
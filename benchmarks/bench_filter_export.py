@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Measure filter and export throughput on synthetic employees at production scale.
+
+Records come from synthetic_data.generate_employees, so runs with the same seed
+see the same skewed title distribution.
+
+Usage:
+    python benchmarks/bench_filter_export.py --records 1000000
+    python benchmarks/bench_filter_export.py --records 5000000 --decision-maker-share 0.02 --skew 1.3
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linkedin_decision_maker_extractor import LinkedInDecisionMakerExtractor, TitleMatcher  # noqa: E402
+from synthetic_data import generate_employees  # noqa: E402
+
+
+def report(label: str, records: int, elapsed: float, path: str = None) -> None:
+    line = f"{label:<22} {records / elapsed:>12,.0f} records/s  {elapsed:8.3f} s"
+    if path is not None:
+        line += f"  {os.path.getsize(path) / (1024 * 1024) / elapsed:8.1f} MB/s"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Filter and export benchmark")
+    parser.add_argument("--records", "-n", type=int, default=1_000_000, help="Synthetic employees")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--decision-maker-share", type=float, default=0.05, help="Fraction of decision makers")
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent of the title distribution")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    employees = list(generate_employees(args.records, args.seed, decision_maker_share=args.decision_maker_share,
+                                        skew=args.skew))
+    report("generate", len(employees), time.perf_counter() - start)
+
+    extractor = LinkedInDecisionMakerExtractor("bench", title_matcher=TitleMatcher())
+    start = time.perf_counter()
+    decision_makers = extractor.filter_decision_makers(employees)
+    report("filter (cold cache)", len(employees), time.perf_counter() - start)
+    start = time.perf_counter()
+    extractor.filter_decision_makers(employees)
+    report("filter (warm cache)", len(employees), time.perf_counter() - start)
+    print(f"{len(decision_makers):,} decision makers ({len(decision_makers) / max(1, len(employees)):.1%}); "
+          f"title cache {extractor.title_matcher.cache_stats}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, save, extension in (("save_to_csv", extractor.save_to_csv, "csv"),
+                                       ("save_to_json", extractor.save_to_json, "json"),
+                                       ("save_to_jsonl", extractor.save_to_jsonl, "jsonl")):
+            path = os.path.join(tmp, f"employees.{extension}")
+            start = time.perf_counter()
+            save(employees, path)
+            report(label, len(employees), time.perf_counter() - start, path)
+    extractor.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""
+Compare the per-keyword substring scan with the compiled TitleMatcher,
+with and without its title cache.
+
+Uncached, the matcher is only slightly faster than the scan (about 1.1x);
+nearly all of the gain on real batches comes from the title cache, because
+job titles repeat heavily.
+
+Usage:
+    python benchmarks/bench_title_matcher.py --titles 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from linkedin_decision_maker_extractor import DECISION_MAKER_KEYWORDS, TitleMatcher  # noqa: E402
+
+# The legacy scan knows nothing about acronyms, so compare like with like
+MATCHER = TitleMatcher(DECISION_MAKER_KEYWORDS, acronyms=(), cache_size=0)
+# What the extractor actually runs uncached: keywords plus whole-word acronyms
+ACRONYM_MATCHER = TitleMatcher(cache_size=0)
+CACHED_MATCHER = TitleMatcher(DECISION_MAKER_KEYWORDS, acronyms=())
+
+SENIORITY = ["", "Senior ", "Junior ", "Lead ", "Principal ", "Associate "]
+ROLES = [
+    "Software Engineer", "Sales Representative", "Account Executive", "Data Scientist",
+    "Product Manager", "Director of Marketing", "VP Engineering", "Chief Financial Officer",
+    "Recruiter", "Customer Success Specialist", "Head of Design", "Founder & CEO", "Intern",
+]
+
+
+def synthetic_titles(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [rng.choice(SENIORITY) + rng.choice(ROLES) for _ in range(n)]
+
+
+def legacy_scan(titles):
+    # The original filter_decision_makers loop: one lowered substring test per keyword
+    count = 0
+    for title in titles:
+        title = title.lower()
+        for keyword in DECISION_MAKER_KEYWORDS:
+            if keyword.lower() in title:
+                count += 1
+                break
+    return count
+
+
+def compiled_scan(titles):
+    is_decision_maker = MATCHER.is_decision_maker
+    return sum(1 for title in titles if is_decision_maker(title))
+
+
+def acronym_scan(titles):
+    is_decision_maker = ACRONYM_MATCHER.is_decision_maker
+    return sum(1 for title in titles if is_decision_maker(title))
+
+
+def cached_scan(titles):
+    is_decision_maker = CACHED_MATCHER.is_decision_maker
+    return sum(1 for title in titles if is_decision_maker(title))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Title matcher micro-benchmark")
+    parser.add_argument("--titles", "-n", type=int, default=1_000_000, help="Number of synthetic titles")
+    parser.add_argument("--repeat", "-r", type=int, default=3, help="Runs per variant; the best is reported")
+    args = parser.parse_args()
+
+    titles = synthetic_titles(args.titles)
+    variants = (("substring scan", legacy_scan), ("compiled matcher", compiled_scan),
+                ("+ acronyms", acronym_scan), ("cached matcher", cached_scan))
+    for name, scan in variants:
+        elapsed = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            matches = scan(titles)
+            elapsed = min(elapsed, time.perf_counter() - start)
+        print(f"{name:17s} {elapsed:6.2f}s  {args.titles / elapsed / 1e6:5.2f}M titles/s  ({matches} decision makers)")
+    print(f"title cache: {CACHED_MATCHER.cache_stats}")
+
+
+if __name__ == "__main__":
+    main()
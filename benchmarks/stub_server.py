@@ -0,0 +1,148 @@
+"""
+Local fake of the LinkedIn API used by the benchmarks in this directory.
+
+Implements the two endpoints the extractor calls:
+
+    GET /company?link=<company url>                          -> {"id": ..., "name": ...}
+    GET /company_employee?companyId=&page=&pageSize=         -> {"results": [...]}
+
+Latency, the number of employees per company, 429 injection and error rates are
+configurable, and random choices are seeded so runs are repeatable.
+"""
+import json
+import random
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from synthetic_data import generate_employees
+
+
+class _FakeAPIHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so that clients are allowed to keep the connection open
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        api = self.server.api
+        parts = urlsplit(self.path)
+        endpoint = parts.path.rstrip("/").rsplit("/", 1)[-1]
+        params = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        api.count("requests")
+
+        if api.latency or api.latency_jitter:
+            time.sleep(api.latency + api.random() * api.latency_jitter)
+
+        if api.random() < api.rate_limit_rate:
+            api.count("rate_limited")
+            self.send_json(429, {"message": "Too Many Requests"}, {"Retry-After": str(api.retry_after)})
+        elif api.random() < api.error_rate:
+            api.count("errors")
+            self.send_json(500, {"message": "Internal Server Error"})
+        elif endpoint == "company":
+            self.send_json(200, api.company(params.get("link", "")))
+        elif endpoint == "company_employee":
+            page = int(params.get("page", 1))
+            page_size = int(params.get("pageSize", 100))
+            self.send_json(200, {"results": api.employees(params.get("companyId"), page, page_size)})
+        else:
+            self.send_json(404, {"message": "Not Found"})
+
+    def send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _FakeAPIServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Async clients open many connections at once
+    request_queue_size = 256
+
+    def handle_error(self, request, client_address):
+        # Clients drop connections for prefetched pages they no longer need
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class StubServer:
+    """
+    Serve a fake LinkedIn API on localhost from a background thread.
+
+    Use as a context manager; ``base_url`` points at the running server and
+    ``stats`` counts requests, injected 429s and injected errors.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, employees_per_company: int = 250,
+                 latency: float = 0.0, latency_jitter: float = 0.0, rate_limit_rate: float = 0.0,
+                 retry_after: float = 0, error_rate: float = 0.0, seed: int = 0):
+        """
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind (0 picks a free port)
+            employees_per_company (int): Employees returned for every company
+            latency (float): Seconds added to every response
+            latency_jitter (float): Up to this many random extra seconds per response
+            rate_limit_rate (float): Fraction of requests answered with 429
+            retry_after (float): Retry-After value sent with injected 429s
+            error_rate (float): Fraction of requests answered with 500
+            seed (int): Seed for injected failures and latency jitter
+        """
+        self.employees_per_company = employees_per_company
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self.stats = {"requests": 0, "rate_limited": 0, "errors": 0}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self._server = _FakeAPIServer((host, port), _FakeAPIHandler)
+        self._server.api = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def random(self) -> float:
+        with self._lock:
+            return self._random.random()
+
+    def company(self, link: str) -> dict:
+        slug = link.rstrip("/").rsplit("/", 1)[-1] or "company"
+        return {"id": str(zlib.crc32(slug.encode("utf-8"))), "name": slug, "website": f"https://{slug}.example"}
+
+    def employees(self, company_id, page: int, page_size: int) -> list:
+        if company_id is None:
+            return []
+        start = (page - 1) * page_size
+        stop = min(start + page_size, self.employees_per_company)
+        # Seeded by company and page, so a page is the same on every request
+        return list(generate_employees(max(0, stop - start), seed=f"{company_id}:{page}:{page_size}",
+                                       company_id=company_id, first_index=start))
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+"""
+Deterministic generator of synthetic employee records in the API's shape.
+
+Titles follow a skewed (Zipf-like) distribution, as on real company pages: a
+handful of individual-contributor titles dominate and decision makers are a
+small, configurable share. The same seed always produces the same records.
+
+Usage:
+    python benchmarks/synthetic_data.py --count 1000000 --output employees.jsonl
+    python benchmarks/synthetic_data.py --count 5000000 --output employees.parquet --seed 7
+    python benchmarks/synthetic_data.py --count 1000 --output - | head
+"""
+import argparse
+import json
+import random
+import sys
+from itertools import accumulate, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+SENIORITY = ("", "Senior ", "Junior ", "Lead ", "Principal ", "Staff ", "Associate ")
+ROLES = (
+    "Software Engineer", "Sales Representative", "Customer Support Specialist", "Data Analyst",
+    "Recruiter", "Designer", "Accountant", "Marketing Specialist", "Consultant", "Developer",
+    "Operations Associate", "Data Scientist", "Technician", "Coordinator", "Business Analyst",
+    "QA Engineer", "Administrator", "Intern", "Researcher", "Copywriter",
+)
+DECISION_MAKER_TITLES = (
+    "Engineering Manager", "Director of Engineering", "Head of Sales", "VP Marketing", "Product Manager",
+    "Sales Manager", "Director, Finance", "Chief Executive Officer", "Co-Founder & CEO", "CTO",
+    "Vice President of Operations", "Founder", "Managing Partner", "Chief Revenue Officer", "CFO",
+    "Owner", "President", "Head of People", "Executive Director", "CISO",
+)
+FIRST_NAMES = ("Alex", "Maria", "Wei", "Fatima", "John", "Priya", "Lucas", "Amara", "Yuki", "Omar",
+               "Sofia", "Ivan", "Chloe", "Mateo", "Aisha", "Noah", "Elena", "Kwame", "Hana", "Liam")
+LAST_NAMES = ("Smith", "Garcia", "Chen", "Khan", "Muller", "Rossi", "Kim", "Okafor", "Silva", "Novak",
+              "Tanaka", "Cohen", "Dubois", "Ivanova", "Patel", "Jones", "Larsen", "Moreau", "Singh", "Brown")
+
+
+def _zipf_cum_weights(n: int, s: float) -> List[float]:
+    return list(accumulate(1.0 / (rank ** s) for rank in range(1, n + 1)))
+
+
+def generate_employees(count: int, seed=0, company_id: str = "1000",
+                       decision_maker_share: float = 0.05, missing_title_share: float = 0.01,
+                       skew: float = 1.1, first_index: int = 0) -> Iterator[Dict]:
+    """
+    Yield synthetic employee records, streamed so millions fit in constant memory.
+
+    Args:
+        count (int): Number of records
+        seed (int or str): Seed; equal seeds produce equal records
+        company_id (str): Company ID used in the record ids
+        decision_maker_share (float): Fraction of records with a decision maker title
+        missing_title_share (float): Fraction of records without a title (None)
+        skew (float): Zipf exponent of the title distribution (higher is more skewed)
+        first_index (int): Number used in the id of the first record
+
+    Yields:
+        Dict: Record with id, firstName, lastName and title
+    """
+    rng = random.Random(seed)
+    titles = [seniority + role for role in ROLES for seniority in SENIORITY]
+    # Shuffle once so the most common titles are not all the same role
+    random.Random(0).shuffle(titles)
+    title_weights = _zipf_cum_weights(len(titles), skew)
+    dm_weights = _zipf_cum_weights(len(DECISION_MAKER_TITLES), skew)
+    batch_size = 10000
+
+    for start in range(0, count, batch_size):
+        n = min(batch_size, count - start)
+        regular = rng.choices(titles, cum_weights=title_weights, k=n)
+        leaders = rng.choices(DECISION_MAKER_TITLES, cum_weights=dm_weights, k=n)
+        firsts = rng.choices(FIRST_NAMES, k=n)
+        lasts = rng.choices(LAST_NAMES, k=n)
+        kinds = [rng.random() for _ in range(n)]
+        for i in range(n):
+            if kinds[i] < missing_title_share:
+                title = None
+            elif kinds[i] < missing_title_share + decision_maker_share:
+                title = leaders[i]
+            else:
+                title = regular[i]
+            yield {"id": f"{company_id}-{first_index + start + i}", "firstName": firsts[i], "lastName": lasts[i],
+                   "title": title}
+
+
+def employee_pages(records: Iterable[Dict], page_size: int = 100) -> Iterator[List[Dict]]:
+    """
+    Group records into pages shaped like the company_employee endpoint's results.
+    """
+    records = iter(records)
+    while True:
+        page = list(islice(records, page_size))
+        if not page:
+            return
+        yield page
+
+
+def write_jsonl(records: Iterable[Dict], output) -> int:
+    """
+    Write records as JSON Lines to a path or an open text file and return the count.
+    """
+    if isinstance(output, str):
+        with open(output, "w", encoding="utf-8") as f:
+            return write_jsonl(records, f)
+    count = 0
+    for record in records:
+        output.write(json.dumps(record))
+        output.write("\n")
+        count += 1
+    return count
+
+
+def write_parquet(records: Iterable[Dict], path: str, batch_size: int = 65536,
+                  columns: Sequence[str] = ("id", "firstName", "lastName", "title")) -> int:
+    """
+    Write records to a Parquet file in row groups of batch_size and return the count.
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Writing Parquet requires pyarrow (pip install pyarrow)") from None
+
+    schema = pa.schema([(column, pa.string()) for column in columns])
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for batch in employee_pages(records, batch_size):
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            count += len(batch)
+    return count
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Generate synthetic employee records")
+    parser.add_argument("--count", "-n", type=int, default=1_000_000, help="Number of records")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", "-o", type=str, default="-", help="Output file ('-' writes JSONL to stdout)")
+    parser.add_argument("--format", "-f", choices=["auto", "jsonl", "parquet"], default="auto",
+                        help="Output format (auto picks from the file extension)")
+    parser.add_argument("--company-id", type=str, default="1000", help="Company ID used in record ids")
+    parser.add_argument("--decision-maker-share", type=float, default=0.05, help="Fraction of decision makers")
+    parser.add_argument("--missing-title-share", type=float, default=0.01, help="Fraction of records without a title")
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent of the title distribution")
+    args = parser.parse_args(argv)
+
+    records = generate_employees(args.count, args.seed, args.company_id, args.decision_maker_share,
+                                 args.missing_title_share, args.skew)
+    output_format = args.format
+    if output_format == "auto":
+        output_format = "parquet" if args.output.endswith(".parquet") else "jsonl"
+
+    if args.output == "-":
+        if output_format == "parquet":
+            parser.error("Parquet output needs a file name")
+        write_jsonl(records, sys.stdout)
+        return
+    count = write_parquet(records, args.output) if output_format == "parquet" else write_jsonl(records, args.output)
+    print(f"Wrote {count} records to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,22 @@
 #!/usr/bin/env python
 import argparse
+import csv
+import itertools
+import json
+import logging
 import os
+import re
 import sys
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, Optional
 from dotenv import load_dotenv
-from linkedin_decision_maker_extractor import LinkedInDecisionMakerExtractor
+from linkedin_decision_maker_extractor import (
+    BACKOFF_STRATEGIES, DEFAULT_BURST, DEFAULT_LOG_BACKUP_COUNT, DEFAULT_LOG_FILE, DEFAULT_LOG_MAX_BYTES, DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_REQUESTS_PER_SECOND, ApiKeyPool, AuthenticationError, CheckpointStore, CircuitBreaker, CircuitOpenError,
+    CompanyIdCache, CsvRecordWriter, InFlightLimiter, JsonLinesRecordWriter, JsonRecordWriter,
+    LinkedInDecisionMakerExtractor, ProcessSharedRateLimiter, ResponseCache, RetryBudget, SnapshotStore,
+    TokenBucketRateLimiter, configure_logging, extract_many_in_processes
+)
 from datetime import datetime
 
 def parse_arguments():
@@ -18,13 +31,48 @@ def parse_arguments():
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
     )
     
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         "--company", "-c",
         type=str,
-        required=True,
         help="LinkedIn company URL"
     )
     
+    source.add_argument(
+        "--companies-file", "-i",
+        type=str,
+        help="File with one company per line, or CSV/JSONL with a company URL column ('-' reads stdin)"
+    )
+    
+    parser.add_argument(
+        "--input-format",
+        type=str,
+        choices=["auto", "lines", "csv", "jsonl"],
+        default="auto",
+        help="Format of --companies-file (auto detects from the extension or first line)"
+    )
+    
+    parser.add_argument(
+        "--concurrency", "-j",
+        type=int,
+        default=4,
+        help="Number of companies processed at once in batch mode (per process with --processes)"
+    )
+    
+    parser.add_argument(
+        "--processes", "-P",
+        type=int,
+        default=1,
+        help="In batch mode, spread companies over this many worker processes sharing one API rate budget; "
+             "use when JSON decoding and filtering saturate a core"
+    )
+    
+    parser.add_argument(
+        "--combined",
+        action="store_true",
+        help="In batch mode, write all companies to one output file instead of one file per company"
+    )
+    
     parser.add_argument(
         "--output", "-o",
         type=str,
@@ -35,19 +83,462 @@ def parse_arguments():
     parser.add_argument(
         "--format", "-f",
         type=str,
-        choices=["csv", "json", "both"],
+        choices=["csv", "json", "jsonl", "both"],
         default="both",
-        help="Output format"
+        help="Output format (both writes csv and json)"
     )
     
     parser.add_argument(
         "--api-key", "-k",
         type=str,
-        help="LinkedIn API key (overrides environment variable)"
+        help="LinkedIn API key (overrides environment variable); separate several keys with commas "
+             "to spread requests over all of them"
+    )
+    
+    parser.add_argument(
+        "--prefetch-window", "-w",
+        type=int,
+        default=1,
+        help="Number of employee pages to keep in flight (1 fetches pages serially)"
+    )
+    
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=DEFAULT_REQUESTS_PER_SECOND,
+        help="Sustained API requests per second for each API key"
+    )
+    
+    parser.add_argument(
+        "--burst",
+        type=int,
+        default=DEFAULT_BURST,
+        help="Number of API requests allowed back-to-back before rate limiting applies"
+    )
+    
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=DEFAULT_MAX_IN_FLIGHT,
+        help="Maximum API requests outstanding at once across all companies and pages"
+    )
+    
+    parser.add_argument(
+        "--backoff",
+        choices=BACKOFF_STRATEGIES,
+        default="exponential",
+        help="How the wait between retries grows; the jittered strategies keep throttled workers from retrying in step"
+    )
+    
+    parser.add_argument(
+        "--request-deadline",
+        type=float,
+        help="Seconds a single API request may take including retries before it fails"
+    )
+    
+    parser.add_argument(
+        "--retry-budget",
+        type=int,
+        help="Maximum number of retries for the whole run; once spent, failing requests give up at once"
+    )
+    
+    parser.add_argument(
+        "--retry-budget-seconds",
+        type=float,
+        help="Maximum total seconds spent backing off before retries for the whole run"
+    )
+    
+    parser.add_argument(
+        "--circuit-breaker",
+        action="store_true",
+        help="Stop sending requests while the API is failing, parking companies until probe requests succeed"
+    )
+    
+    parser.add_argument(
+        "--breaker-failure-rate",
+        type=float,
+        default=0.5,
+        help="Share of failed requests (server errors, timeouts) among the recent ones that opens the circuit"
+    )
+    
+    parser.add_argument(
+        "--breaker-min-calls",
+        type=int,
+        default=20,
+        help="Requests observed before the failure rate can open the circuit"
+    )
+    
+    parser.add_argument(
+        "--breaker-recovery",
+        type=float,
+        default=30.0,
+        help="Seconds the circuit stays open before probing the API again"
+    )
+    
+    parser.add_argument(
+        "--max-park-time",
+        type=float,
+        default=3600.0,
+        help="Seconds a company waits on an open circuit before it is skipped"
+    )
+    
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=30.0,
+        help="Total seconds one request may take, including reading the response body"
+    )
+    
+    parser.add_argument(
+        "--connect-timeout",
+        type=float,
+        help="Seconds allowed to open a connection to the API (default: --timeout)"
+    )
+    
+    parser.add_argument(
+        "--read-timeout",
+        type=float,
+        help="Seconds allowed between two reads of a response (default: --timeout)"
+    )
+    
+    parser.add_argument(
+        "--hedge-percentile",
+        type=float,
+        help="Send a second request for an employee page still unanswered after this latency percentile "
+             "of the endpoint (e.g. 0.95); the first answer wins"
+    )
+    
+    parser.add_argument(
+        "--company-cache",
+        type=str,
+        help="SQLite file caching company URL to ID lookups between runs"
+    )
+    
+    parser.add_argument(
+        "--company-cache-ttl",
+        type=float,
+        default=30,
+        help="Days a cached company ID stays valid"
+    )
+    
+    parser.add_argument(
+        "--response-cache",
+        type=str,
+        help="SQLite file caching API responses; later runs send conditional requests and reuse unchanged bodies"
+    )
+    
+    parser.add_argument(
+        "--response-cache-mb",
+        type=float,
+        default=256,
+        help="Maximum size of cached response bodies in MB (least recently used are evicted)"
+    )
+    
+    parser.add_argument(
+        "--delta",
+        type=str,
+        metavar="SNAPSHOT_DB",
+        help="SQLite file holding the previous results; only added, removed and changed "
+             "decision makers are written, and nothing is written for unchanged companies"
+    )
+    
+    parser.add_argument(
+        "--checkpoint-dir",
+        type=str,
+        help="Directory recording fetched employee pages so an interrupted run resumes where it stopped"
+    )
+    
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Discard existing checkpoints in --checkpoint-dir and fetch everything again"
+    )
+    
+    parser.add_argument(
+        "--log-level",
+        type=str,
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        default="INFO",
+        help="Minimum level of log messages"
+    )
+    
+    parser.add_argument(
+        "--log-file",
+        type=str,
+        default=DEFAULT_LOG_FILE,
+        help="Rotating log file ('' logs to stderr only)"
+    )
+    
+    parser.add_argument(
+        "--log-max-bytes",
+        type=int,
+        default=DEFAULT_LOG_MAX_BYTES,
+        help="Size at which the log file is rotated"
+    )
+    
+    parser.add_argument(
+        "--log-backup-count",
+        type=int,
+        default=DEFAULT_LOG_BACKUP_COUNT,
+        help="Number of rotated log files kept"
+    )
+    
+    parser.add_argument(
+        "--sync-logging",
+        action="store_true",
+        help="Write log messages from the calling thread instead of a background thread"
     )
     
     return parser.parse_args()
 
+URL_COLUMNS = ("company", "company_url", "companyUrl", "url", "link")
+
+def read_company_urls(lines: Iterable[str], input_format: str = "auto") -> Iterator[str]:
+    """
+    Read company URLs from plain lines, CSV or JSON Lines input.
+    
+    Blank lines and lines starting with '#' are skipped in plain and JSONL input.
+    CSV input must have a header row; the URL is taken from the first column
+    named in URL_COLUMNS, or the first column otherwise.
+    
+    Args:
+        lines (Iterable[str]): Input lines (e.g. an open file or sys.stdin)
+        input_format (str): One of "auto", "lines", "csv" or "jsonl"
+        
+    Yields:
+        str: Company URLs in input order
+    """
+    lines = iter(lines)
+    if input_format == "auto":
+        # Sniff the first meaningful line and put it back in front of the rest
+        first = ""
+        for first in lines:
+            if first.strip() and not first.lstrip().startswith("#"):
+                break
+        else:
+            return
+        stripped = first.strip()
+        if stripped.startswith("{"):
+            input_format = "jsonl"
+        elif "," in stripped and not stripped.lower().startswith("http"):
+            input_format = "csv"
+        else:
+            input_format = "lines"
+        lines = itertools.chain([first], lines)
+    
+    if input_format == "csv":
+        for row in csv.DictReader(lines):
+            column = next((c for c in URL_COLUMNS if row.get(c)), None)
+            url = row[column] if column else next(iter(row.values()), "")
+            if url and url.strip():
+                yield url.strip()
+        return
+    
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if input_format == "jsonl":
+            record = json.loads(line)
+            url = next((record[c] for c in URL_COLUMNS if record.get(c)), None)
+            if url:
+                yield url.strip()
+        else:
+            yield line
+
+def company_slug(company_url: str) -> str:
+    """
+    Derive a filesystem-friendly name for a company from its LinkedIn URL.
+    
+    Args:
+        company_url (str): LinkedIn URL of the company
+        
+    Returns:
+        str: Slug such as "microsoft" for https://www.linkedin.com/company/microsoft/
+    """
+    match = re.search(r"/company/([^/?#]+)", company_url)
+    name = match.group(1) if match else company_url
+    return re.sub(r"[^A-Za-z0-9_-]+", "_", name).strip("_") or "company"
+
+OUTPUT_WRITERS = {"csv": CsvRecordWriter, "json": JsonRecordWriter, "jsonl": JsonLinesRecordWriter}
+
+def output_extensions(output_format: str) -> List[str]:
+    """
+    Map an --format value to the file extensions to write.
+    """
+    return ["csv", "json"] if output_format == "both" else [output_format]
+
+def save_results(extractor: LinkedInDecisionMakerExtractor, decision_makers: List[Dict],
+                 output_base: str, output_format: str) -> None:
+    """
+    Save decision makers in the requested format(s).
+    
+    Args:
+        extractor (LinkedInDecisionMakerExtractor): Extractor providing the writers
+        decision_makers (List[Dict]): Records to save
+        output_base (str): Output path without extension
+        output_format (str): One of "csv", "json", "jsonl" or "both"
+    """
+    savers = {"csv": extractor.save_to_csv, "json": extractor.save_to_json, "jsonl": extractor.save_to_jsonl}
+    for extension in output_extensions(output_format):
+        output_file = f"{output_base}.{extension}"
+        savers[extension](decision_makers, output_file)
+        print(f"Results saved to {output_file}")
+
+def delta_changes(snapshot_store: SnapshotStore, company_url: str, decision_makers: List[Dict]) -> List[Dict]:
+    """
+    Compare decision makers with the previous snapshot of a company.
+    
+    An empty result is reported as no change rather than everyone being removed,
+    because a failed extraction also returns no decision makers.
+    
+    Args:
+        snapshot_store (SnapshotStore): Store holding the previous results
+        company_url (str): LinkedIn URL of the company
+        decision_makers (List[Dict]): Decision makers from this run
+        
+    Returns:
+        List[Dict]: Added, changed and removed records, each with a "change" field
+    """
+    if not decision_makers:
+        return []
+    return snapshot_store.diff(company_url, decision_makers)
+
+def open_caches(args: argparse.Namespace):
+    """
+    Open the company ID and response caches requested on the command line.
+    
+    Returns:
+        Tuple[Optional[CompanyIdCache], Optional[ResponseCache]]: The caches, or None where not requested
+    """
+    company_id_cache = None
+    if args.company_cache:
+        company_id_cache = CompanyIdCache(args.company_cache, ttl=args.company_cache_ttl * 24 * 3600)
+    response_cache = None
+    if args.response_cache:
+        response_cache = ResponseCache(args.response_cache, max_bytes=int(args.response_cache_mb * 1024 * 1024))
+    return company_id_cache, response_cache
+
+def configure_retries(extractor: LinkedInDecisionMakerExtractor, args: argparse.Namespace,
+                      share: int = 1) -> Optional[RetryBudget]:
+    """
+    Apply the retry, circuit breaker and hedging options of the command line to an extractor.
+    
+    Args:
+        extractor (LinkedInDecisionMakerExtractor): Extractor to configure
+        args (argparse.Namespace): Parsed command line arguments
+        share (int): Number of processes splitting the retry budget
+        
+    Returns:
+        Optional[RetryBudget]: The run's retry budget, or None if unlimited
+    """
+    extractor.backoff = args.backoff
+    extractor.request_deadline = args.request_deadline
+    extractor.max_park_time = args.max_park_time
+    extractor.hedge_percentile = args.hedge_percentile
+    if args.circuit_breaker:
+        extractor.circuit_breaker = CircuitBreaker(args.breaker_failure_rate, args.breaker_min_calls,
+                                                   recovery_timeout=args.breaker_recovery)
+    if args.retry_budget is not None or args.retry_budget_seconds is not None:
+        extractor.retry_budget = RetryBudget(
+            None if args.retry_budget is None else args.retry_budget // share,
+            None if args.retry_budget_seconds is None else args.retry_budget_seconds / share
+        )
+    return extractor.retry_budget
+
+def build_worker_extractor(args: argparse.Namespace,
+                           limiters: Dict[str, TokenBucketRateLimiter]) -> LinkedInDecisionMakerExtractor:
+    """
+    Build the extractor of one --processes worker; runs inside the worker process.
+    
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+        limiters (Dict[str, TokenBucketRateLimiter]): Cross-process limiter for each API key
+        
+    Returns:
+        LinkedInDecisionMakerExtractor: Extractor with its own caches and connection pool
+    """
+    api_keys = list(limiters)
+    key_pool = ApiKeyPool(api_keys, limiters=limiters) if len(api_keys) > 1 else None
+    # The in-flight cap is split evenly between the processes
+    max_in_flight = max(1, args.max_in_flight * len(api_keys) // args.processes)
+    company_id_cache, response_cache = open_caches(args)
+    extractor = LinkedInDecisionMakerExtractor(
+        api_keys[0], prefetch_window=args.prefetch_window, rate_limiter=limiters[api_keys[0]],
+        pool_maxsize=max(1, args.concurrency) * args.prefetch_window,
+        company_id_cache=company_id_cache, response_cache=response_cache,
+        checkpoint_store=CheckpointStore(args.checkpoint_dir) if args.checkpoint_dir else None,
+        in_flight_limiter=InFlightLimiter(max_in_flight), key_pool=key_pool,
+        timeout=args.timeout, connect_timeout=args.connect_timeout, read_timeout=args.read_timeout
+    )
+    configure_retries(extractor, args, share=args.processes)
+    return extractor
+
+def run_batch(extractor: LinkedInDecisionMakerExtractor, company_urls: Iterable[str], args: argparse.Namespace,
+              timestamp: str, snapshot_store: Optional[SnapshotStore] = None,
+              extractor_factory=None) -> Dict[str, int]:
+    """
+    Extract decision makers for many companies with one extractor.
+    
+    Companies are processed concurrently and written as soon as each finishes,
+    so a slow company does not hold back the others. In combined mode rows are
+    streamed into the shared output files, so memory does not grow with the batch.
+    With a snapshot store only changes are written, and a company's snapshot is
+    replaced once its changes have been saved.
+    
+    Args:
+        extractor (LinkedInDecisionMakerExtractor): Shared extractor
+        company_urls (Iterable[str]): Company URLs to process
+        args (argparse.Namespace): Parsed command line arguments
+        timestamp (str): Timestamp appended to output file names
+        snapshot_store (SnapshotStore, optional): Previous results for delta output
+        extractor_factory (optional): Picklable callable building a worker's extractor;
+            when given, companies are extracted on args.processes worker processes
+        
+    Returns:
+        Dict[str, int]: Number of decision makers found per company URL
+    """
+    combined_writers = []
+    counts = {}
+    
+    try:
+        if extractor_factory is not None:
+            results = extract_many_in_processes(company_urls, extractor_factory, args.processes,
+                                                batch_size=max(1, args.concurrency))
+        else:
+            results = extractor.extract_many(company_urls, max_workers=max(1, args.concurrency))
+        for company_url, decision_makers in results:
+            counts[company_url] = len(decision_makers)
+            records = decision_makers
+            if snapshot_store is not None:
+                records = delta_changes(snapshot_store, company_url, decision_makers)
+                print(f"{company_url}: found {len(decision_makers)} decision makers, {len(records)} changes.")
+            else:
+                print(f"{company_url}: found {len(decision_makers)} decision makers.")
+            if not records:
+                continue
+        
+            if args.combined:
+                if not combined_writers:
+                    combined_writers = [OUTPUT_WRITERS[extension](f"{args.output}_{timestamp}.{extension}")
+                                        for extension in output_extensions(args.format)]
+                for writer in combined_writers:
+                    writer.write_many(dict(record, companyUrl=company_url) for record in records)
+            else:
+                save_results(extractor, records,
+                             f"{args.output}_{company_slug(company_url)}_{timestamp}", args.format)
+            
+            if snapshot_store is not None:
+                snapshot_store.save(company_url, decision_makers)
+    finally:
+        for writer in combined_writers:
+            writer.close()
+    
+    for writer in combined_writers:
+        print(f"Results saved to {writer.output_file}")
+    
+    return counts
+
 def main():
     # Load environment variables from .env file
     load_dotenv()
@@ -55,19 +546,116 @@ def main():
     # Parse command line arguments
     args = parse_arguments()
     
+    # Log from a background thread so extraction never waits on disk I/O
+    log_listener = configure_logging(
+        getattr(logging, args.log_level), args.log_file or None, args.log_max_bytes, args.log_backup_count,
+        use_queue=not args.sync_logging
+    )
+    try:
+        run(args)
+    finally:
+        if log_listener is not None:
+            log_listener.stop()
+
+def run(args: argparse.Namespace) -> None:
+    """
+    Run a single-company or batch extraction for parsed command line arguments.
+    
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+    """
     # Get API key from arguments or environment variable
-    api_key = args.api_key or os.getenv("LINKEDIN_API_KEY")
+    api_keys = [key.strip() for key in (args.api_key or os.getenv("LINKEDIN_API_KEY") or "").split(",") if key.strip()]
     
-    if not api_key:
+    if not api_keys:
         print("Error: LinkedIn API key not provided. Use --api-key option or set LINKEDIN_API_KEY environment variable.")
         sys.exit(1)
+    api_key = api_keys[0]
     
     # Initialize the extractor
-    extractor = LinkedInDecisionMakerExtractor(api_key)
+    rate_limiter = TokenBucketRateLimiter.for_key(api_key, args.rate_limit, args.burst)
+    key_pool = None
+    max_in_flight = args.max_in_flight
+    if len(api_keys) > 1:
+        # Every key brings its own quota, so the caps scale with the number of keys
+        key_pool = ApiKeyPool(api_keys, args.rate_limit, args.burst)
+        max_in_flight *= len(key_pool.api_keys)
+    company_id_cache, response_cache = open_caches(args)
+    snapshot_store = SnapshotStore(args.delta) if args.delta else None
+    checkpoint_store = None
+    if args.checkpoint_dir:
+        checkpoint_store = CheckpointStore(args.checkpoint_dir)
+        if args.restart:
+            checkpoint_store.clear()
+    extractor = LinkedInDecisionMakerExtractor(
+        api_key, prefetch_window=args.prefetch_window, rate_limiter=rate_limiter,
+        pool_maxsize=max(1, args.concurrency) * args.prefetch_window,
+        company_id_cache=company_id_cache, checkpoint_store=checkpoint_store, response_cache=response_cache,
+        in_flight_limiter=InFlightLimiter.for_key(",".join(api_keys), max_in_flight), key_pool=key_pool,
+        timeout=args.timeout, connect_timeout=args.connect_timeout, read_timeout=args.read_timeout
+    )
+    retry_budget = configure_retries(extractor, args)
+    
+    # Generate output file name with timestamp
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    if args.companies_file:
+        extractor_factory = None
+        if args.processes > 1:
+            # One shared-memory token bucket per key keeps every process within the key's quota
+            limiters = {key: ProcessSharedRateLimiter(args.rate_limit, args.burst) for key in dict.fromkeys(api_keys)}
+            extractor_factory = partial(build_worker_extractor, args, limiters)
+        try:
+            if args.companies_file == "-":
+                counts = run_batch(extractor, read_company_urls(sys.stdin, args.input_format), args, timestamp,
+                                   snapshot_store, extractor_factory)
+            else:
+                input_format = args.input_format
+                if input_format == "auto" and args.companies_file.endswith((".csv", ".jsonl")):
+                    input_format = args.companies_file.rsplit(".", 1)[1]
+                with open(args.companies_file, newline="") as f:
+                    counts = run_batch(extractor, read_company_urls(f, input_format), args, timestamp, snapshot_store,
+                                       extractor_factory)
+        except AuthenticationError as e:
+            # Every remaining company would fail the same way
+            print(f"Error: {e}. Aborting the batch; companies finished so far have been written.")
+            sys.exit(1)
+        print(f"Processed {len(counts)} companies, found {sum(counts.values())} decision makers.")
+        if extractor_factory is None:
+            # With --processes the workers keep their own caches and counters, so the parent's stay at zero
+            print(f"Title cache: {extractor.title_matcher.cache_stats}")
+            if company_id_cache is not None:
+                print(f"Company ID cache: {company_id_cache.stats}")
+            if response_cache is not None:
+                print(f"Response cache: {response_cache.stats}")
+            if retry_budget is not None:
+                print(f"Retry budget: {retry_budget.stats}")
+            if extractor.circuit_breaker is not None:
+                print(f"Circuit breaker: {extractor.circuit_breaker.stats}")
+            print(f"Request latency: {extractor.latency_histogram.stats}")
+            if extractor.hedge_percentile is not None:
+                print(f"Hedged requests: {extractor.hedged_requests}")
+            if key_pool is not None:
+                # Only the last characters of each key, so the summary is safe to share
+                usage = {f"...{key[-4:]}": (stats["requests"], stats["throttled"])
+                         for key, stats in key_pool.stats.items()}
+                print(f"API key pool (requests, 429s): {usage}")
+        if company_id_cache is not None:
+            company_id_cache.close()
+        if response_cache is not None:
+            response_cache.close()
+        if snapshot_store is not None:
+            snapshot_store.close()
+        extractor.close()
+        return
     
     # Extract decision makers
     print(f"Extracting decision makers from {args.company}...")
-    decision_makers = extractor.extract_decision_makers(args.company)
+    try:
+        decision_makers = extractor.extract_decision_makers(args.company)
+    except (AuthenticationError, CircuitOpenError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
     
     if not decision_makers:
         print("No decision makers found.")
@@ -75,20 +663,18 @@ def main():
     
     print(f"Found {len(decision_makers)} decision makers.")
     
-    # Generate output file name with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_base = f"{args.output}_{timestamp}"
+    records = decision_makers
+    if snapshot_store is not None:
+        records = delta_changes(snapshot_store, args.company, decision_makers)
+        if not records:
+            print("No changes since the last run.")
+            sys.exit(0)
+        print(f"{len(records)} changes since the last run.")
     
     # Save results based on format option
-    if args.format in ["csv", "both"]:
-        csv_file = f"{output_base}.csv"
-        extractor.save_to_csv(decision_makers, csv_file)
-        print(f"Results saved to {csv_file}")
-    
-    if args.format in ["json", "both"]:
-        json_file = f"{output_base}.json"
-        extractor.save_to_json(decision_makers, json_file)
-        print(f"Results saved to {json_file}")
+    save_results(extractor, records, f"{args.output}_{timestamp}", args.format)
+    if snapshot_store is not None:
+        snapshot_store.save(args.company, decision_makers)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
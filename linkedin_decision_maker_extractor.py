@@ -1,43 +1,3033 @@
+import csv
 import requests
+from requests.adapters import HTTPAdapter
 import time
-import pandas as pd
 import logging
 import json
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+import hashlib
+from urllib.parse import urlencode, urlsplit
 import os
+import random
+import re
+import sqlite3
+import sys
+import threading
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("linkedin_extractor.log"),
-        logging.StreamHandler()
-    ]
+# asyncio and aiohttp are only needed by AsyncLinkedInDecisionMakerExtractor and
+# account for most of the import time, so they are bound on first use by
+# _import_async_dependencies() instead of here.
+asyncio = None
+aiohttp = None
+
+# The library only emits records; the CLI or host application decides where they
+# go (see configure_logging).
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DEFAULT_LOG_FILE = "linkedin_extractor.log"
+DEFAULT_LOG_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_LOG_BACKUP_COUNT = 5
+# Response bodies quoted in log lines are cut to this many characters
+MAX_LOGGED_BODY = 500
+
+_log_listener = None
+
+
+def configure_logging(level: int = logging.INFO, log_file: Optional[str] = DEFAULT_LOG_FILE,
+                      max_bytes: int = DEFAULT_LOG_MAX_BYTES, backup_count: int = DEFAULT_LOG_BACKUP_COUNT,
+                      use_queue: bool = True):
+    """
+    Send log records to stderr and a size-capped rotating file.
+    
+    With use_queue, the root logger only gets a QueueHandler and a background
+    QueueListener does the console and disk writes, so request threads never
+    block on log I/O. Calling this again replaces the previous configuration.
+    
+    Args:
+        level (int, optional): Root logger level
+        log_file (str, optional): Rotating log file path (None logs to stderr only)
+        max_bytes (int, optional): Size at which the log file is rotated
+        backup_count (int, optional): Number of rotated files kept
+        use_queue (bool, optional): Hand records to a background listener thread
+        
+    Returns:
+        logging.handlers.QueueListener: The running listener, or None without use_queue.
+            Call stop() on it (or configure_logging again) to flush pending records.
+    """
+    import queue
+    from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+    global _log_listener
+    
+    if _log_listener is not None:
+        try:
+            _log_listener.stop()
+        except AttributeError:
+            pass  # Already stopped by the caller
+        _log_listener = None
+    
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        handlers.append(RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count,
+                                            encoding="utf-8", delay=True))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    if use_queue:
+        records = queue.SimpleQueue()
+        _log_listener = QueueListener(records, *handlers, respect_handler_level=True)
+        _log_listener.start()
+        queue_handler = QueueHandler(records)
+        # The listener's handlers apply LOG_FORMAT; only merge args into the message here
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
+        handlers = [queue_handler]
+    
+    logging.basicConfig(level=level, handlers=handlers, force=True)
+    return _log_listener
+
+
+def _truncate(text, limit: int = MAX_LOGGED_BODY) -> str:
+    """
+    Shorten a response body for logging.
+    """
+    text = str(text)
+    return text if len(text) <= limit else f"{text[:limit]}... [{len(text) - limit} more characters]"
+
+# Default pacing for a single API key: one request per second on average,
+# allowing short bursts (e.g. prefetched pages) without waiting.
+DEFAULT_REQUESTS_PER_SECOND = 1.0
+DEFAULT_BURST = 10
+# Requests a single API key may have outstanding at once across all threads
+DEFAULT_MAX_IN_FLIGHT = 16
+# How the wait between retries grows: plain doubling, or doubling with full or
+# decorrelated jitter so that workers throttled together do not retry together
+BACKOFF_STRATEGIES = ("exponential", "full_jitter", "decorrelated_jitter")
+
+
+class TokenBucketRateLimiter:
+    """
+    Thread-safe and asyncio-safe token bucket.
+    
+    Tokens refill continuously at ``rate`` per second up to ``burst``. Callers
+    that find a token available proceed immediately; otherwise they reserve the
+    next token and sleep only until it is due, so waiting callers are served in
+    arrival order. Any object exposing ``acquire()``, ``acquire_async()`` and
+    ``pause()`` can be passed to the extractors in place of this class.
+    """
+
+    _shared: Dict[str, "TokenBucketRateLimiter"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, rate: float = DEFAULT_REQUESTS_PER_SECOND, burst: int = DEFAULT_BURST):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            rate (float): Sustained requests per second
+            burst (int): Maximum number of requests allowed without waiting
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        # Total seconds queued reservations have been pushed back by pauses
+        self._shifted = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_key(cls, api_key: str, rate: float = DEFAULT_REQUESTS_PER_SECOND,
+                burst: int = DEFAULT_BURST) -> "TokenBucketRateLimiter":
+        """
+        Return the limiter shared by every extractor in this process that uses api_key.
+        
+        The rate and burst only apply when the shared limiter is first created.
+        """
+        with cls._shared_lock:
+            limiter = cls._shared.get(api_key)
+            if limiter is None:
+                limiter = cls._shared[api_key] = cls(rate, burst)
+            return limiter
+
+    def _reserve(self, tokens: int = 1) -> Tuple[float, float]:
+        """
+        Take tokens from the bucket, going into debt if necessary.
+        
+        Returns:
+            Tuple[float, float]: Monotonic time at which the caller may use the
+            reserved tokens, and the total pause shift at the time of reservation
+        """
+        with self._lock:
+            now = time.monotonic()
+            # While paused, tokens are handed out from the moment the pause ends
+            start = max(now, self._paused_until)
+            if start > self._updated:
+                self._tokens = min(self.burst, self._tokens + (start - self._updated) * self.rate)
+                self._updated = start
+            self._tokens -= tokens
+            due = start
+            if self._tokens < 0:
+                due += -self._tokens / self.rate
+            return due, self._shifted
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back every caller for the given number of seconds.
+        
+        Used when the server signals that the quota is exhausted. Callers already
+        waiting for a reserved token are pushed back by the pause as well, keeping
+        their spacing. Tokens keep accruing during the pause when nobody is
+        waiting, so a pause of at least burst/rate seconds lets callers resume
+        with a full burst; after a shorter one they resume at the rate.
+        """
+        with self._lock:
+            now = time.monotonic()
+            until = now + seconds
+            paused_from = max(now, self._paused_until)
+            if until <= paused_from:
+                return
+            if self._tokens < 0 and self._updated - self._tokens / self.rate > paused_from:
+                # Reservations are queued past the start of the pause: move the queue behind it
+                self._updated += until - paused_from
+                self._shifted += until - paused_from
+            self._paused_until = until
+
+    def acquire(self, tokens: int = 1) -> None:
+        """
+        Block until tokens are available.
+        """
+        due, shifted = self._reserve(tokens)
+        while True:
+            wait = due - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            # A pause set while sleeping pushes this caller back as well
+            with self._lock:
+                delay, shifted = self._shifted - shifted, self._shifted
+            if delay <= 0:
+                return
+            due += delay
+
+    async def acquire_async(self, tokens: int = 1) -> None:
+        """
+        Wait without blocking the event loop until tokens are available.
+        """
+        import asyncio
+        
+        due, shifted = self._reserve(tokens)
+        while True:
+            wait = due - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            with self._lock:
+                delay, shifted = self._shifted - shifted, self._shifted
+            if delay <= 0:
+                return
+            due += delay
+
+
+class ProcessSharedRateLimiter(TokenBucketRateLimiter):
+    """
+    Token bucket whose state lives in shared memory, so several processes draw from one budget.
+    
+    Create it in the parent process and hand it to worker processes when they
+    start (for example through a ProcessPoolExecutor initializer). The bucket
+    uses the system-wide monotonic clock, so every process sees the same time.
+    """
+
+    def __init__(self, rate: float = DEFAULT_REQUESTS_PER_SECOND, burst: int = DEFAULT_BURST, context=None):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            rate (float): Sustained requests per second across all processes
+            burst (int): Maximum number of requests allowed without waiting
+            context: multiprocessing context the worker processes are started
+                with (defaults to the default context)
+        """
+        import multiprocessing
+        
+        context = context or multiprocessing.get_context()
+        # tokens, updated, paused_until, shifted
+        self._shared_state = context.Array("d", 4)
+        super().__init__(rate, burst)
+        self._lock = self._shared_state.get_lock()
+
+    @property
+    def _tokens(self) -> float:
+        return self._shared_state[0]
+
+    @_tokens.setter
+    def _tokens(self, value: float) -> None:
+        self._shared_state[0] = value
+
+    @property
+    def _updated(self) -> float:
+        return self._shared_state[1]
+
+    @_updated.setter
+    def _updated(self, value: float) -> None:
+        self._shared_state[1] = value
+
+    @property
+    def _paused_until(self) -> float:
+        return self._shared_state[2]
+
+    @_paused_until.setter
+    def _paused_until(self, value: float) -> None:
+        self._shared_state[2] = value
+
+    @property
+    def _shifted(self) -> float:
+        return self._shared_state[3]
+
+    @_shifted.setter
+    def _shifted(self, value: float) -> None:
+        self._shared_state[3] = value
+
+
+class InFlightLimiter:
+    """
+    Thread-safe cap on the number of requests in flight at once.
+    
+    Use as a context manager around each request. Like the rate limiter, one
+    instance is shared by every extractor in the process that uses the same API
+    key, so the cap holds however many threads or extractors send requests.
+    """
+
+    _shared: Dict[str, "InFlightLimiter"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT):
+        """
+        Initialize the limiter.
+        
+        Args:
+            max_in_flight (int): Maximum number of concurrent requests
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._semaphore = threading.BoundedSemaphore(max_in_flight)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_key(cls, api_key: str, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT) -> "InFlightLimiter":
+        """
+        Return the limiter shared by every extractor in this process that uses api_key.
+        
+        The cap only applies when the shared limiter is first created.
+        """
+        with cls._shared_lock:
+            limiter = cls._shared.get(api_key)
+            if limiter is None:
+                limiter = cls._shared[api_key] = cls(max_in_flight)
+            return limiter
+
+    def __enter__(self) -> "InFlightLimiter":
+        self._semaphore.acquire()
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        with self._lock:
+            self.in_flight -= 1
+        self._semaphore.release()
+
+
+class ApiKeyPool:
+    """
+    Spread requests over several API keys, tracking the health of each.
+    
+    Every request goes to the least-loaded healthy key: the one with the fewest
+    requests in flight, then the most remaining quota (``X-RateLimit-Remaining``),
+    then the fewest requests sent. A key whose quota is exhausted or that was
+    answered with a 429 cools down for as long as the server asked and is skipped
+    until then. Each key draws from its own shared TokenBucketRateLimiter, so total
+    throughput grows with the number of keys.
+    """
+
+    def __init__(self, api_keys: Iterable[str], rate: float = DEFAULT_REQUESTS_PER_SECOND,
+                 burst: int = DEFAULT_BURST, default_cooldown: float = 5.0,
+                 limiters: Optional[Dict[str, TokenBucketRateLimiter]] = None):
+        """
+        Initialize the pool.
+        
+        Args:
+            api_keys (Iterable[str]): API keys to spread requests over (duplicates are dropped)
+            rate (float): Sustained requests per second allowed for each key
+            burst (int): Requests each key may send without waiting
+            default_cooldown (float): Seconds a key rests after a 429 that carries
+                no Retry-After or X-RateLimit-Reset header
+            limiters (Dict[str, TokenBucketRateLimiter], optional): Limiter to use for
+                each key, e.g. ProcessSharedRateLimiter instances shared by worker
+                processes. Keys without one use the limiter shared in this process.
+        """
+        self.api_keys = list(dict.fromkeys(key for key in api_keys if key))
+        if not self.api_keys:
+            raise ValueError("at least one API key is required")
+        self.default_cooldown = default_cooldown
+        limiters = limiters or {}
+        self._limiters = {
+            key: limiters.get(key) or TokenBucketRateLimiter.for_key(key, rate, burst) for key in self.api_keys
+        }
+        self._state = {
+            key: {"in_flight": 0, "requests": 0, "throttled": 0, "remaining": None, "available_at": 0.0}
+            for key in self.api_keys
+        }
+        self._lock = threading.Lock()
+
+    def _select(self) -> Tuple[Optional[str], float]:
+        """
+        Claim the least-loaded healthy key.
+        
+        Returns:
+            Tuple[Optional[str], float]: The claimed key, or None and the seconds
+            until the first key comes out of its cooldown
+        """
+        with self._lock:
+            now = time.monotonic()
+            healthy = [key for key in self.api_keys if self._state[key]["available_at"] <= now]
+            if not healthy:
+                return None, min(state["available_at"] for state in self._state.values()) - now
+
+            def load(key):
+                state = self._state[key]
+                remaining = state["remaining"]
+                return (state["in_flight"], -remaining if remaining is not None else float("-inf"),
+                        state["requests"])
+
+            key = min(healthy, key=load)
+            self._state[key]["in_flight"] += 1
+            self._state[key]["requests"] += 1
+            return key, 0.0
+
+    def acquire(self) -> str:
+        """
+        Block until a healthy key has a token, then return that key.
+        
+        Every call must be paired with release(key) once the response arrives.
+        """
+        while True:
+            key, wait = self._select()
+            if key is not None:
+                self._limiters[key].acquire()
+                return key
+            time.sleep(wait)
+
+    async def acquire_async(self) -> str:
+        """
+        Wait without blocking the event loop until a healthy key has a token, then return that key.
+        """
+        import asyncio
+        
+        while True:
+            key, wait = self._select()
+            if key is not None:
+                await self._limiters[key].acquire_async()
+                return key
+            await asyncio.sleep(wait)
+
+    def release(self, key: str) -> None:
+        """
+        Mark a request sent with key as finished.
+        """
+        with self._lock:
+            self._state[key]["in_flight"] -= 1
+
+    def update(self, key: str, headers, throttled: bool) -> Optional[float]:
+        """
+        Record the quota reported by a response and cool the key down if needed.
+        
+        Args:
+            key (str): Key the request was sent with
+            headers: Response headers
+            throttled (bool): Whether the response was a 429
+            
+        Returns:
+            Optional[float]: For a 429, seconds until any key is available again
+            (0 when another key can take the retry); otherwise the cooldown the
+            headers requested for this key, if any
+        """
+        delay = _server_requested_delay(headers, throttled)
+        if throttled and delay is None:
+            delay = self.default_cooldown
+        remaining = None
+        if headers is not None:
+            try:
+                remaining = int(str(headers.get("X-RateLimit-Remaining")).strip())
+            except ValueError:
+                pass
+
+        with self._lock:
+            now = time.monotonic()
+            state = self._state[key]
+            if remaining is not None:
+                state["remaining"] = remaining
+            if throttled:
+                state["throttled"] += 1
+            if delay:
+                state["available_at"] = max(state["available_at"], now + delay)
+                logger.info(f"API key ...{key[-4:]} cooling down for {delay:.1f}s")
+            if throttled:
+                return max(0.0, min(state["available_at"] for state in self._state.values()) - now)
+        return delay
+
+    @property
+    def stats(self) -> Dict[str, Dict]:
+        """
+        Per-key counters: requests, throttled, in_flight, remaining quota and cooldown seconds left.
+        """
+        with self._lock:
+            now = time.monotonic()
+            return {
+                key: {
+                    "requests": state["requests"],
+                    "throttled": state["throttled"],
+                    "in_flight": state["in_flight"],
+                    "remaining": state["remaining"],
+                    "cooldown": max(0.0, state["available_at"] - now),
+                }
+                for key, state in self._state.items()
+            }
+
+
+class LatencyHistogram:
+    """
+    Thread-safe per-endpoint histogram of request latencies.
+    
+    Latencies are counted in geometrically growing buckets (each 25% wider
+    than the last, from 1 ms to about two minutes), so memory stays constant
+    however many requests are recorded and percentiles are accurate to one
+    bucket.
+    """
+
+    BOUNDS = tuple(0.001 * 1.25 ** i for i in range(54))
+
+    def __init__(self):
+        self._counts: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        """
+        Count one request to endpoint that took the given number of seconds.
+        """
+        index = bisect_left(self.BOUNDS, seconds)
+        with self._lock:
+            counts = self._counts.get(endpoint)
+            if counts is None:
+                counts = self._counts[endpoint] = [0] * (len(self.BOUNDS) + 1)
+            counts[index] += 1
+
+    def count(self, endpoint: str) -> int:
+        """
+        Number of latencies recorded for endpoint.
+        """
+        with self._lock:
+            return sum(self._counts.get(endpoint, ()))
+
+    def percentile(self, endpoint: str, fraction: float, min_samples: int = 1) -> Optional[float]:
+        """
+        Latency below which the given fraction of requests to endpoint completed.
+        
+        Args:
+            endpoint (str): API endpoint
+            fraction (float): Percentile as a fraction, e.g. 0.95
+            min_samples (int): Samples needed before an estimate is returned
+            
+        Returns:
+            Optional[float]: Upper bound of the bucket holding the percentile in
+            seconds, or None with fewer than min_samples recorded
+        """
+        with self._lock:
+            counts = list(self._counts.get(endpoint, ()))
+        total = sum(counts)
+        if total == 0 or total < min_samples:
+            return None
+        rank = fraction * total
+        seen = 0
+        for index, count in enumerate(counts):
+            seen += count
+            if seen >= rank:
+                return self.BOUNDS[min(index, len(self.BOUNDS) - 1)]
+        return self.BOUNDS[-1]
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Request count and p50/p95/p99 latency in milliseconds for every endpoint.
+        """
+        with self._lock:
+            endpoints = list(self._counts)
+        return {
+            endpoint: {
+                "count": self.count(endpoint),
+                **{f"p{int(q * 100)}_ms": round(self.percentile(endpoint, q) * 1000, 1) for q in (0.5, 0.95, 0.99)}
+            }
+            for endpoint in endpoints
+        }
+
+
+class RetryBudget:
+    """
+    Retry allowance shared by every request of a run.
+    
+    Once the budget is spent, failing requests give up at once instead of
+    sleeping and retrying, so a run that is going badly cannot spend hours in
+    backoff. Share one instance between extractors (and threads) to cap a
+    whole batch.
+    """
+
+    def __init__(self, max_retries: Optional[int] = None, max_retry_time: Optional[float] = None):
+        """
+        Initialize the budget.
+        
+        Args:
+            max_retries (int, optional): Retries allowed in total (None for no limit)
+            max_retry_time (float, optional): Seconds of backoff allowed in total (None for no limit)
+        """
+        self.max_retries = max_retries
+        self.max_retry_time = max_retry_time
+        self.retries = 0
+        self.retry_time = 0.0
+        self.denied = 0
+        self._lock = threading.Lock()
+
+    def try_spend(self, delay: float) -> bool:
+        """
+        Claim one retry preceded by delay seconds of backoff.
+        
+        Returns:
+            bool: True if the retry fits in the budget and was recorded
+        """
+        with self._lock:
+            if ((self.max_retries is not None and self.retries >= self.max_retries)
+                    or (self.max_retry_time is not None and self.retry_time + delay > self.max_retry_time)):
+                self.denied += 1
+                return False
+            self.retries += 1
+            self.retry_time += delay
+            return True
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """
+        Retries taken, seconds of backoff spent and retries refused.
+        """
+        with self._lock:
+            return {"retries": self.retries, "retry_time": round(self.retry_time, 3), "denied": self.denied}
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request while the circuit breaker is open.
+    
+    Attributes:
+        retry_after (float): Seconds until the breaker lets a probe request through
+    """
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"LinkedIn API circuit is open; retry in {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker around the API transport.
+    
+    While closed, the outcome of the last ``window_size`` requests is kept. Once
+    at least ``minimum_calls`` are recorded and the share of failures reaches
+    ``failure_rate_threshold``, the circuit opens and every request fails fast
+    with CircuitOpenError. After ``recovery_timeout`` seconds it turns half-open
+    and lets ``half_open_max_calls`` probe requests through: if they all
+    succeed the circuit closes again, and any failure reopens it. Only the
+    outcomes of those probes decide; requests admitted before the circuit
+    opened, and anything recorded while it is open, are ignored.
+    
+    Only server errors (5xx), timeouts and connection errors count as failures;
+    any other response shows the API is up.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_rate_threshold: float = 0.5, minimum_calls: int = 20, window_size: int = 100,
+                 recovery_timeout: float = 30.0, half_open_max_calls: int = 3):
+        """
+        Initialize the breaker in the closed state.
+        
+        Args:
+            failure_rate_threshold (float): Share of failed requests (0-1] that opens the circuit
+            minimum_calls (int): Requests recorded before the failure rate is acted upon
+            window_size (int): Number of most recent requests the failure rate covers
+            recovery_timeout (float): Seconds the circuit stays open before probing
+            half_open_max_calls (int): Probe requests allowed, and needed to close, while half-open
+        """
+        if not 0 < failure_rate_threshold <= 1:
+            raise ValueError("failure_rate_threshold must be in (0, 1]")
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = max(1, minimum_calls)
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self.state = self.CLOSED
+        self.times_opened = 0
+        self.rejected = 0
+        self._outcomes = deque(maxlen=max(window_size, self.minimum_calls))
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> Optional[int]:
+        """
+        Claim permission to send one request.
+        
+        Returns:
+            int: A probe token if the request is a half-open probe, otherwise None.
+                Pass it to record_success, record_failure or release.
+            
+        Raises:
+            CircuitOpenError: While the circuit is open, or half-open with all probes in flight
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                remaining = self._opened_at + self.recovery_timeout - time.monotonic()
+                if remaining > 0:
+                    self.rejected += 1
+                    raise CircuitOpenError(remaining)
+                logger.info("Circuit half-open; probing the API")
+                self.state = self.HALF_OPEN
+                self._probes = self._probe_successes = 0
+            if self.state == self.HALF_OPEN:
+                if self._probes >= self.half_open_max_calls:
+                    self.rejected += 1
+                    raise CircuitOpenError(max(0.1, self.recovery_timeout / 10))
+                self._probes += 1
+                # Tied to this half-open period, so a probe outliving it is not counted in the next one
+                return self.times_opened
+            return None
+
+    def release(self, probe: Optional[int] = None) -> None:
+        """
+        Give back a request slot whose outcome will never be recorded.
+        
+        Call it when a request allowed by allow_request is cancelled or fails in
+        a way that says nothing about the API, so a half-open circuit does not
+        wait forever for probes that will never report.
+        
+        Args:
+            probe (int, optional): Token returned by allow_request
+        """
+        with self._lock:
+            if self._is_current_probe(probe) and self._probes > 0:
+                self._probes -= 1
+
+    def record_success(self, probe: Optional[int] = None) -> None:
+        """
+        Record a request the API answered.
+        
+        Args:
+            probe (int, optional): Token returned by allow_request
+        """
+        with self._lock:
+            if probe is not None:
+                if self._is_current_probe(probe):
+                    self._probe_successes += 1
+                    if self._probe_successes >= self.half_open_max_calls:
+                        logger.info("Circuit closed; the API is answering again")
+                        self.state = self.CLOSED
+                        self._outcomes.clear()
+            elif self.state == self.CLOSED:
+                self._outcomes.append(False)
+
+    def record_failure(self, probe: Optional[int] = None) -> None:
+        """
+        Record a server error, timeout or connection failure.
+        
+        Args:
+            probe (int, optional): Token returned by allow_request
+        """
+        with self._lock:
+            if probe is not None:
+                if self._is_current_probe(probe):
+                    self._open()
+                return
+            if self.state != self.CLOSED:
+                return
+            self._outcomes.append(True)
+            if len(self._outcomes) >= self.minimum_calls:
+                failure_rate = sum(self._outcomes) / len(self._outcomes)
+                if failure_rate >= self.failure_rate_threshold:
+                    self._open()
+
+    def _is_current_probe(self, probe: Optional[int]) -> bool:
+        # Called with the lock held
+        return probe is not None and self.state == self.HALF_OPEN and probe == self.times_opened
+
+    def _open(self) -> None:
+        # Called with the lock held
+        logger.warning(f"Circuit opened; failing requests fast for {self.recovery_timeout:.0f}s")
+        self.state = self.OPEN
+        self.times_opened += 1
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+
+    @property
+    def stats(self) -> Dict:
+        """
+        Current state, times opened and requests rejected while open.
+        """
+        with self._lock:
+            return {"state": self.state, "times_opened": self.times_opened, "rejected": self.rejected}
+
+
+class AuthenticationError(Exception):
+    """
+    Raised when the API rejects the credentials (401); retrying or moving on
+    to the next company cannot succeed, so batch runs stop.
+    """
+
+
+# Errors that must reach the caller of extract_decision_makers instead of being
+# logged and turned into an empty result
+_PROPAGATED_ERRORS = (CircuitOpenError, AuthenticationError)
+
+
+class _FailedPage(list):
+    """
+    Empty page returned by get_company_employees when the request failed.
+    
+    It equals [] for callers of get_company_employees, but the page iterators
+    tell it apart from a real empty page: they re-raise the error instead of
+    treating the page as the end of the scan.
+    """
+
+    def __init__(self, error: BaseException):
+        super().__init__()
+        self.error = error
+
+
+def _check_page(employees: List[Dict]) -> List[Dict]:
+    """
+    Return a fetched page, raising the fetch error if the page failed.
+    """
+    if isinstance(employees, _FailedPage):
+        raise employees.error
+    return employees
+
+# Statuses worth retrying: timeouts, throttling and server-side failures. Other
+# 4xx responses (bad request, forbidden, not found...) fail the same way again.
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def _error_status(error: BaseException) -> Optional[int]:
+    """
+    Return the HTTP status carried by a requests or aiohttp error, if any.
+    """
+    response = getattr(error, "response", None)
+    if response is not None:
+        return getattr(response, "status_code", None)
+    return getattr(error, "status", None)
+
+
+def is_retryable(error: BaseException, retryable_status_codes=RETRYABLE_STATUS_CODES) -> bool:
+    """
+    Classify an error raised while calling the API as transient or permanent.
+    
+    HTTP errors are retryable when their status is in retryable_status_codes.
+    Connection failures, dropped connections and timeouts are retryable; any
+    other error (invalid URL, too many redirects, an undecodable body...) is not.
+    
+    Args:
+        error (BaseException): Error raised by requests or aiohttp
+        retryable_status_codes: HTTP statuses worth retrying
+        
+    Returns:
+        bool: True if sending the same request again may succeed
+    """
+    status = _error_status(error)
+    if status is not None:
+        return status in retryable_status_codes
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                          requests.exceptions.ChunkedEncodingError)):
+        return True
+    # Look the async modules up without importing them: their errors only exist once they are loaded
+    aiohttp_module, asyncio_module = sys.modules.get("aiohttp"), sys.modules.get("asyncio")
+    if aiohttp_module is not None and isinstance(error, (aiohttp_module.ClientConnectionError,
+                                                         aiohttp_module.ClientPayloadError)):
+        return True
+    if asyncio_module is not None and isinstance(error, asyncio_module.TimeoutError):
+        return True
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+
+def _backoff_delay(strategy: str, base: float, attempt: int, previous: float, cap: float) -> float:
+    """
+    Compute the wait before a retry.
+    
+    Args:
+        strategy (str): One of BACKOFF_STRATEGIES
+        base (float): Base delay in seconds
+        attempt (int): Number of the upcoming attempt (1 for the first retry)
+        previous (float): Delay used before the previous attempt (decorrelated jitter only)
+        cap (float): Longest delay returned
+        
+    Returns:
+        float: Seconds to wait
+    """
+    if strategy == "exponential":
+        return min(cap, base * (2 ** attempt))
+    if strategy == "full_jitter":
+        # Anywhere between no wait and the exponential delay, so workers spread out
+        return random.uniform(0, min(cap, base * (2 ** attempt)))
+    if strategy == "decorrelated_jitter":
+        # Grows from the previous delay rather than the attempt number
+        return min(cap, random.uniform(base, max(base, previous) * 3))
+    raise ValueError(f"Unknown backoff strategy: {strategy}")
+
+
+def _parse_delay(value) -> Optional[float]:
+    """
+    Parse a header value holding either delta-seconds or an HTTP date.
+    
+    Returns:
+        Optional[float]: Seconds from now, or None if the value is not understood
+    """
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def _server_requested_delay(headers, throttled: bool) -> Optional[float]:
+    """
+    Work out how long the server asked us to back off, if at all.
+    
+    Honors ``Retry-After`` and the ``X-RateLimit-Remaining``/``X-RateLimit-Reset``
+    pair. ``X-RateLimit-Reset`` may be an epoch timestamp or a number of seconds.
+    
+    Args:
+        headers: Response headers (any case-insensitive mapping)
+        throttled (bool): True for a 429 response; otherwise a delay is only
+            returned when the headers report the quota as exhausted
+        
+    Returns:
+        Optional[float]: Seconds to wait, or None if the headers say nothing useful
+    """
+    if headers is None:
+        return None
+
+    if throttled:
+        delay = _parse_delay(headers.get("Retry-After"))
+        if delay is not None:
+            return delay
+    else:
+        try:
+            remaining = int(str(headers.get("X-RateLimit-Remaining")).strip())
+        except ValueError:
+            return None
+        if remaining > 0:
+            return None
+
+    try:
+        reset = float(str(headers.get("X-RateLimit-Reset")).strip())
+    except ValueError:
+        return None
+    if reset > 1e9:  # Epoch timestamp rather than a delay
+        reset -= time.time()
+    return max(0.0, reset)
+
+# Keywords matched anywhere in a job title (case-insensitive)
+DECISION_MAKER_KEYWORDS = (
+    "CEO", "Chief", "President", "Director", "VP", "Vice President",
+    "Head of", "Manager", "Founder", "Owner", "Partner", "Executive"
 )
 
-logger = logging.getLogger(__name__)
+# C-suite abbreviations, matched as whole words only ("COO" must not match "coordinator")
+DECISION_MAKER_ACRONYMS = ("CTO", "CFO", "COO", "CMO", "CIO", "CRO", "CPO", "CISO")
+
+# Distinct job titles memoized per TitleMatcher
+DEFAULT_TITLE_CACHE_SIZE = 65536
+
+
+class TitleMatcher:
+    """
+    Classify job titles against a keyword set with one precompiled regular expression.
+    
+    The keywords are folded into a single prefix-factored alternation, so each
+    title is scanned once instead of once per keyword. Build it once per keyword
+    set (see for_keywords) and reuse it.
+    
+    Job titles repeat heavily, so results are memoized in a bounded LRU cache
+    keyed by the exact title string. A matcher obtained from for_keywords is
+    shared process-wide, and so is its cache. Use cache_stats to tune cache_size.
+    """
+
+    def __init__(self, keywords: Iterable[str] = DECISION_MAKER_KEYWORDS,
+                 acronyms: Iterable[str] = DECISION_MAKER_ACRONYMS,
+                 cache_size: int = DEFAULT_TITLE_CACHE_SIZE):
+        """
+        Compile the matcher.
+        
+        Args:
+            keywords (Iterable[str]): Keywords matched anywhere in a title
+            acronyms (Iterable[str]): Keywords matched only as whole words
+            cache_size (int): Maximum number of distinct titles memoized (0 disables the cache)
+        """
+        self.keywords = tuple(keywords)
+        self.acronyms = tuple(acronyms)
+        self._canonical = {k.lower(): k for k in self.keywords + self.acronyms}
+        pattern = self._build_pattern(
+            [k.lower() for k in self.keywords], [k.lower() for k in self.acronyms]
+        )
+        self._search = re.compile(pattern).search if pattern else None
+        self.cache_size = cache_size
+        # functools.lru_cache is thread-safe and keeps hit/miss counters for us
+        self._match = lru_cache(maxsize=cache_size)(self._match_uncached) if cache_size else self._match_uncached
+
+    @staticmethod
+    def _build_pattern(keywords: List[str], acronyms: List[str]) -> str:
+        """
+        Build a regex matching any keyword, sharing common prefixes between alternatives.
+        
+        Python's regex engine tries every alternative at every position, so
+        factoring "ceo|chief|cto" into "c(?:eo|hief|to)" keeps the scan fast.
+        Spaces in keywords match any run of whitespace. Acronyms end with
+        look-arounds that require a word boundary on both sides.
+        """
+        trie = {}
+        for word, whole_word in [(k, False) for k in keywords] + [(a, True) for a in acronyms]:
+            node = trie
+            for ch in word:
+                node = node.setdefault(ch, {})
+            # None marks the end of a word; True if it must stand alone
+            node[None] = node.get(None, False) or whole_word
+
+        def build(node: Dict, depth: int) -> str:
+            # Continuations before the word end, so the longest keyword is reported
+            branches = [(r"\s+" if ch == " " else re.escape(ch)) + build(child, depth + 1)
+                        for ch, child in node.items() if ch is not None]
+            if None in node:
+                branches.append(rf"(?<!\w.{{{depth}}})(?!\w)" if node[None] else "")
+            if len(branches) == 1:
+                return branches[0]
+            return "(?:" + "|".join(branches) + ")"
+
+        return build(trie, 0) if trie else ""
+
+    @classmethod
+    @lru_cache(maxsize=32)
+    def for_keywords(cls, keywords: Tuple[str, ...] = DECISION_MAKER_KEYWORDS,
+                     acronyms: Tuple[str, ...] = DECISION_MAKER_ACRONYMS,
+                     cache_size: int = DEFAULT_TITLE_CACHE_SIZE) -> "TitleMatcher":
+        """
+        Return a shared matcher for a keyword set, compiling it only the first time.
+        """
+        return cls(keywords, acronyms, cache_size)
+
+    def _match_uncached(self, title: str) -> Optional[str]:
+        if self._search is None:
+            return None
+        found = self._search(title.lower())
+        if found is None:
+            return None
+        # Collapse whitespace so "head   of" maps back to "Head of"
+        return self._canonical[" ".join(found.group(0).split())]
+
+    def match(self, title: Optional[str]) -> Optional[str]:
+        """
+        Find the keyword that marks a title as a decision maker.
+        
+        Args:
+            title (str): Job title
+            
+        Returns:
+            Optional[str]: The first keyword found in the title, or None
+        """
+        return self._match(title) if title else None
+
+    def is_decision_maker(self, title: Optional[str]) -> bool:
+        """
+        Check whether a job title marks a decision maker.
+        """
+        if not title:
+            return False
+        if self.cache_size:
+            return self._match(title) is not None
+        # Without a cache, skip mapping the hit back to its keyword
+        return self._search is not None and self._search(title.lower()) is not None
+
+    @property
+    def cache_stats(self) -> Dict[str, float]:
+        """
+        Hit/miss counters of the title cache, for tuning cache_size.
+        """
+        if not self.cache_size:
+            return {"hits": 0, "misses": 0, "size": 0, "maxsize": 0, "hit_rate": 0.0}
+        info = self._match.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+            "hit_rate": info.hits / lookups if lookups else 0.0,
+        }
+
+    def clear_cache(self) -> None:
+        """
+        Drop all memoized titles and reset the counters.
+        """
+        if self.cache_size:
+            self._match.cache_clear()
+
+
+class CompanyIdCache:
+    """
+    Persistent SQLite cache of LinkedIn company URL to company ID lookups.
+    
+    URLs are normalized before use, so trailing slashes, query strings, scheme
+    and "www." do not produce separate entries. URLs the API could not resolve
+    are cached as well (negative entries), with their own, shorter TTL. The
+    cache is safe to share between threads.
+    """
+
+    def __init__(self, path: str = "company_id_cache.sqlite3", ttl: float = 30 * 24 * 3600,
+                 negative_ttl: float = 24 * 3600):
+        """
+        Open (or create) the cache.
+        
+        Args:
+            path (str): SQLite database file (":memory:" for a process-local cache)
+            ttl (float): Seconds a resolved company ID stays valid
+            negative_ttl (float): Seconds an unresolved URL stays cached
+        """
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS company_ids ("
+                "url TEXT PRIMARY KEY, company_id TEXT, resolved_at REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def normalize_url(company_url: str) -> str:
+        """
+        Normalize a company URL to a stable cache key.
+        
+        Args:
+            company_url (str): LinkedIn URL of the company
+            
+        Returns:
+            str: Key such as "linkedin.com/company/microsoft"
+        """
+        parts = urlsplit(company_url.strip() if "://" in company_url else f"https://{company_url.strip()}")
+        host = parts.netloc.lower()
+        if host.startswith("www."):
+            host = host[4:]
+        return f"{host}{parts.path.rstrip('/').lower()}"
+
+    def get(self, company_url: str) -> Tuple[bool, Optional[str]]:
+        """
+        Look up a company URL.
+        
+        Args:
+            company_url (str): LinkedIn URL of the company
+            
+        Returns:
+            Tuple[bool, Optional[str]]: (found, company_id). A found entry with a
+            None company_id is a cached "could not be resolved" result.
+        """
+        key = self.normalize_url(company_url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT company_id, resolved_at FROM company_ids WHERE url = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                company_id, resolved_at = row
+                ttl = self.ttl if company_id is not None else self.negative_ttl
+                if time.time() - resolved_at < ttl:
+                    if company_id is None:
+                        self.negative_hits += 1
+                    else:
+                        self.hits += 1
+                    return True, company_id
+            self.misses += 1
+            return False, None
+
+    def set(self, company_url: str, company_id: Optional[str]) -> None:
+        """
+        Store the result of resolving a company URL.
+        
+        Args:
+            company_url (str): LinkedIn URL of the company
+            company_id (str, optional): Resolved company ID, or None if it could not be resolved
+        """
+        key = self.normalize_url(company_url)
+        value = str(company_id) if company_id is not None else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO company_ids (url, company_id, resolved_at) VALUES (?, ?, ?)",
+                (key, value, time.time())
+            )
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Hit/miss counters since the cache was opened.
+        """
+        return {"hits": self.hits, "negative_hits": self.negative_hits, "misses": self.misses}
+
+    def close(self) -> None:
+        """
+        Close the underlying database connection.
+        """
+        with self._lock:
+            self._conn.close()
+
+
+class CheckpointStore:
+    """
+    Page-level checkpoints of employee scans, so an interrupted run can resume.
+    
+    Each company gets a "<company_id>.pages.jsonl" file holding one fetched page
+    per line, and a "<company_id>.json" file recording how many pages (and bytes
+    of the pages file) are complete. Pages are appended and synced first, then
+    the small metadata file is replaced atomically, and pages are only read up
+    to the recorded size. A crash at any point therefore leaves the last
+    consistent checkpoint in place. The store is safe to share between threads.
+    """
+
+    def __init__(self, directory: str = "checkpoints", fsync: bool = True):
+        """
+        Open (or create) the checkpoint directory.
+        
+        Args:
+            directory (str): Directory holding the checkpoint files
+            fsync (bool): Flush every write to disk before recording it as complete
+        """
+        self.directory = directory
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _paths(self, company_id: str) -> Tuple[str, str]:
+        name = re.sub(r"[^A-Za-z0-9_.-]+", "_", str(company_id))
+        return (os.path.join(self.directory, f"{name}.json"),
+                os.path.join(self.directory, f"{name}.pages.jsonl"))
+
+    def _read_meta(self, meta_path: str) -> Dict:
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"pages": 0, "size": 0, "complete": False}
+
+    def _write_meta(self, meta_path: str, meta: Dict) -> None:
+        tmp_path = f"{meta_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, meta_path)
+
+    def load(self, company_id: str) -> Tuple[List[List[Dict]], bool]:
+        """
+        Read the checkpoint of a company.
+        
+        Args:
+            company_id (str): LinkedIn company ID
+            
+        Returns:
+            Tuple[List[List[Dict]], bool]: (pages fetched so far, whether the scan finished)
+        """
+        meta_path, pages_path = self._paths(company_id)
+        with self._lock:
+            meta = self._read_meta(meta_path)
+            if not meta["pages"]:
+                return [], meta["complete"]
+            with open(pages_path, "rb") as f:
+                data = f.read(meta["size"])
+        pages = [json.loads(line) for line in data.splitlines()]
+        return pages, meta["complete"]
+
+    def append_page(self, company_id: str, page: int, employees: List[Dict]) -> None:
+        """
+        Record a fetched page.
+        
+        Args:
+            company_id (str): LinkedIn company ID
+            page (int): Page number, which must follow the last checkpointed page
+            employees (List[Dict]): Employee data of the page
+            
+        Raises:
+            ValueError: If page does not follow the last checkpointed page
+        """
+        meta_path, pages_path = self._paths(company_id)
+        line = (json.dumps(employees, separators=(",", ":")) + "\n").encode("utf-8")
+        with self._lock:
+            meta = self._read_meta(meta_path)
+            if page != meta["pages"] + 1:
+                raise ValueError(f"Checkpoint for company {company_id} has {meta['pages']} pages; cannot append page {page}")
+            with open(pages_path, "ab") as f:
+                # Drop anything a crashed write left after the last complete page
+                f.truncate(meta["size"])
+                f.write(line)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            self._write_meta(meta_path, {
+                "company_id": str(company_id), "pages": page, "size": meta["size"] + len(line),
+                "complete": False, "updated_at": time.time()
+            })
+
+    def mark_complete(self, company_id: str) -> None:
+        """
+        Record that every page of a company has been fetched.
+        
+        Args:
+            company_id (str): LinkedIn company ID
+        """
+        meta_path, _ = self._paths(company_id)
+        with self._lock:
+            meta = self._read_meta(meta_path)
+            meta.update(company_id=str(company_id), complete=True, updated_at=time.time())
+            self._write_meta(meta_path, meta)
+
+    def clear(self, company_id: Optional[str] = None) -> None:
+        """
+        Delete the checkpoint of one company, or of every company.
+        
+        Args:
+            company_id (str, optional): LinkedIn company ID (None clears the whole store)
+        """
+        with self._lock:
+            if company_id is not None:
+                paths = self._paths(company_id)
+            else:
+                paths = [os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                         if name.endswith((".json", ".pages.jsonl", ".json.tmp"))]
+            for path in paths:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+
+class SnapshotStore:
+    """
+    Persistent SQLite snapshots of each company's decision makers, for delta syncs.
+    
+    Every record is stored under a stable person key (its "id", or its name when
+    it has none) together with a hash of its content, so a new extraction can be
+    compared with the previous one to find added, removed and changed people.
+    The store is safe to share between threads.
+    """
+
+    CHANGE_FIELD = "change"
+
+    def __init__(self, path: str = "snapshots.sqlite3"):
+        """
+        Open (or create) the snapshot database.
+        
+        Args:
+            path (str): SQLite database file (":memory:" for a process-local store)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                "company TEXT NOT NULL, person TEXT NOT NULL, content_hash TEXT NOT NULL, record TEXT NOT NULL, "
+                "PRIMARY KEY (company, person))"
+            )
+
+    @staticmethod
+    def person_key(record: Dict) -> str:
+        """
+        Return the stable identifier of a person record.
+        """
+        if record.get("id") is not None:
+            return str(record["id"])
+        return f"{record.get('firstName', '')} {record.get('lastName', '')}".strip().lower()
+
+    @staticmethod
+    def content_hash(record: Dict) -> str:
+        """
+        Return a hash of a record that does not depend on key order.
+        """
+        data = json.dumps(record, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+    def load(self, company_url: str) -> Dict[str, Tuple[str, Dict]]:
+        """
+        Read the snapshot of a company.
+        
+        Args:
+            company_url (str): LinkedIn URL of the company
+            
+        Returns:
+            Dict[str, Tuple[str, Dict]]: Content hash and record per person key
+        """
+        key = CompanyIdCache.normalize_url(company_url)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT person, content_hash, record FROM snapshots WHERE company = ?", (key,)
+            ).fetchall()
+        return {person: (content_hash, json.loads(record)) for person, content_hash, record in rows}
+
+    def diff(self, company_url: str, records: Iterable[Dict]) -> List[Dict]:
+        """
+        Compare records with the stored snapshot of a company.
+        
+        Args:
+            company_url (str): LinkedIn URL of the company
+            records (Iterable[Dict]): Decision makers from the latest extraction
+            
+        Returns:
+            List[Dict]: Added and changed records, then the previous version of removed
+            records, each with a "change" field of "added", "changed" or "removed"
+        """
+        previous = self.load(company_url)
+        changes = []
+        seen = set()
+        for record in records:
+            person = self.person_key(record)
+            seen.add(person)
+            if person not in previous:
+                changes.append(dict(record, **{self.CHANGE_FIELD: "added"}))
+            elif previous[person][0] != self.content_hash(record):
+                changes.append(dict(record, **{self.CHANGE_FIELD: "changed"}))
+        for person, (_, record) in previous.items():
+            if person not in seen:
+                changes.append(dict(record, **{self.CHANGE_FIELD: "removed"}))
+        return changes
+
+    def save(self, company_url: str, records: Iterable[Dict]) -> None:
+        """
+        Replace the snapshot of a company.
+        
+        Args:
+            company_url (str): LinkedIn URL of the company
+            records (Iterable[Dict]): Decision makers from the latest extraction
+        """
+        key = CompanyIdCache.normalize_url(company_url)
+        rows = [(key, self.person_key(record), self.content_hash(record), json.dumps(record, default=str))
+                for record in records]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM snapshots WHERE company = ?", (key,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO snapshots (company, person, content_hash, record) VALUES (?, ?, ?, ?)", rows
+            )
+
+    def close(self) -> None:
+        """
+        Close the underlying database connection.
+        """
+        with self._lock:
+            self._conn.close()
+
+
+class ResponseCache:
+    """
+    Persistent SQLite cache of GET response bodies and their validators.
+    
+    Responses carrying an ETag or Last-Modified header are stored, so the next
+    request for the same URL and parameters can be sent as a conditional request.
+    A 304 Not Modified answer is then served from the cached body. The cache is
+    bounded by total body size, evicting the least recently used responses, and
+    is safe to share between threads.
+    """
+
+    def __init__(self, path: str = "response_cache.sqlite3", max_bytes: int = 256 * 1024 * 1024):
+        """
+        Open (or create) the cache.
+        
+        Args:
+            path (str): SQLite database file (":memory:" for a process-local cache)
+            max_bytes (int): Maximum total size of cached bodies
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB NOT NULL, "
+                "size INTEGER NOT NULL, last_used INTEGER NOT NULL)"
+            )
+        self._size, self._clock = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0), COALESCE(MAX(last_used), 0) FROM responses"
+        ).fetchone()
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict] = None) -> str:
+        """
+        Return the cache key of a GET request.
+        """
+        query = urlencode(sorted((k, str(v)) for k, v in (params or {}).items()))
+        return f"{url}?{query}" if query else url
+
+    def lookup(self, key: str) -> Tuple[Dict[str, str], Optional[bytes]]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key (str): Cache key from ResponseCache.key
+            
+        Returns:
+            Tuple[Dict[str, str], Optional[bytes]]: Conditional request headers and
+            the cached body, or ({}, None) if nothing is cached
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return {}, None
+        etag, last_modified, body = row
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers, bytes(body)
+
+    def hit(self, key: str, body: bytes) -> None:
+        """
+        Record that the server answered 304 and the cached body was served.
+        
+        Args:
+            key (str): Cache key from ResponseCache.key
+            body (bytes): Body returned by lookup
+        """
+        with self._lock, self._conn:
+            self.hits += 1
+            self.bytes_saved += len(body)
+            self._clock += 1
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (self._clock, key))
+
+    def store(self, key: str, headers, body: bytes) -> None:
+        """
+        Cache a response if it carries an ETag or Last-Modified validator.
+        
+        Args:
+            key (str): Cache key from ResponseCache.key
+            headers (Mapping): Response headers (looked up case-insensitively)
+            body (bytes): Response body
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not (etag or last_modified) or len(body) > self.max_bytes:
+            return
+        
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self._size -= row[0]
+            self._clock += 1
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, etag, last_modified, body, size, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, etag, last_modified, sqlite3.Binary(body), len(body), self._clock)
+            )
+            self._size += len(body)
+            self.stores += 1
+            
+            # Evict least recently used responses until the cache fits again
+            while self._size > self.max_bytes:
+                oldest, size = self._conn.execute(
+                    "SELECT key, size FROM responses ORDER BY last_used LIMIT 1"
+                ).fetchone()
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (oldest,))
+                self._size -= size
+                self.evictions += 1
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters since the cache was opened, plus the current cached size.
+        """
+        return {"hits": self.hits, "misses": self.misses, "stores": self.stores, "evictions": self.evictions,
+                "bytes_saved": self.bytes_saved, "size": self._size}
+
+    def close(self) -> None:
+        """
+        Close the underlying database connection.
+        """
+        with self._lock:
+            self._conn.close()
+
+
+class _RecordWriter:
+    """
+    Base class for writers that stream records to a file one at a time.
+    
+    Use as a context manager; the file is finalized on close().
+    """
+
+    def __init__(self, output_file: str):
+        self.output_file = output_file
+        self.count = 0
+        self._file = open(output_file, "w", newline="", encoding="utf-8")
+
+    def write(self, record: Dict) -> None:
+        raise NotImplementedError
+
+    def write_many(self, records: Iterable[Dict]) -> int:
+        """
+        Write every record from an iterable, consuming it lazily.
+        
+        Returns:
+            int: Number of records written by this call
+        """
+        before = self.count
+        for record in records:
+            self.write(record)
+        return self.count - before
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class CsvRecordWriter(_RecordWriter):
+    """
+    Stream records to CSV without materializing them.
+    
+    The header comes from ``fieldnames`` if given, otherwise from the union of
+    keys of the first ``sample_size`` records (in first-seen order), which are
+    buffered until the header is known. Keys first appearing later are dropped,
+    with one warning per key.
+    """
+
+    def __init__(self, output_file: str, fieldnames: Optional[List[str]] = None, sample_size: int = 100):
+        super().__init__(output_file)
+        self.fieldnames = list(fieldnames) if fieldnames else None
+        self.sample_size = max(1, sample_size)
+        self._pending = []
+        self._writer = None
+        # Only a sampled header loses keys by accident; declared fieldnames drop them on purpose
+        self._sampled = self.fieldnames is None
+        self._columns = set()
+        self._dropped = set()
+        if self.fieldnames:
+            self._start()
+
+    def _start(self) -> None:
+        if self.fieldnames is None:
+            self.fieldnames = list(dict.fromkeys(key for record in self._pending for key in record))
+        self._columns = set(self.fieldnames)
+        self._writer = csv.DictWriter(self._file, self.fieldnames, extrasaction="ignore", lineterminator="\n")
+        if self.fieldnames:
+            self._writer.writeheader()
+        self._writer.writerows(self._pending)
+        self._pending = []
+
+    def write(self, record: Dict) -> None:
+        self.count += 1
+        if self._writer is None:
+            self._pending.append(record)
+            if len(self._pending) >= self.sample_size:
+                self._start()
+            return
+        if self._sampled and not self._columns.issuperset(record):
+            for key in record.keys() - self._columns - self._dropped:
+                logger.warning(f"Column '{key}' first appeared after the {self.sample_size}-record header sample "
+                               f"of {self.output_file} and is dropped; pass fieldnames to keep it")
+                self._dropped.add(key)
+        self._writer.writerow(record)
+
+    def close(self) -> None:
+        if not self._file.closed and self._writer is None:
+            self._start()
+        super().close()
+
+
+class JsonRecordWriter(_RecordWriter):
+    """
+    Stream records into a JSON array, formatted like json.dump(records, indent=indent).
+    """
+
+    def __init__(self, output_file: str, indent: Optional[int] = 4):
+        super().__init__(output_file)
+        self.indent = indent
+        self._prefix = " " * indent if indent is not None else ""
+
+    def write(self, record: Dict) -> None:
+        self._file.write("[\n" if self.count == 0 else ",\n")
+        text = json.dumps(record, indent=self.indent)
+        if self._prefix:
+            text = "\n".join(self._prefix + line for line in text.split("\n"))
+        self._file.write(text)
+        self.count += 1
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.write("[]" if self.count == 0 else "\n]")
+        super().close()
+
+
+class JsonLinesRecordWriter(_RecordWriter):
+    """
+    Stream records as JSON Lines: one compact JSON object per line.
+    """
+
+    def write(self, record: Dict) -> None:
+        self._file.write(json.dumps(record))
+        self._file.write("\n")
+        self.count += 1
+
+
+class _BaseDecisionMakerExtractor:
+    """
+    Configuration and post-processing shared by the sync and async extractors.
+    """
+
+    def __init__(self, api_key: Optional[str], timeout: Optional[float] = 30.0, prefetch_window: int = 1,
+                 rate_limiter: Optional[TokenBucketRateLimiter] = None,
+                 company_id_cache: Optional[CompanyIdCache] = None,
+                 title_matcher: Optional[TitleMatcher] = None,
+                 checkpoint_store: Optional[CheckpointStore] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 key_pool: Optional[ApiKeyPool] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 connect_timeout: Optional[float] = None, read_timeout: Optional[float] = None):
+        """
+        Initialize the shared extractor settings.
+        
+        Args:
+            api_key (str): API key for LinkedIn API authentication. May be None
+                when key_pool is given, in which case the pool's first key is used.
+            timeout (float, optional): Total seconds one attempt may take, from
+                sending the request to reading the last byte of the body
+            prefetch_window (int, optional): Employee pages kept in flight by
+                get_all_company_employees (1 fetches pages serially)
+            rate_limiter (TokenBucketRateLimiter, optional): Limiter gating every
+                request. Defaults to the limiter shared by all extractors using api_key.
+            company_id_cache (CompanyIdCache, optional): Cache consulted before
+                resolving a company URL through the API
+            title_matcher (TitleMatcher, optional): Classifier for job titles.
+                Defaults to the shared matcher for the standard keywords.
+            checkpoint_store (CheckpointStore, optional): Store recording fetched
+                employee pages, so an interrupted scan resumes where it stopped
+            response_cache (ResponseCache, optional): Cache of GET responses used to
+                send conditional requests and serve 304 answers
+            key_pool (ApiKeyPool, optional): Keys to spread requests over. Each
+                request is sent with the least-loaded healthy key and gated by
+                that key's limiter instead of rate_limiter.
+            circuit_breaker (CircuitBreaker, optional): Breaker that fails requests
+                fast with CircuitOpenError while the API is down
+            connect_timeout (float, optional): Seconds allowed to establish a
+                connection. Defaults to timeout.
+            read_timeout (float, optional): Seconds allowed between two reads from
+                the socket. Defaults to timeout.
+        """
+        if api_key is None:
+            if key_pool is None:
+                raise ValueError("api_key or key_pool is required")
+            api_key = key_pool.api_keys[0]
+        self.api_key = api_key
+        self.base_url = "https://api.linkedin.com/v2"
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        self.retry_attempts = 3
+        self.retry_delay = 2  # seconds
+        self.backoff = "exponential"  # one of BACKOFF_STRATEGIES
+        self.max_backoff = 60  # seconds; longest wait between two attempts
+        self.request_deadline = None  # seconds a request may take including retries (None for no limit)
+        self.retry_budget = None  # RetryBudget shared by the run (None for no limit)
+        self.retryable_status_codes = RETRYABLE_STATUS_CODES  # other HTTP errors fail at once
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.latency_histogram = LatencyHistogram()
+        self.hedge_percentile = None  # e.g. 0.95: duplicate page requests slower than the endpoint's p95
+        self.hedge_min_samples = 20  # latencies recorded before hedging starts
+        self.hedged_requests = 0
+        self._hedge_lock = threading.Lock()
+        self.prefetch_window = max(1, prefetch_window)
+        self.rate_limiter = rate_limiter or TokenBucketRateLimiter.for_key(api_key)
+        self.max_retry_after = 300  # seconds; longer server-requested waits fail the request
+        self.company_id_cache = company_id_cache
+        self.title_matcher = title_matcher or TitleMatcher.for_keywords()
+        self.checkpoint_store = checkpoint_store
+        self.response_cache = response_cache
+        self.key_pool = key_pool
+        self.circuit_breaker = circuit_breaker
+        self.max_park_time = 3600  # seconds extract_many waits on an open circuit before skipping a company
+
+    def _load_checkpoint(self, company_id: str) -> Tuple[List[List[Dict]], bool]:
+        """
+        Return the checkpointed pages of a company and whether its scan finished.
+        """
+        if self.checkpoint_store is None:
+            return [], False
+        pages, complete = self.checkpoint_store.load(company_id)
+        if pages or complete:
+            logger.info(f"Resuming company ID {company_id} from checkpoint "
+                        f"({len(pages)} pages{', complete' if complete else ''})")
+        return pages, complete
+
+    def _discard_checkpoint(self, company_id: str) -> None:
+        """
+        Delete the checkpoint of a company whose results have been handed to the caller.
+        
+        Checkpoints only exist to resume interrupted scans; keeping finished ones
+        would replay stale pages on every later run.
+        """
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.clear(company_id)
+
+    def _apply_rate_limit_headers(self, headers, throttled: bool, key: Optional[str] = None) -> Optional[float]:
+        """
+        Pause the shared rate limiter for as long as the response headers ask.
+        
+        Args:
+            headers: Response headers
+            throttled (bool): Whether the response was a 429
+            key (str, optional): Pooled key the request was sent with; only that
+                key cools down, and other keys keep serving requests
+            
+        Returns:
+            Optional[float]: The server-requested delay in seconds, if any. For a
+            pooled 429 this is the wait until any key is available again.
+        """
+        if key is not None:
+            return self.key_pool.update(key, headers, throttled)
+        delay = _server_requested_delay(headers, throttled)
+        if delay:
+            logger.info(f"Server requested a {delay:.1f}s pause; holding back requests for this API key")
+            self.rate_limiter.pause(min(delay, self.max_retry_after))
+        return delay
+
+    def _record_outcome(self, failed: bool, probe: Optional[int] = None) -> None:
+        """
+        Report the outcome of one attempt to the circuit breaker, if any.
+        
+        Args:
+            failed (bool): Whether the attempt counts as a failure
+            probe (int, optional): Probe token the breaker gave the attempt
+        """
+        if self.circuit_breaker is not None:
+            if failed:
+                self.circuit_breaker.record_failure(probe)
+            else:
+                self.circuit_breaker.record_success(probe)
+
+    def _check_retryable(self, error: BaseException, url: str, params: Optional[Dict]) -> bool:
+        """
+        Decide whether a failed attempt is worth retrying.
+        
+        Raises:
+            AuthenticationError: If the API rejected the credentials (401)
+            
+        Returns:
+            bool: False for a permanent error, which the caller re-raises at once
+        """
+        status = _error_status(error)
+        if status == 401:
+            logger.error(f"Authentication failed (401) for URL {url}; the API key is invalid or revoked")
+            raise AuthenticationError(f"LinkedIn API rejected the API key (401) for URL {url}") from error
+        if is_retryable(error, self.retryable_status_codes):
+            return True
+        logger.error(f"Not retrying URL {url} with params {params}: {'HTTP ' + str(status) if status else repr(error)} "
+                     f"is a permanent error")
+        return False
+
+    def _count_hedged_request(self) -> None:
+        """
+        Count one hedged request; extract_many and prefetch threads hedge concurrently.
+        """
+        with self._hedge_lock:
+            self.hedged_requests += 1
+
+    def _time_left(self, started: float) -> Optional[float]:
+        """
+        Seconds left before the request deadline, or None if there is no deadline.
+        
+        Args:
+            started (float): time.monotonic() when the request was first sent
+        """
+        if self.request_deadline is None:
+            return None
+        return self.request_deadline - (time.monotonic() - started)
+
+    def _next_retry_delay(self, attempt: int, server_delay: Optional[float], previous_delay: float,
+                          started: float, url: str) -> Optional[float]:
+        """
+        Decide whether a failed request may be retried and how long to back off first.
+        
+        Args:
+            attempt (int): Number of the upcoming attempt (1 for the first retry)
+            server_delay (float, optional): Wait requested by the server, already
+                enforced by the rate limiter
+            previous_delay (float): Backoff used before the attempt that failed
+            started (float): time.monotonic() when the request was first sent
+            url (str): Requested URL, for logging
+            
+        Returns:
+            Optional[float]: Seconds until the retry, or None if the request
+            deadline or the retry budget does not allow another attempt
+        """
+        if server_delay is not None:
+            delay = server_delay
+        else:
+            delay = _backoff_delay(self.backoff, self.retry_delay, attempt, previous_delay, self.max_backoff)
+        if self.request_deadline is not None and time.monotonic() - started + delay > self.request_deadline:
+            logger.error(f"Retrying would exceed the {self.request_deadline}s request deadline; giving up on URL {url}")
+            return None
+        if self.retry_budget is not None and not self.retry_budget.try_spend(delay):
+            logger.error(f"Retry budget exhausted ({self.retry_budget.stats}); giving up on URL {url}")
+            return None
+        return delay
+
+    def filter_decision_makers(self, employees: List[Dict]) -> List[Dict]:
+        """
+        Filter employees to identify decision makers based on job titles.
+        
+        Args:
+            employees (List[Dict]): List of employee data
+            
+        Returns:
+            List[Dict]: List of decision makers
+        """
+        logger.info(f"Filtering decision makers from {len(employees)} employees")
+        decision_makers = list(self.iter_filter_decision_makers(employees))
+        logger.info(f"Found {len(decision_makers)} decision makers")
+        return decision_makers
+
+    def iter_filter_decision_makers(self, employees: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Lazily yield the decision makers among employees.
+        
+        Args:
+            employees (Iterable[Dict]): Employee data, e.g. from iter_company_employees
+            
+        Yields:
+            Dict: Employees whose job title marks them as decision makers
+        """
+        is_decision_maker = self.title_matcher.is_decision_maker
+        for employee in employees:
+            if is_decision_maker(employee.get("title")):
+                yield employee
+
+    def save_to_csv(self, decision_makers: Iterable[Dict], output_file: str,
+                    fieldnames: Optional[List[str]] = None) -> int:
+        """
+        Save decision makers to a CSV file, writing rows as they arrive.
+        
+        Args:
+            decision_makers (Iterable[Dict]): Decision makers, e.g. a list or iter_decision_makers()
+            output_file (str): Path to output CSV file
+            fieldnames (List[str], optional): Column order; inferred from the first records if omitted
+            
+        Returns:
+            int: Number of decision makers written
+        """
+        return self._save(CsvRecordWriter(output_file, fieldnames), decision_makers, "CSV")
+
+    def save_to_json(self, decision_makers: Iterable[Dict], output_file: str) -> int:
+        """
+        Save decision makers to a JSON file, writing records as they arrive.
+        
+        Args:
+            decision_makers (Iterable[Dict]): Decision makers, e.g. a list or iter_decision_makers()
+            output_file (str): Path to output JSON file
+            
+        Returns:
+            int: Number of decision makers written
+        """
+        return self._save(JsonRecordWriter(output_file), decision_makers, "JSON")
+
+    def save_to_jsonl(self, decision_makers: Iterable[Dict], output_file: str) -> int:
+        """
+        Save decision makers to a JSON Lines file, one record per line.
+        
+        Args:
+            decision_makers (Iterable[Dict]): Decision makers, e.g. a list or iter_decision_makers()
+            output_file (str): Path to output JSONL file
+            
+        Returns:
+            int: Number of decision makers written
+        """
+        return self._save(JsonLinesRecordWriter(output_file), decision_makers, "JSONL")
+
+    def _save(self, writer: _RecordWriter, decision_makers: Iterable[Dict], label: str) -> int:
+        logger.info(f"Saving decision makers to {writer.output_file}")
+        try:
+            with writer:
+                count = writer.write_many(decision_makers)
+            logger.info(f"Successfully saved {count} decision makers to {writer.output_file}")
+            return count
+        except Exception as e:
+            logger.error(f"Error saving to {label}: {e}")
+            raise
+
+
+class LinkedInDecisionMakerExtractor(_BaseDecisionMakerExtractor):
+    def __init__(self, api_key: Optional[str] = None, pool_connections: int = 10, pool_maxsize: Optional[int] = None,
+                 keep_alive: bool = True, timeout: Optional[float] = 30.0,
+                 session: Optional[requests.Session] = None, prefetch_window: int = 1,
+                 rate_limiter: Optional[TokenBucketRateLimiter] = None,
+                 company_id_cache: Optional[CompanyIdCache] = None,
+                 title_matcher: Optional[TitleMatcher] = None,
+                 checkpoint_store: Optional[CheckpointStore] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 in_flight_limiter: Optional[InFlightLimiter] = None,
+                 key_pool: Optional[ApiKeyPool] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 connect_timeout: Optional[float] = None, read_timeout: Optional[float] = None):
+        """
+        Initialize the LinkedIn Decision Maker Extractor.
+        
+        Args:
+            api_key (str): API key for LinkedIn API authentication
+            pool_connections (int, optional): Number of host connection pools to cache
+            pool_maxsize (int, optional): Maximum number of connections kept per host.
+                Defaults to the in-flight cap, so every request it allows has a connection.
+            keep_alive (bool, optional): Reuse connections between requests
+            timeout (float, optional): Total seconds one attempt may take, body included
+            session (requests.Session, optional): Pre-configured session to use instead
+                of building one. The caller keeps ownership and must close it.
+            prefetch_window (int, optional): Employee pages kept in flight by
+                get_all_company_employees (1 fetches pages serially)
+            rate_limiter (TokenBucketRateLimiter, optional): Limiter gating every
+                request. Defaults to the limiter shared by all extractors using api_key.
+            company_id_cache (CompanyIdCache, optional): Cache consulted before
+                resolving a company URL through the API
+            title_matcher (TitleMatcher, optional): Classifier for job titles
+            checkpoint_store (CheckpointStore, optional): Store recording fetched
+                employee pages, so an interrupted scan resumes where it stopped
+            response_cache (ResponseCache, optional): Cache of GET responses used to
+                send conditional requests and serve 304 answers
+            in_flight_limiter (InFlightLimiter, optional): Cap on concurrent requests.
+                Defaults to the cap shared by all extractors using api_key.
+            key_pool (ApiKeyPool, optional): Keys to spread requests over; api_key
+                may then be omitted
+            circuit_breaker (CircuitBreaker, optional): Breaker that fails requests
+                fast while the API is down; extract_many parks companies meanwhile
+            connect_timeout (float, optional): Seconds allowed to establish a connection
+            read_timeout (float, optional): Seconds allowed between two reads from the socket
+        """
+        super().__init__(api_key, timeout, prefetch_window, rate_limiter, company_id_cache, title_matcher,
+                         checkpoint_store, response_cache, key_pool, circuit_breaker, connect_timeout, read_timeout)
+        self.in_flight_limiter = in_flight_limiter or InFlightLimiter.for_key(self.api_key)
+        self._owns_session = session is None
+        if pool_maxsize is None:
+            pool_maxsize = self.in_flight_limiter.max_in_flight
+        # Keep enough pooled connections for every page that may be in flight
+        self.pool_maxsize = max(pool_maxsize, self.prefetch_window)
+        self.session = session or self._build_session(pool_connections, self.pool_maxsize, keep_alive)
+        self._hedge_executor = None
+        logger.info("LinkedIn Decision Maker Extractor initialized")
+
+    @staticmethod
+    def _build_session(pool_connections: int, pool_maxsize: int, keep_alive: bool) -> requests.Session:
+        """
+        Build a pooled HTTP session shared by every request of this extractor.
+        
+        Args:
+            pool_connections (int): Number of host connection pools to cache
+            pool_maxsize (int): Maximum number of connections kept per host
+            keep_alive (bool): Reuse connections between requests
+            
+        Returns:
+            requests.Session: Configured session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and release pooled connections.
+        """
+        if self._owns_session:
+            self.session.close()
+        with self._hedge_lock:
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            # Losing hedged requests may still be running; do not wait for them
+            executor.shutdown(wait=False)
+
+    def __enter__(self) -> "LinkedInDecisionMakerExtractor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _requests_timeout(self, time_left: Optional[float] = None):
+        """
+        Timeout argument for requests: one value, or a (connect, read) pair when either is set.
+        
+        Args:
+            time_left (float, optional): Seconds left before the request deadline;
+                caps both timeouts so one attempt cannot overrun it
+        """
+        timeouts = [self.connect_timeout if self.connect_timeout is not None else self.timeout,
+                    self.read_timeout if self.read_timeout is not None else self.timeout]
+        if time_left is not None:
+            timeouts = [time_left if value is None else min(value, time_left) for value in timeouts]
+        if self.connect_timeout is None and self.read_timeout is None:
+            return timeouts[0]
+        return tuple(timeouts)
+
+    def _read_body(self, response: requests.Response, sent_at: float, total: float) -> None:
+        """
+        Download a streamed response body, failing once the total timeout is exceeded.
+        
+        requests only bounds the connect and each socket read, so a server that
+        trickles bytes could otherwise hold a worker indefinitely. A watchdog
+        timer shuts the connection down at the deadline, which ends a read
+        blocked in the middle of a chunk. A body that was read completely is
+        kept even if the deadline passed meanwhile.
+        
+        Args:
+            response (requests.Response): Response sent with stream=True
+            sent_at (float): time.monotonic() when the request was sent
+            total (float): Seconds the whole attempt may take
+        
+        Raises:
+            requests.exceptions.ReadTimeout: If the body is not complete within total seconds
+        """
+        import socket
+        expired = threading.Event()
+        
+        def expire() -> None:
+            expired.set()
+            sock = getattr(getattr(response.raw, "connection", None), "sock", None)
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass  # Already closed
+        
+        watchdog = threading.Timer(max(0.0, sent_at + total - time.monotonic()), expire)
+        watchdog.daemon = True
+        watchdog.start()
+        chunks = []
+        try:
+            for chunk in response.iter_content(chunk_size=65536):
+                chunks.append(chunk)
+        except requests.exceptions.RequestException:
+            if not expired.is_set():
+                raise
+            response.close()
+            raise requests.exceptions.ReadTimeout(f"Response not complete within {total:.1f}s") from None
+        finally:
+            watchdog.cancel()
+        # Hand the body to response.content/json() as if it had not been streamed
+        response._content = b"".join(chunks)
+        response._content_consumed = True
+
+    def _request_hedged(self, endpoint: str, params: Dict) -> Dict:
+        """
+        Make a GET request, sending a duplicate if the first one is unusually slow.
+        
+        Once hedge_min_samples latencies are recorded for the endpoint, a request
+        still outstanding after the endpoint's hedge_percentile latency is sent a
+        second time and whichever answer arrives first is used. This cuts the
+        tail latency caused by a stuck connection or a slow backend at the cost
+        of a few extra requests.
+        """
+        threshold = None
+        if self.hedge_percentile is not None:
+            threshold = self.latency_histogram.percentile(endpoint, self.hedge_percentile, self.hedge_min_samples)
+        if threshold is None:
+            return self._make_request(endpoint, params)
+        
+        with self._hedge_lock:
+            # Created on first use, once, however many threads hedge at the same time
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(max_workers=2 * self.pool_maxsize)
+            executor = self._hedge_executor
+        primary = executor.submit(self._make_request, endpoint, params)
+        done, _ = wait([primary], timeout=threshold)
+        if done:
+            return primary.result()
+        
+        logger.info(f"{endpoint} request {params} slower than p{self.hedge_percentile * 100:g} "
+                    f"({threshold * 1000:.0f} ms); sending a hedged request")
+        self._count_hedged_request()
+        pending = {primary, executor.submit(self._make_request, endpoint, params)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+        # Both attempts failed; report the original one
+        return primary.result()
+
+    def _make_request(self, endpoint: str, params: Dict = None, method: str = "GET") -> Dict:
+        """
+        Make a request to the LinkedIn API with retry logic and rate limiting.
+        
+        Args:
+            endpoint (str): API endpoint to call
+            params (Dict, optional): Query parameters for the request
+            method (str, optional): HTTP method (GET, POST, etc.)
+            
+        Returns:
+            Dict: JSON response from the API
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails after retries
+        """
+        url = f"{self.base_url}/{endpoint}"
+        server_delay = None
+        started = time.monotonic()
+        delay = 0.0
+        
+        # Revalidate a cached copy instead of downloading the body again
+        cache_key = cached_body = None
+        request_headers = self.headers
+        if self.response_cache is not None and method.upper() == "GET":
+            cache_key = ResponseCache.key(url, params)
+            conditional_headers, cached_body = self.response_cache.lookup(cache_key)
+            request_headers = dict(self.headers, **conditional_headers)
+        
+        for attempt in range(self.retry_attempts):
+            claimed = False
+            probe = None
+            try:
+                if attempt > 0 and server_delay is not None:
+                    # The shared limiter is already paused for the server-requested window
+                    logger.info(f"Retrying after server-requested {server_delay:.1f} seconds (attempt {attempt+1}/{self.retry_attempts})")
+                elif attempt > 0:
+                    logger.info(f"Retrying in {delay:.2f} seconds (attempt {attempt+1}/{self.retry_attempts})")
+                    time.sleep(delay)
+                server_delay = None
+                key = None
+                headers = request_headers
+                
+                # Fail fast while the API is known to be down
+                if self.circuit_breaker is not None:
+                    probe = self.circuit_breaker.allow_request()
+                    claimed = True
+                
+                # Wait for a token from the limiter shared by this API key, or by the least-loaded pooled key
+                if self.key_pool is not None:
+                    key = self.key_pool.acquire()
+                    headers = dict(request_headers, Authorization=f"Bearer {key}")
+                else:
+                    self.rate_limiter.acquire()
+                try:
+                    # An attempt may not run past the request deadline
+                    time_left = self._time_left(started)
+                    if time_left is not None and time_left <= 0:
+                        raise requests.exceptions.Timeout(f"Request deadline of {self.request_deadline}s passed")
+                    timeout = self._requests_timeout(time_left)
+                    limits = [limit for limit in (self.timeout, time_left) if limit is not None]
+                    total = min(limits) if limits else None
+                    with self.in_flight_limiter:
+                        sent_at = time.monotonic()
+                        # Stream the body so that the total timeout can be enforced while reading it
+                        stream = total is not None
+                        if method.upper() == "GET":
+                            response = self.session.get(url, headers=headers, params=params,
+                                                        timeout=timeout, stream=stream)
+                        elif method.upper() == "POST":
+                            response = self.session.post(url, headers=headers, json=params,
+                                                         timeout=timeout, stream=stream)
+                        else:
+                            raise ValueError(f"Unsupported HTTP method: {method}")
+                        if stream:
+                            self._read_body(response, sent_at, total)
+                finally:
+                    if key is not None:
+                        self.key_pool.release(key)
+                
+                response.raise_for_status()  # This will raise HTTPError for 4xx/5xx
+                self.latency_histogram.record(endpoint, time.monotonic() - sent_at)
+                # Decode first: an unreadable body is the attempt's one outcome, not a failure after a success
+                if cache_key is not None and response.status_code == 304 and cached_body is not None:
+                    result = json.loads(cached_body)
+                    self.response_cache.hit(cache_key, cached_body)
+                else:
+                    result = response.json()
+                    if cache_key is not None:
+                        self.response_cache.store(cache_key, response.headers, response.content)
+                self._record_outcome(failed=False, probe=probe)
+                claimed = False
+                self._apply_rate_limit_headers(response.headers, throttled=False, key=key)
+                return result
+            
+            except requests.exceptions.HTTPError as e_http:
+                # Log the response text for more details, especially for 429
+                response_text = ""
+                try:
+                    response_text = e_http.response.text
+                except AttributeError:
+                    pass # No response text available
+
+                self._record_outcome(failed=e_http.response.status_code >= 500, probe=probe)
+                if not self._check_retryable(e_http, url, params):
+                    raise
+                if e_http.response.status_code == 429:
+                    server_delay = self._apply_rate_limit_headers(getattr(e_http.response, "headers", None), throttled=True,
+                                                                  key=key)
+                    logger.warning(
+                        f"Rate limit hit (429). URL: {url}. Params: {params}. Response: {_truncate(response_text)}. "
+                        f"Retrying as per policy (attempt {attempt + 1}/{self.retry_attempts})."
+                    )
+                else:
+                    logger.warning(
+                        f"HTTP error {e_http.response.status_code}. URL: {url}. Params: {params}. Response: {_truncate(response_text)}. "
+                        f"Retrying (attempt {attempt + 1}/{self.retry_attempts})."
+                    )
+                
+                if attempt == self.retry_attempts - 1:
+                    logger.error(f"Failed after {self.retry_attempts} attempts for URL {url} with params {params} due to HTTPError: {e_http}")
+                    raise
+                if server_delay is not None and server_delay > self.max_retry_after:
+                    logger.error(f"Server asked to wait {server_delay:.0f}s (limit {self.max_retry_after}s); giving up on URL {url}")
+                    raise
+                delay = self._next_retry_delay(attempt + 1, server_delay, delay, started, url)
+                if delay is None:
+                    raise
+            except requests.exceptions.RequestException as e_req:  # For non-HTTP errors like connection errors, timeouts
+                self._record_outcome(failed=True, probe=probe)
+                if not self._check_retryable(e_req, url, params):
+                    raise
+                logger.warning(
+                    f"Request exception for URL: {url}. Params: {params}. Error: {e_req}. "
+                    f"Retrying (attempt {attempt + 1}/{self.retry_attempts})."
+                )
+                if attempt == self.retry_attempts - 1:
+                    logger.error(f"Failed after {self.retry_attempts} attempts for URL {url} with params {params} due to RequestException: {e_req}")
+                    raise
+                delay = self._next_retry_delay(attempt + 1, None, delay, started, url)
+                if delay is None:
+                    raise
+            except BaseException:
+                # Neither answered nor failed at the transport: the breaker learns nothing from it
+                if claimed:
+                    self.circuit_breaker.release(probe)
+                raise
+        
+        # This should not be reached due to the raise in the loop
+        raise RuntimeError("Request failed after retries")
+
+    def get_company_data(self, company_url: str) -> Dict:
+        """
+        Fetch company data from LinkedIn API.
+        
+        Args:
+            company_url (str): LinkedIn URL of the company
+            
+        Returns:
+            Dict: Company data
+        """
+        logger.info(f"Fetching company data for {company_url}")
+        endpoint = "company"
+        params = {"link": company_url}
+        
+        try:
+            return self._make_request(endpoint, params)
+        except Exception as e:
+            logger.error(f"Error fetching company data: {e}")
+            raise
+
+    def resolve_company_id(self, company_url: str) -> Optional[str]:
+        """
+        Resolve a company URL to its LinkedIn company ID, using the cache when configured.
+        
+        Args:
+            company_url (str): LinkedIn URL of the company
+            
+        Returns:
+            Optional[str]: Company ID, or None if the API does not know the company
+        """
+        if self.company_id_cache is not None:
+            found, company_id = self.company_id_cache.get(company_url)
+            if found:
+                return company_id
+        
+        try:
+            company_id = self.get_company_data(company_url).get("id")
+        except requests.exceptions.HTTPError as e:
+            if self.company_id_cache is not None and e.response is not None and e.response.status_code == 404:
+                self.company_id_cache.set(company_url, None)
+            raise
+        
+        if self.company_id_cache is not None:
+            self.company_id_cache.set(company_url, company_id)
+        return company_id
+
+    def get_company_employees(self, company_id: str, page: int = 1, page_size: int = 100) -> List[Dict]:
+        """
+        Fetch employees of a company from LinkedIn API.
+        
+        Args:
+            company_id (str): LinkedIn company ID
+            page (int, optional): Page number for pagination
+            page_size (int, optional): Number of results per page
+            
+        Returns:
+            List[Dict]: List of employee data; empty if the request failed
+        """
+        logger.info(f"Fetching employees for company ID {company_id} (page {page})")
+        endpoint = "company_employee"
+        params = {
+            "companyId": company_id,
+            "page": page,
+            "pageSize": page_size
+        }
+        
+        try:
+            response = self._request_hedged(endpoint, params)
+            return response.get("results", [])
+        except _PROPAGATED_ERRORS:
+            raise
+        except Exception as e:
+            logger.error(f"Error fetching company employees: {e}")
+            return _FailedPage(e)
+
+    def get_all_company_employees(self, company_id: str, prefetch_window: Optional[int] = None) -> List[Dict]:
+        """
+        Fetch all employees of a company using pagination.
+        
+        Args:
+            company_id (str): LinkedIn company ID
+            prefetch_window (int, optional): Number of pages kept in flight at once.
+                Defaults to the extractor's prefetch_window; 1 fetches pages serially.
+            
+        Returns:
+            List[Dict]: List of all employee data, in page order
+        """
+        logger.info(f"Fetching all employees for company ID {company_id}")
+        all_employees = []
+        for employees in self.iter_company_employee_pages(company_id, prefetch_window):
+            all_employees.extend(employees)
+            logger.info(f"Fetched {len(employees)} employees (total: {len(all_employees)})")
+        
+        return all_employees
+
+    def iter_company_employees(self, company_id: str, prefetch_window: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Yield employees of a company one at a time, fetching pages as they are consumed.
+        
+        Args:
+            company_id (str): LinkedIn company ID
+            prefetch_window (int, optional): Number of pages kept in flight at once
+            
+        Yields:
+            Dict: Employee data, in page order
+        """
+        for employees in self.iter_company_employee_pages(company_id, prefetch_window):
+            yield from employees
+
+    def iter_company_employee_pages(self, company_id: str, prefetch_window: Optional[int] = None) -> Iterator[List[Dict]]:
+        """
+        Yield pages of employees until the first empty or short page.
+        
+        Args:
+            company_id (str): LinkedIn company ID
+            prefetch_window (int, optional): Number of pages kept in flight at once.
+                Defaults to the extractor's prefetch_window; 1 fetches pages serially.
+            
+        Yields:
+            List[Dict]: One page of employee data, in page order
+            
+        Raises:
+            Exception: The error of a page that could not be fetched. The scan
+                is not recorded as complete, so a rerun resumes at that page.
+        """
+        prefetch_window = prefetch_window or self.prefetch_window
+        checkpointed, complete = self._load_checkpoint(company_id)
+        yield from checkpointed
+        if complete:
+            return
+        
+        start_page = len(checkpointed) + 1
+        if prefetch_window > 1:
+            pages = self._iter_company_employee_pages_prefetched(company_id, prefetch_window, start_page)
+        else:
+            pages = self._iter_company_employee_pages_serial(company_id, start_page)
+        
+        if self.checkpoint_store is None:
+            yield from pages
+            return
+        
+        # Record each page before handing it on, and the end of the scan only once it is reached
+        for page, employees in enumerate(pages, start_page):
+            self.checkpoint_store.append_page(company_id, page, employees)
+            yield employees
+        self.checkpoint_store.mark_complete(company_id)
+
+    def _iter_company_employee_pages_serial(self, company_id: str, start_page: int = 1) -> Iterator[List[Dict]]:
+        """
+        Yield pages of employees one request at a time.
+        
+        Args:
+            company_id (str): LinkedIn company ID
+            start_page (int, optional): First page to fetch
+            
+        Yields:
+            List[Dict]: One page of employee data, in page order
+        """
+        page = start_page
+        page_size = 100
+        
+        while True:
+            employees = _check_page(self.get_company_employees(company_id, page, page_size))
+            if not employees:
+                break
+                
+            yield employees
+            
+            if len(employees) < page_size:
+                break
+                
+            page += 1
+
+    def _iter_company_employee_pages_prefetched(self, company_id: str, prefetch_window: int,
+                                                start_page: int = 1) -> Iterator[List[Dict]]:
+        """
+        Yield pages of employees while keeping up to prefetch_window page requests in flight.
+        
+        Pages are yielded in order; the first empty or short page ends the scan and
+        any pages requested beyond it are discarded.
+        
+        Args:
+            company_id (str): LinkedIn company ID
+            prefetch_window (int): Number of pages kept in flight at once
+            start_page (int, optional): First page to fetch
+            
+        Yields:
+            List[Dict]: One page of employee data, in page order
+        """
+        logger.info(f"Fetching employee pages for company ID {company_id} ({prefetch_window} pages in flight)")
+        page_size = 100
+        
+        with ThreadPoolExecutor(max_workers=prefetch_window) as executor:
+            pending = {}
+            next_page = start_page
+            for next_page in range(start_page, start_page + prefetch_window):
+                pending[next_page] = executor.submit(self.get_company_employees, company_id, next_page, page_size)
+
+            page = start_page
+            try:
+                while True:
+                    employees = _check_page(pending.pop(page).result())
+                    if not employees:
+                        break
+
+                    # Refill the window before handing the page to the consumer
+                    if len(employees) == page_size:
+                        next_page += 1
+                        pending[next_page] = executor.submit(self.get_company_employees, company_id, next_page, page_size)
+
+                    yield employees
+
+                    if len(employees) < page_size:
+                        break
+
+                    page += 1
+            finally:
+                for future in pending.values():
+                    future.cancel()
+
+    def iter_decision_makers(self, company_url: str) -> Iterator[Dict]:
+        """
+        Yield decision makers of a company page by page, without holding every employee in memory.
+        
+        Args:
+            company_url (str): LinkedIn URL of the company
+            
+        Yields:
+            Dict: Decision maker data, in page order
+        """
+        logger.info(f"Streaming decision makers for {company_url}")
+        try:
+            company_id = self.resolve_company_id(company_url)
+        except _PROPAGATED_ERRORS:
+            raise
+        except Exception as e:
+            logger.error(f"Error extracting decision makers: {e}")
+            return
+        
+        if not company_id:
+            logger.error("Company ID not found in company data")
+            return
+        
+        for employees in self.iter_company_employee_pages(company_id):
+            yield from self.iter_filter_decision_makers(employees)
+        self._discard_checkpoint(company_id)
+
+    def extract_decision_makers(self, company_url: str) -> List[Dict]:
+        """
+        Extract decision makers from a company.
+        
+        Args:
+            company_url (str): LinkedIn URL of the company
+            
+        Returns:
+            List[Dict]: List of decision makers
+        """
+        logger.info(f"Extracting decision makers for {company_url}")
+        try:
+            # Resolve the company ID (from the cache when possible)
+            company_id = self.resolve_company_id(company_url)
+            
+            if not company_id:
+                logger.error("Company ID not found in company data")
+                return []
+            
+            # Get all employees
+            employees = self.get_all_company_employees(company_id)
+            
+            # Filter decision makers
+            decision_makers = self.filter_decision_makers(employees)
+            
+            self._discard_checkpoint(company_id)
+            return decision_makers
+        except _PROPAGATED_ERRORS:
+            raise
+        except Exception as e:
+            logger.error(f"Error extracting decision makers: {e}")
+            return []
 
-class LinkedInDecisionMakerExtractor:
-    def __init__(self, api_key: str):
+    def extract_many(self, company_urls: Iterable[str],
+                     max_workers: Optional[int] = None) -> Iterator[Tuple[str, List[Dict]]]:
         """
-        Initialize the LinkedIn Decision Maker Extractor.
+        Extract decision makers for many companies on a thread pool.
+        
+        Every worker shares this extractor's connection pool, rate limiter and
+        in-flight cap. Results are yielded as soon as each company finishes, so a
+        slow company does not hold back the others. URLs are read lazily, keeping
+        at most twice max_workers companies queued.
+        
+        Args:
+            company_urls (Iterable[str]): LinkedIn URLs of the companies
+            max_workers (int, optional): Companies processed at once. Defaults to
+                the in-flight cap or the connection pool, whichever is smaller,
+                divided by the prefetch window.
+            
+        Yields:
+            Tuple[str, List[Dict]]: Company URL and its decision makers, in completion order
+        """
+        if max_workers is None:
+            max_workers = max(1, min(self.in_flight_limiter.max_in_flight, self.pool_maxsize) // self.prefetch_window)
+        if max_workers * self.prefetch_window > self.pool_maxsize:
+            logger.warning(f"{max_workers} workers x {self.prefetch_window} pages exceed the connection pool "
+                           f"({self.pool_maxsize}); raise pool_maxsize to reuse every connection")
+        
+        company_urls = iter(company_urls)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {}
+            
+            def submit_next() -> None:
+                for company_url in company_urls:
+                    pending[executor.submit(self._extract_or_park, company_url)] = company_url
+                    return
+            
+            for _ in range(2 * max_workers):
+                submit_next()
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        company_url = pending.pop(future)
+                        submit_next()
+                        yield company_url, future.result()
+            finally:
+                # The consumer stopped early; drop companies that have not started
+                for future in pending:
+                    future.cancel()
+
+
+    def _extract_or_park(self, company_url: str) -> List[Dict]:
+        """
+        Extract one company, parking it while the circuit breaker is open.
+        
+        A parked company waits until the breaker lets probes through and is then
+        tried again, so an API outage costs neither quota nor failed companies.
+        Companies parked for longer than max_park_time are skipped.
+        """
+        parked_at = None
+        while True:
+            try:
+                return self.extract_decision_makers(company_url)
+            except CircuitOpenError as e:
+                now = time.monotonic()
+                parked_at = parked_at or now
+                if now - parked_at + e.retry_after > self.max_park_time:
+                    logger.error(f"API circuit still open after parking {company_url} for {now - parked_at:.0f}s; skipping it")
+                    return []
+                logger.warning(f"API circuit open; parking {company_url} for {e.retry_after:.1f}s")
+                time.sleep(e.retry_after)
+
+
+def _encode_results(results: Iterable[Tuple[str, List[Dict]]]) -> bytes:
+    """
+    Serialize (company URL, records) pairs into one compact JSON document.
+    
+    Records are stored column-wise: each distinct set of fields is listed once
+    per company and every row holds the index of its field set followed by the
+    values, so keys are not repeated for every record.
+    """
+    batch = []
+    for company_url, records in results:
+        shapes: Dict[Tuple[str, ...], int] = {}
+        rows = []
+        for record in records:
+            fields = tuple(record)
+            shape = shapes.setdefault(fields, len(shapes))
+            rows.append([shape, *record.values()])
+        batch.append([company_url, list(shapes), rows])
+    return json.dumps(batch, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_results(payload: bytes) -> List[Tuple[str, List[Dict]]]:
+    """
+    Rebuild the (company URL, records) pairs written by _encode_results.
+    """
+    results = []
+    for company_url, shapes, rows in json.loads(payload):
+        results.append((company_url, [dict(zip(shapes[row[0]], row[1:])) for row in rows]))
+    return results
+
+
+# Extractor owned by a worker process of extract_many_in_processes
+_process_extractor = None
+
+
+class _ParentLogHandler(logging.Handler):
+    """
+    Replay records sent by worker processes through this process's loggers.
+    """
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+def _init_process_worker(extractor_factory, log_records=None, log_level: int = logging.INFO) -> None:
+    global _process_extractor
+    if log_records is not None:
+        # Handlers inherited from the parent (e.g. its thread-only QueueHandler)
+        # lead nowhere in this process; send records back to the parent instead
+        from logging.handlers import QueueHandler
+        logging.basicConfig(level=log_level, handlers=[QueueHandler(log_records)], force=True)
+    _process_extractor = extractor_factory()
+
+
+def _extract_batch_in_process(company_urls: List[str]) -> bytes:
+    return _encode_results(_process_extractor.extract_many(company_urls))
+
+
+def extract_many_in_processes(company_urls: Iterable[str], extractor_factory, processes: Optional[int] = None,
+                              batch_size: int = 16, mp_context=None) -> Iterator[Tuple[str, List[Dict]]]:
+    """
+    Extract decision makers for many companies on a pool of worker processes.
+    
+    Use this when JSON decoding and filtering, rather than the network, limit a
+    batch run. Every worker process builds its own extractor by calling
+    extractor_factory once and runs each batch of companies through its
+    extract_many thread pool. To share one API budget between the processes,
+    have the factory use a ProcessSharedRateLimiter created in this process.
+    Each batch comes back as a single compact JSON payload (see _encode_results)
+    instead of pickled lists of dicts. Log records from the workers are sent
+    back over a multiprocessing queue and handled by this process's loggers.
+    
+    Args:
+        company_urls (Iterable[str]): LinkedIn URLs of the companies, read lazily
+        extractor_factory: Picklable callable with no arguments returning a
+            LinkedInDecisionMakerExtractor, e.g. a functools.partial of a
+            module-level function
+        processes (int, optional): Worker processes. Defaults to the CPU count.
+        batch_size (int): Companies sent to a worker at once
+        mp_context: multiprocessing context used to start the workers
+        
+    Yields:
+        Tuple[str, List[Dict]]: Company URL and its decision makers, in completion order
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from itertools import islice
+    from logging.handlers import QueueListener
+    
+    processes = processes or os.cpu_count() or 1
+    company_urls = iter(company_urls)
+    log_records = (mp_context or multiprocessing).Queue()
+    log_listener = QueueListener(log_records, _ParentLogHandler())
+    log_listener.start()
+    try:
+        with ProcessPoolExecutor(max_workers=processes, mp_context=mp_context, initializer=_init_process_worker,
+                                 initargs=(extractor_factory, log_records,
+                                           logging.getLogger().getEffectiveLevel())) as executor:
+            pending = set()
+            
+            def submit_next() -> None:
+                batch = list(islice(company_urls, max(1, batch_size)))
+                if batch:
+                    pending.add(executor.submit(_extract_batch_in_process, batch))
+            
+            for _ in range(2 * processes):
+                submit_next()
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.discard(future)
+                        submit_next()
+                        yield from _decode_results(future.result())
+            finally:
+                # The consumer stopped early; drop batches that have not started
+                for future in pending:
+                    future.cancel()
+    finally:
+        # The workers have exited and flushed their queue feeders by now
+        log_listener.stop()
+
+
+def _import_async_dependencies() -> None:
+    """
+    Import asyncio and aiohttp into the module namespace on first use.
+    
+    Raises:
+        ImportError: If aiohttp is not installed
+    """
+    global asyncio, aiohttp
+    if aiohttp is not None:
+        return
+    import asyncio as asyncio_module
+    try:
+        import aiohttp as aiohttp_module
+    except ImportError:
+        raise ImportError("AsyncLinkedInDecisionMakerExtractor requires aiohttp (pip install aiohttp)") from None
+    asyncio, aiohttp = asyncio_module, aiohttp_module
+
+
+class AsyncLinkedInDecisionMakerExtractor(_BaseDecisionMakerExtractor):
+    """
+    Asyncio counterpart of LinkedInDecisionMakerExtractor built on aiohttp.
+    
+    A single instance can keep many requests in flight; use it as an async
+    context manager so the underlying connection pool is closed.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, max_connections: int = 100, max_connections_per_host: int = 0,
+                 keep_alive: bool = True, timeout: Optional[float] = 30.0, prefetch_window: int = 1,
+                 rate_limiter: Optional[TokenBucketRateLimiter] = None,
+                 company_id_cache: Optional[CompanyIdCache] = None,
+                 title_matcher: Optional[TitleMatcher] = None,
+                 checkpoint_store: Optional[CheckpointStore] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 key_pool: Optional[ApiKeyPool] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 connect_timeout: Optional[float] = None, read_timeout: Optional[float] = None):
+        """
+        Initialize the async LinkedIn Decision Maker Extractor.
         
         Args:
             api_key (str): API key for LinkedIn API authentication
+            max_connections (int, optional): Maximum number of open connections (0 for no limit)
+            max_connections_per_host (int, optional): Maximum open connections per host (0 for no limit)
+            keep_alive (bool, optional): Reuse connections between requests
+            timeout (float, optional): Total timeout in seconds applied to every request
+            prefetch_window (int, optional): Employee pages kept in flight by
+                get_all_company_employees (1 fetches pages serially)
+            rate_limiter (TokenBucketRateLimiter, optional): Limiter gating every
+                request. Defaults to the limiter shared by all extractors using api_key.
+            company_id_cache (CompanyIdCache, optional): Cache consulted before
+                resolving a company URL through the API
+            title_matcher (TitleMatcher, optional): Classifier for job titles
+            checkpoint_store (CheckpointStore, optional): Store recording fetched
+                employee pages, so an interrupted scan resumes where it stopped
+            response_cache (ResponseCache, optional): Cache of GET responses used to
+                send conditional requests and serve 304 answers
+            key_pool (ApiKeyPool, optional): Keys to spread requests over; api_key
+                may then be omitted
+            circuit_breaker (CircuitBreaker, optional): Breaker that fails requests
+                fast with CircuitOpenError while the API is down
+            connect_timeout (float, optional): Seconds allowed to establish a connection
+            read_timeout (float, optional): Seconds allowed between two reads from the socket
         """
-        self.api_key = api_key
-        self.base_url = "https://api.linkedin.com/v2"
-        self.headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        self.retry_attempts = 3
-        self.retry_delay = 2  # seconds
-        logger.info("LinkedIn Decision Maker Extractor initialized")
+        _import_async_dependencies()
+        super().__init__(api_key, timeout, prefetch_window, rate_limiter, company_id_cache, title_matcher,
+                         checkpoint_store, response_cache, key_pool, circuit_breaker, connect_timeout, read_timeout)
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keep_alive = keep_alive
+        self._session = None
+        logger.info("Async LinkedIn Decision Maker Extractor initialized")
 
-    def _make_request(self, endpoint: str, params: Dict = None, method: str = "GET") -> Dict:
+    async def _get_session(self):
+        """
+        Return the aiohttp session, creating it inside the running event loop on first use.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                force_close=not self.keep_alive
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout, connect=self.connect_timeout,
+                                              sock_read=self.read_timeout)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Close the underlying aiohttp session and release pooled connections.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self) -> "AsyncLinkedInDecisionMakerExtractor":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def _send(self, method: str, url: str, params: Dict = None, key: Optional[str] = None) -> Dict:
+        """
+        Perform a single HTTP request and decode the JSON body.
+        
+        Args:
+            key (str, optional): Pooled API key to authenticate with instead of api_key
+        
+        Raises:
+            aiohttp.ClientResponseError: If the response status is 4xx/5xx
+        """
+        session = await self._get_session()
+        auth_headers = {"Authorization": f"Bearer {key}"} if key is not None else {}
+        cache_key = cached_body = None
+        if method == "GET":
+            query = {k: str(v) for k, v in (params or {}).items()}
+            conditional_headers = {}
+            if self.response_cache is not None:
+                # Revalidate a cached copy instead of downloading the body again
+                cache_key = ResponseCache.key(url, params)
+                conditional_headers, cached_body = self.response_cache.lookup(cache_key)
+            request = session.get(url, params=query, headers=dict(conditional_headers, **auth_headers))
+        elif method == "POST":
+            request = session.post(url, json=params, headers=auth_headers)
+        else:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        async with request as response:
+            if response.status >= 400:
+                response_text = await response.text()
+                raise aiohttp.ClientResponseError(
+                    response.request_info, response.history, status=response.status,
+                    message=response_text, headers=response.headers
+                )
+            self._apply_rate_limit_headers(response.headers, throttled=False, key=key)
+            if cache_key is not None:
+                if response.status == 304 and cached_body is not None:
+                    self.response_cache.hit(cache_key, cached_body)
+                    return json.loads(cached_body)
+                body = await response.read()
+                self.response_cache.store(cache_key, response.headers, body)
+                return json.loads(body)
+            return await response.json(content_type=None)
+
+    async def _request_hedged(self, endpoint: str, params: Dict) -> Dict:
+        """
+        Make a GET request, sending a duplicate if the first one is unusually slow.
+        
+        Works like LinkedInDecisionMakerExtractor._request_hedged; the request
+        that loses the race is cancelled.
+        """
+        threshold = None
+        if self.hedge_percentile is not None:
+            threshold = self.latency_histogram.percentile(endpoint, self.hedge_percentile, self.hedge_min_samples)
+        if threshold is None:
+            return await self._make_request(endpoint, params)
+
+        primary = asyncio.ensure_future(self._make_request(endpoint, params))
+        done, _ = await asyncio.wait({primary}, timeout=threshold)
+        if done:
+            return primary.result()
+
+        logger.info(f"{endpoint} request {params} slower than p{self.hedge_percentile * 100:g} "
+                    f"({threshold * 1000:.0f} ms); sending a hedged request")
+        self._count_hedged_request()
+        pending = {primary, asyncio.ensure_future(self._make_request(endpoint, params))}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+            # Both attempts failed; report the original one
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _within_deadline(self, send, started: float):
+        """
+        Await one attempt, cutting it off at the request deadline.
+        
+        Raises:
+            asyncio.TimeoutError: If the deadline passes before the attempt completes
+        """
+        time_left = self._time_left(started)
+        if time_left is None:
+            return await send
+        return await asyncio.wait_for(send, max(0.0, time_left))
+
+    async def _make_request(self, endpoint: str, params: Dict = None, method: str = "GET") -> Dict:
         """
         Make a request to the LinkedIn API with retry logic and rate limiting.
         
@@ -50,63 +3040,97 @@ class LinkedInDecisionMakerExtractor:
             Dict: JSON response from the API
             
         Raises:
-            requests.exceptions.RequestException: If the request fails after retries
+            aiohttp.ClientError: If the request fails after retries
         """
         url = f"{self.base_url}/{endpoint}"
-        
+        server_delay = None
+        started = time.monotonic()
+        delay = 0.0
+
         for attempt in range(self.retry_attempts):
+            claimed = False
+            probe = None
             try:
-                # Add delay for rate limiting
-                if attempt > 0:
-                    delay = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                    logger.info(f"Retrying in {delay} seconds (attempt {attempt+1}/{self.retry_attempts})")
-                    time.sleep(delay)
-                
-                if method.upper() == "GET":
-                    response = requests.get(url, headers=self.headers, params=params)
-                elif method.upper() == "POST":
-                    response = requests.post(url, headers=self.headers, json=params)
+                if attempt > 0 and server_delay is not None:
+                    # The shared limiter is already paused for the server-requested window
+                    logger.info(f"Retrying after server-requested {server_delay:.1f} seconds (attempt {attempt+1}/{self.retry_attempts})")
+                elif attempt > 0:
+                    logger.info(f"Retrying in {delay:.2f} seconds (attempt {attempt+1}/{self.retry_attempts})")
+                    await asyncio.sleep(delay)
+                server_delay = None
+                key = None
+
+                # Fail fast while the API is known to be down
+                if self.circuit_breaker is not None:
+                    probe = self.circuit_breaker.allow_request()
+                    claimed = True
+
+                if self.key_pool is None:
+                    await self.rate_limiter.acquire_async()
+                    sent_at = time.monotonic()
+                    result = await self._within_deadline(self._send(method.upper(), url, params), started)
                 else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-                
-                response.raise_for_status()  # This will raise HTTPError for 4xx/5xx
-                return response.json()
-            
-            except requests.exceptions.HTTPError as e_http:
-                # Log the response text for more details, especially for 429
-                response_text = ""
-                try:
-                    response_text = e_http.response.text
-                except AttributeError:
-                    pass # No response text available
+                    # Send with the least-loaded healthy pooled key
+                    key = await self.key_pool.acquire_async()
+                    try:
+                        sent_at = time.monotonic()
+                        result = await self._within_deadline(self._send(method.upper(), url, params, key), started)
+                    finally:
+                        self.key_pool.release(key)
+                self.latency_histogram.record(endpoint, time.monotonic() - sent_at)
+                self._record_outcome(failed=False, probe=probe)
+                claimed = False
+                return result
 
-                if e_http.response.status_code == 429:
+            except aiohttp.ClientResponseError as e_http:
+                self._record_outcome(failed=e_http.status >= 500, probe=probe)
+                if not self._check_retryable(e_http, url, params):
+                    raise
+                if e_http.status == 429:
+                    server_delay = self._apply_rate_limit_headers(e_http.headers, throttled=True, key=key)
                     logger.warning(
-                        f"Rate limit hit (429). URL: {url}. Params: {params}. Response: {response_text}. "
+                        f"Rate limit hit (429). URL: {url}. Params: {params}. Response: {_truncate(e_http.message)}. "
                         f"Retrying as per policy (attempt {attempt + 1}/{self.retry_attempts})."
                     )
                 else:
                     logger.warning(
-                        f"HTTP error {e_http.response.status_code}. URL: {url}. Params: {params}. Response: {response_text}. "
+                        f"HTTP error {e_http.status}. URL: {url}. Params: {params}. Response: {_truncate(e_http.message)}. "
                         f"Retrying (attempt {attempt + 1}/{self.retry_attempts})."
                     )
-                
+
                 if attempt == self.retry_attempts - 1:
                     logger.error(f"Failed after {self.retry_attempts} attempts for URL {url} with params {params} due to HTTPError: {e_http}")
                     raise
-            except requests.exceptions.RequestException as e_req:  # For non-HTTP errors like connection errors, timeouts
+                if server_delay is not None and server_delay > self.max_retry_after:
+                    logger.error(f"Server asked to wait {server_delay:.0f}s (limit {self.max_retry_after}s); giving up on URL {url}")
+                    raise
+                delay = self._next_retry_delay(attempt + 1, server_delay, delay, started, url)
+                if delay is None:
+                    raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e_req:  # Connection errors, timeouts
+                self._record_outcome(failed=True, probe=probe)
+                if not self._check_retryable(e_req, url, params):
+                    raise
                 logger.warning(
-                    f"Request exception for URL {url} with params {params}: {e_req}. "
+                    f"Request exception for URL: {url}. Params: {params}. Error: {e_req!r}. "
                     f"Retrying (attempt {attempt + 1}/{self.retry_attempts})."
                 )
                 if attempt == self.retry_attempts - 1:
-                    logger.error(f"Failed after {self.retry_attempts} attempts for URL {url} with params {params} due to RequestException: {e_req}")
+                    logger.error(f"Failed after {self.retry_attempts} attempts for URL {url} with params {params} due to RequestException: {e_req!r}")
                     raise
-        
+                delay = self._next_retry_delay(attempt + 1, None, delay, started, url)
+                if delay is None:
+                    raise
+            except BaseException:
+                # Cancelled (e.g. the losing hedged request) or an unclassified error
+                if claimed:
+                    self.circuit_breaker.release(probe)
+                raise
+
         # This should not be reached due to the raise in the loop
         raise RuntimeError("Request failed after retries")
 
-    def get_company_data(self, company_url: str) -> Dict:
+    async def get_company_data(self, company_url: str) -> Dict:
         """
         Fetch company data from LinkedIn API.
         
@@ -117,16 +3141,40 @@ class LinkedInDecisionMakerExtractor:
             Dict: Company data
         """
         logger.info(f"Fetching company data for {company_url}")
-        endpoint = "company"
-        params = {"link": company_url}
-        
         try:
-            return self._make_request(endpoint, params)
+            return await self._make_request("company", {"link": company_url})
         except Exception as e:
             logger.error(f"Error fetching company data: {e}")
             raise
 
-    def get_company_employees(self, company_id: str, page: int = 1, page_size: int = 100) -> List[Dict]:
+    async def resolve_company_id(self, company_url: str) -> Optional[str]:
+        """
+        Resolve a company URL to its LinkedIn company ID, using the cache when configured.
+        
+        Args:
+            company_url (str): LinkedIn URL of the company
+            
+        Returns:
+            Optional[str]: Company ID, or None if the API does not know the company
+        """
+        if self.company_id_cache is not None:
+            found, company_id = self.company_id_cache.get(company_url)
+            if found:
+                return company_id
+
+        try:
+            company_data = await self.get_company_data(company_url)
+        except aiohttp.ClientResponseError as e:
+            if self.company_id_cache is not None and e.status == 404:
+                self.company_id_cache.set(company_url, None)
+            raise
+
+        company_id = company_data.get("id")
+        if self.company_id_cache is not None:
+            self.company_id_cache.set(company_url, company_id)
+        return company_id
+
+    async def get_company_employees(self, company_id: str, page: int = 1, page_size: int = 100) -> List[Dict]:
         """
         Fetch employees of a company from LinkedIn API.
         
@@ -136,83 +3184,151 @@ class LinkedInDecisionMakerExtractor:
             page_size (int, optional): Number of results per page
             
         Returns:
-            List[Dict]: List of employee data
+            List[Dict]: List of employee data; empty if the request failed
         """
         logger.info(f"Fetching employees for company ID {company_id} (page {page})")
-        endpoint = "company_employee"
         params = {
             "companyId": company_id,
             "page": page,
             "pageSize": page_size
         }
-        
+
         try:
-            response = self._make_request(endpoint, params)
+            response = await self._request_hedged("company_employee", params)
             return response.get("results", [])
+        except _PROPAGATED_ERRORS:
+            raise
         except Exception as e:
             logger.error(f"Error fetching company employees: {e}")
-            return []
+            return _FailedPage(e)
 
-    def get_all_company_employees(self, company_id: str) -> List[Dict]:
+    async def get_all_company_employees(self, company_id: str, prefetch_window: Optional[int] = None) -> List[Dict]:
         """
         Fetch all employees of a company using pagination.
         
         Args:
             company_id (str): LinkedIn company ID
+            prefetch_window (int, optional): Number of pages kept in flight at once.
+                Defaults to the extractor's prefetch_window; 1 fetches pages serially.
             
         Returns:
-            List[Dict]: List of all employee data
+            List[Dict]: List of all employee data, in page order
         """
         logger.info(f"Fetching all employees for company ID {company_id}")
         all_employees = []
-        page = 1
-        page_size = 100
-        
-        while True:
-            employees = self.get_company_employees(company_id, page, page_size)
-            if not employees:
-                break
-                
+        async for employees in self.iter_company_employee_pages(company_id, prefetch_window):
             all_employees.extend(employees)
             logger.info(f"Fetched {len(employees)} employees (total: {len(all_employees)})")
-            
-            if len(employees) < page_size:
-                break
-                
-            page += 1
-            # Add delay to respect rate limits
-            time.sleep(1)
-        
+
         return all_employees
 
-    def filter_decision_makers(self, employees: List[Dict]) -> List[Dict]:
+    async def iter_company_employees(self, company_id: str, prefetch_window: Optional[int] = None) -> AsyncIterator[Dict]:
         """
-        Filter employees to identify decision makers based on job titles.
+        Yield employees of a company one at a time, fetching pages as they are consumed.
         
         Args:
-            employees (List[Dict]): List of employee data
+            company_id (str): LinkedIn company ID
+            prefetch_window (int, optional): Number of pages kept in flight at once
             
-        Returns:
-            List[Dict]: List of decision makers
+        Yields:
+            Dict: Employee data, in page order
         """
-        logger.info(f"Filtering decision makers from {len(employees)} employees")
-        decision_maker_titles = [
-            "CEO", "Chief", "President", "Director", "VP", "Vice President",
-            "Head of", "Manager", "Founder", "Owner", "Partner", "Executive"
-        ]
+        async for employees in self.iter_company_employee_pages(company_id, prefetch_window):
+            for employee in employees:
+                yield employee
+
+    async def iter_company_employee_pages(self, company_id: str,
+                                          prefetch_window: Optional[int] = None) -> AsyncIterator[List[Dict]]:
+        """
+        Yield pages of employees until the first empty or short page.
         
-        decision_makers = []
-        for employee in employees:
-            title = employee.get("title", "").lower()
-            for decision_title in decision_maker_titles:
-                if decision_title.lower() in title:
-                    decision_makers.append(employee)
+        Args:
+            company_id (str): LinkedIn company ID
+            prefetch_window (int, optional): Number of pages kept in flight at once.
+                Defaults to the extractor's prefetch_window; 1 fetches pages serially.
+            
+        Yields:
+            List[Dict]: One page of employee data, in page order
+            
+        Raises:
+            Exception: The error of a page that could not be fetched. The scan
+                is not recorded as complete, so a rerun resumes at that page.
+        """
+        prefetch_window = prefetch_window or self.prefetch_window
+        checkpointed, complete = self._load_checkpoint(company_id)
+        for employees in checkpointed:
+            yield employees
+        if complete:
+            return
+
+        page_size = 100
+        pending = {}
+        page = len(checkpointed) + 1
+        next_page = page - 1
+
+        def schedule():
+            nonlocal next_page
+            next_page += 1
+            pending[next_page] = asyncio.ensure_future(self.get_company_employees(company_id, next_page, page_size))
+
+        # Serial fetching is simply a window of one
+        for _ in range(prefetch_window):
+            schedule()
+
+        try:
+            while True:
+                employees = _check_page(await pending.pop(page))
+                if not employees:
                     break
+
+                if len(employees) == page_size:
+                    schedule()
+
+                if self.checkpoint_store is not None:
+                    self.checkpoint_store.append_page(company_id, page, employees)
+                yield employees
+
+                if len(employees) < page_size:
+                    break
+
+                page += 1
+        finally:
+            for task in pending.values():
+                task.cancel()
+
+        # Only reached when the scan ran to the end rather than being abandoned by the consumer
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.mark_complete(company_id)
+
+    async def iter_decision_makers(self, company_url: str) -> AsyncIterator[Dict]:
+        """
+        Yield decision makers of a company page by page, without holding every employee in memory.
         
-        logger.info(f"Found {len(decision_makers)} decision makers")
-        return decision_makers
+        Args:
+            company_url (str): LinkedIn URL of the company
+            
+        Yields:
+            Dict: Decision maker data, in page order
+        """
+        logger.info(f"Streaming decision makers for {company_url}")
+        try:
+            company_id = await self.resolve_company_id(company_url)
+        except _PROPAGATED_ERRORS:
+            raise
+        except Exception as e:
+            logger.error(f"Error extracting decision makers: {e}")
+            return
 
-    def extract_decision_makers(self, company_url: str) -> List[Dict]:
+        if not company_id:
+            logger.error("Company ID not found in company data")
+            return
+
+        async for employees in self.iter_company_employee_pages(company_id):
+            for decision_maker in self.iter_filter_decision_makers(employees):
+                yield decision_maker
+        self._discard_checkpoint(company_id)
+
+    async def extract_decision_makers(self, company_url: str) -> List[Dict]:
         """
         Extract decision makers from a company.
         
@@ -224,55 +3340,18 @@ class LinkedInDecisionMakerExtractor:
         """
         logger.info(f"Extracting decision makers for {company_url}")
         try:
-            # Get company data
-            company_data = self.get_company_data(company_url)
-            company_id = company_data.get("id")
-            
+            company_id = await self.resolve_company_id(company_url)
+
             if not company_id:
                 logger.error("Company ID not found in company data")
                 return []
-            
-            # Get all employees
-            employees = self.get_all_company_employees(company_id)
-            
-            # Filter decision makers
+
+            employees = await self.get_all_company_employees(company_id)
             decision_makers = self.filter_decision_makers(employees)
-            
+            self._discard_checkpoint(company_id)
             return decision_makers
+        except _PROPAGATED_ERRORS:
+            raise
         except Exception as e:
             logger.error(f"Error extracting decision makers: {e}")
             return []
-
-    def save_to_csv(self, decision_makers: List[Dict], output_file: str) -> None:
-        """
-        Save decision makers to a CSV file.
-        
-        Args:
-            decision_makers (List[Dict]): List of decision makers
-            output_file (str): Path to output CSV file
-        """
-        logger.info(f"Saving {len(decision_makers)} decision makers to {output_file}")
-        try:
-            df = pd.DataFrame(decision_makers)
-            df.to_csv(output_file, index=False)
-            logger.info(f"Successfully saved to {output_file}")
-        except Exception as e:
-            logger.error(f"Error saving to CSV: {e}")
-            raise
-
-    def save_to_json(self, decision_makers: List[Dict], output_file: str) -> None:
-        """
-        Save decision makers to a JSON file.
-        
-        Args:
-            decision_makers (List[Dict]): List of decision makers
-            output_file (str): Path to output JSON file
-        """
-        logger.info(f"Saving {len(decision_makers)} decision makers to {output_file}")
-        try:
-            with open(output_file, 'w') as f:
-                json.dump(decision_makers, f, indent=4)
-            logger.info(f"Successfully saved to {output_file}")
-        except Exception as e:
-            logger.error(f"Error saving to JSON: {e}")
-            raise
\ No newline at end of file
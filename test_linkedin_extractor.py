@@ -1,10 +1,20 @@
 import unittest
-from unittest.mock import patch, MagicMock
+import asyncio
+from unittest.mock import patch, MagicMock, AsyncMock
 import json
 import os
-from linkedin_decision_maker_extractor import LinkedInDecisionMakerExtractor, logger
+import time
+from linkedin_decision_maker_extractor import (
+    LinkedInDecisionMakerExtractor, AsyncLinkedInDecisionMakerExtractor, TokenBucketRateLimiter, InFlightLimiter,
+    CompanyIdCache, TitleMatcher, CsvRecordWriter, JsonRecordWriter, JsonLinesRecordWriter, CheckpointStore,
+    SnapshotStore, ResponseCache, ApiKeyPool, ProcessSharedRateLimiter, RetryBudget, CircuitBreaker,
+    CircuitOpenError, AuthenticationError, LatencyHistogram, configure_logging, extract_many_in_processes,
+    is_retryable, logger
+)
 import requests # Added for requests.exceptions
+import aiohttp
 import logging # Added for logger manipulation in tests
+import logging.handlers
 import sys # For mocking sys.exit and checking CLI behavior
 import argparse # For creating mock args Namespace
 
@@ -13,7 +23,8 @@ class TestLinkedInDecisionMakerExtractor(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures before each test method."""
         self.api_key = "test_api_key"
-        self.extractor = LinkedInDecisionMakerExtractor(self.api_key)
+        # A limiter that never waits, so tests only see the sleeps they expect
+        self.extractor = LinkedInDecisionMakerExtractor(self.api_key, rate_limiter=TokenBucketRateLimiter(rate=1e6, burst=10**6))
         
         # Sample test data
         self.sample_company_data = {
@@ -30,7 +41,7 @@ class TestLinkedInDecisionMakerExtractor(unittest.TestCase):
             {"id": "e5", "firstName": "Charlie", "lastName": "Brown", "title": "Sales Representative"}
         ]
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_company_data(self, mock_get):
         """Test fetching company data."""
         # Configure the mock
@@ -46,7 +57,7 @@ class TestLinkedInDecisionMakerExtractor(unittest.TestCase):
         self.assertEqual(result, self.sample_company_data)
         mock_get.assert_called_once()
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_company_employees(self, mock_get):
         """Test fetching company employees."""
         # Configure the mock
@@ -62,6 +73,57 @@ class TestLinkedInDecisionMakerExtractor(unittest.TestCase):
         self.assertEqual(result, self.sample_employees)
         mock_get.assert_called_once()
     
+    def test_iter_decision_makers_is_lazy(self):
+        """Test that decision makers are yielded before later pages are fetched."""
+        pages = {
+            1: [{"id": "a", "title": "CEO"}] + [{"id": "x", "title": "Engineer"}] * 99,
+            2: [{"id": "b", "title": "Head of Sales"}],
+        }
+        with patch.object(self.extractor, 'get_company_data', return_value=self.sample_company_data), \
+             patch.object(self.extractor, 'get_company_employees',
+                          side_effect=lambda company_id, page, page_size: pages.get(page, [])) as mock_page:
+            stream = self.extractor.iter_decision_makers("https://www.linkedin.com/company/test-company/")
+            first = next(stream)
+            self.assertEqual(first["id"], "a")
+            self.assertEqual(mock_page.call_count, 1)
+
+            self.assertEqual([e["id"] for e in stream], ["b"])
+            self.assertEqual(mock_page.call_count, 2)
+
+    def test_iter_company_employees_yields_in_page_order(self):
+        """Test that iter_company_employees flattens pages in order for both fetch modes."""
+        pages = {1: [{"id": i} for i in range(100)], 2: [{"id": i} for i in range(100, 150)]}
+        with patch.object(self.extractor, 'get_company_employees',
+                          side_effect=lambda company_id, page, page_size: pages.get(page, [])):
+            serial = [e["id"] for e in self.extractor.iter_company_employees("12345")]
+            prefetched = [e["id"] for e in self.extractor.iter_company_employees("12345", prefetch_window=3)]
+
+        self.assertEqual(serial, list(range(150)))
+        self.assertEqual(prefetched, list(range(150)))
+
+    @patch('requests.Session.get')
+    def test_make_request_acquires_rate_limiter(self, mock_get):
+        """Test that every request waits on the injected rate limiter."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {}
+        mock_get.return_value = mock_response
+        limiter = MagicMock()
+        extractor = LinkedInDecisionMakerExtractor(self.api_key, rate_limiter=limiter)
+
+        extractor._make_request("company")
+        extractor._make_request("company")
+
+        self.assertEqual(limiter.acquire.call_count, 2)
+
+    def test_default_rate_limiter_is_shared_per_api_key(self):
+        """Test that extractors using the same API key share one limiter."""
+        first = LinkedInDecisionMakerExtractor("shared_key")
+        second = AsyncLinkedInDecisionMakerExtractor("shared_key")
+        other = LinkedInDecisionMakerExtractor("other_key")
+
+        self.assertIs(first.rate_limiter, second.rate_limiter)
+        self.assertIsNot(first.rate_limiter, other.rate_limiter)
+
     def test_filter_decision_makers(self):
         """Test filtering decision makers based on job titles."""
         # Call the method
@@ -103,7 +165,7 @@ class TestLinkedInDecisionMakerExtractor(unittest.TestCase):
         mock_get_all_employees.assert_called_once()
 
     @patch('time.sleep') # Mock time.sleep for retry delays
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_make_request_http_error_retry_and_fail(self, mock_get, mock_sleep):
         """Test _make_request handles HTTP errors, retries, and eventually fails."""
         # Configure mock_get to raise HTTPError
@@ -113,8 +175,7 @@ class TestLinkedInDecisionMakerExtractor(unittest.TestCase):
         )
         mock_get.return_value = mock_response
 
-        with self.assertLogs(logger, level='ERROR') as cm_error,
-             self.assertLogs(logger, level='WARNING') as cm_warning:
+        with self.assertLogs(logger, level='WARNING') as cm_warning:
             with self.assertRaises(requests.exceptions.HTTPError):
                 self.extractor._make_request("test_endpoint")
         
@@ -122,10 +183,10 @@ class TestLinkedInDecisionMakerExtractor(unittest.TestCase):
         self.assertEqual(mock_sleep.call_count, self.extractor.retry_attempts - 1)
         # Check for specific log messages
         self.assertTrue(any(f"HTTP error 500. URL: {self.extractor.base_url}/test_endpoint" in msg for msg in cm_warning.output))
-        self.assertTrue(any(f"Failed after {self.extractor.retry_attempts} attempts" in msg for msg in cm_error.output))
+        self.assertTrue(any(f"Failed after {self.extractor.retry_attempts} attempts" in msg for msg in cm_warning.output))
 
     @patch('time.sleep')
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_make_request_rate_limit_retry_and_fail(self, mock_get, mock_sleep):
         """Test _make_request handles 429 rate limit errors, retries, and eventually fails."""
         mock_response = MagicMock()
@@ -134,33 +195,81 @@ class TestLinkedInDecisionMakerExtractor(unittest.TestCase):
         )
         mock_get.return_value = mock_response
 
-        with self.assertLogs(logger, level='ERROR') as cm_error,
-             self.assertLogs(logger, level='WARNING') as cm_warning:
+        with self.assertLogs(logger, level='WARNING') as cm_warning:
             with self.assertRaises(requests.exceptions.HTTPError):
                 self.extractor._make_request("test_rate_limit_endpoint")
 
         self.assertEqual(mock_get.call_count, self.extractor.retry_attempts)
         self.assertEqual(mock_sleep.call_count, self.extractor.retry_attempts - 1)
         self.assertTrue(any(f"Rate limit hit (429). URL: {self.extractor.base_url}/test_rate_limit_endpoint" in msg for msg in cm_warning.output))
-        self.assertTrue(any(f"Failed after {self.extractor.retry_attempts} attempts" in msg for msg in cm_error.output))
+        self.assertTrue(any(f"Failed after {self.extractor.retry_attempts} attempts" in msg for msg in cm_warning.output))
 
     @patch('time.sleep')
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_make_request_request_exception_retry_and_fail(self, mock_get, mock_sleep):
         """Test _make_request handles general RequestExceptions, retries, and eventually fails."""
         mock_get.side_effect = requests.exceptions.ConnectionError("Connection failed")
 
-        with self.assertLogs(logger, level='ERROR') as cm_error,
-             self.assertLogs(logger, level='WARNING') as cm_warning:
+        with self.assertLogs(logger, level='WARNING') as cm_warning:
             with self.assertRaises(requests.exceptions.ConnectionError):
                 self.extractor._make_request("test_conn_error_endpoint")
 
         self.assertEqual(mock_get.call_count, self.extractor.retry_attempts)
         self.assertEqual(mock_sleep.call_count, self.extractor.retry_attempts - 1)
         self.assertTrue(any(f"Request exception for URL: {self.extractor.base_url}/test_conn_error_endpoint" in msg for msg in cm_warning.output))
-        self.assertTrue(any(f"Failed after {self.extractor.retry_attempts} attempts" in msg for msg in cm_error.output))
+        self.assertTrue(any(f"Failed after {self.extractor.retry_attempts} attempts" in msg for msg in cm_warning.output))
 
-    @patch('requests.get')
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_make_request_honors_retry_after(self, mock_get, mock_sleep):
+        """Test that a 429 with Retry-After pauses the shared limiter instead of backing off blindly."""
+        throttled = MagicMock()
+        throttled.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=MagicMock(status_code=429, text="Rate Limit Exceeded", headers={"Retry-After": "7"})
+        )
+        ok = MagicMock()
+        ok.headers = {}
+        ok.json.return_value = {"data": "success"}
+        mock_get.side_effect = [throttled, ok]
+        limiter = MagicMock()
+        extractor = LinkedInDecisionMakerExtractor(self.api_key, rate_limiter=limiter)
+
+        result = extractor._make_request("company")
+
+        self.assertEqual(result, {"data": "success"})
+        limiter.pause.assert_called_once_with(7.0)
+        # The limiter does the waiting; no exponential backoff sleep on top
+        mock_sleep.assert_not_called()
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_make_request_gives_up_on_long_retry_after(self, mock_get, mock_sleep):
+        """Test that a Retry-After beyond max_retry_after fails the request without retrying."""
+        throttled = MagicMock()
+        throttled.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=MagicMock(status_code=429, text="", headers={"Retry-After": "3600"})
+        )
+        mock_get.return_value = throttled
+
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.extractor._make_request("company")
+        mock_get.assert_called_once()
+
+    @patch('requests.Session.get')
+    def test_make_request_pauses_when_quota_exhausted(self, mock_get):
+        """Test that a successful response reporting zero remaining quota pauses the limiter."""
+        ok = MagicMock()
+        ok.headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "12"}
+        ok.json.return_value = {}
+        mock_get.return_value = ok
+        limiter = MagicMock()
+        extractor = LinkedInDecisionMakerExtractor(self.api_key, rate_limiter=limiter)
+
+        extractor._make_request("company")
+
+        limiter.pause.assert_called_once_with(12.0)
+
+    @patch('requests.Session.get')
     def test_make_request_success_first_attempt(self, mock_get):
         """Test _make_request succeeds on the first attempt."""
         mock_response = MagicMock()
@@ -180,6 +289,80 @@ class TestLinkedInDecisionMakerExtractor(unittest.TestCase):
         # Test default retry_delay, though not strictly required by prompt, it's good practice
         self.assertEqual(self.extractor.retry_delay, 2)
 
+    @patch('requests.Session.get')
+    def test_make_request_reuses_pooled_session(self, mock_get):
+        """Test that consecutive requests go through the same session with a timeout."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"results": []}
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        session = self.extractor.session
+        self.extractor._make_request("company_employee", {"page": 1})
+        self.extractor._make_request("company_employee", {"page": 2})
+
+        self.assertIs(self.extractor.session, session)
+        self.assertEqual(mock_get.call_count, 2)
+        for call in mock_get.call_args_list:
+            self.assertEqual(call.kwargs["timeout"], self.extractor.timeout)
+
+    def test_pool_configuration(self):
+        """Test that pool settings are applied to the mounted adapters."""
+        extractor = LinkedInDecisionMakerExtractor(self.api_key, pool_connections=4, pool_maxsize=32, keep_alive=False)
+        adapter = extractor.session.get_adapter("https://api.linkedin.com/v2")
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertEqual(extractor.session.headers["Connection"], "close")
+        extractor.close()
+
+    def test_context_manager_closes_session(self):
+        """Test that leaving the context closes an owned session but not an injected one."""
+        with patch('requests.Session.close') as mock_close:
+            with LinkedInDecisionMakerExtractor(self.api_key):
+                pass
+        mock_close.assert_called_once()
+
+        session = MagicMock(spec=requests.Session)
+        with LinkedInDecisionMakerExtractor(self.api_key, session=session) as extractor:
+            self.assertIs(extractor.session, session)
+        session.close.assert_not_called()
+
+    @patch('time.sleep')
+    def test_get_all_company_employees_prefetch_window(self, mock_sleep):
+        """Test that prefetching keeps pages in order and stops at the first short page."""
+        pages = {
+            1: [{"id": f"p1-{i}"} for i in range(100)],
+            2: [{"id": f"p2-{i}"} for i in range(100)],
+            3: [{"id": f"p3-{i}"} for i in range(40)],
+        }
+        requested = []
+
+        def fake_get_company_employees(company_id, page, page_size):
+            requested.append(page)
+            return pages.get(page, [])
+
+        with patch.object(self.extractor, 'get_company_employees', side_effect=fake_get_company_employees):
+            result = self.extractor.get_all_company_employees("12345", prefetch_window=4)
+
+        self.assertEqual([e["id"] for e in result],
+                         [e["id"] for page in (1, 2, 3) for e in pages[page]])
+        # The window is refilled as pages complete, but never runs far past the short page
+        self.assertLessEqual(max(requested), 3 + 4)
+        mock_sleep.assert_not_called()
+
+    @patch('time.sleep')
+    def test_get_all_company_employees_default_is_serial(self, mock_sleep):
+        """Test that without a prefetch window pages are fetched one at a time."""
+        pages = {1: [{"id": "a"}] * 100, 2: [{"id": "b"}] * 10}
+        with patch.object(self.extractor, 'get_company_employees',
+                          side_effect=lambda company_id, page, page_size: pages.get(page, [])) as mock_page:
+            result = self.extractor.get_all_company_employees("12345")
+
+        self.assertEqual(len(result), 110)
+        self.assertEqual(mock_page.call_count, 2)
+        # Pacing is left to the rate limiter; there is no fixed delay between pages
+        mock_sleep.assert_not_called()
+
     def test_save_to_csv(self):
         """Test saving data to CSV."""
         # Test data
@@ -228,6 +411,1741 @@ class TestLinkedInDecisionMakerExtractor(unittest.TestCase):
                 os.remove(test_file)
 
 
+class TestAsyncLinkedInDecisionMakerExtractor(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.extractor = AsyncLinkedInDecisionMakerExtractor("test_api_key", rate_limiter=TokenBucketRateLimiter(rate=1e6, burst=10**6))
+        self.sample_employees = [
+            {"id": "e1", "firstName": "John", "lastName": "Doe", "title": "CEO"},
+            {"id": "e3", "firstName": "Bob", "lastName": "Johnson", "title": "Software Engineer"},
+            {"id": "e4", "firstName": "Alice", "lastName": "Williams", "title": "Director of Marketing"}
+        ]
+
+    async def asyncTearDown(self):
+        await self.extractor.close()
+
+    async def test_get_company_data(self):
+        """Test fetching company data asynchronously."""
+        with patch.object(self.extractor, '_send', AsyncMock(return_value={"id": "12345"})) as mock_send:
+            result = await self.extractor.get_company_data("https://www.linkedin.com/company/test-company/")
+
+        self.assertEqual(result, {"id": "12345"})
+        mock_send.assert_awaited_once_with("GET", f"{self.extractor.base_url}/company",
+                                           {"link": "https://www.linkedin.com/company/test-company/"})
+
+    @patch('asyncio.sleep', new_callable=AsyncMock)
+    async def test_make_request_http_error_retry_and_fail(self, mock_sleep):
+        """Test the async _make_request retries HTTP errors with the same policy as the sync one."""
+        error = aiohttp.ClientResponseError(MagicMock(), (), status=500, message="Server Error")
+        with patch.object(self.extractor, '_send', AsyncMock(side_effect=error)) as mock_send:
+            with self.assertLogs(logger, level='WARNING') as cm:
+                with self.assertRaises(aiohttp.ClientResponseError):
+                    await self.extractor._make_request("test_endpoint")
+
+        self.assertEqual(mock_send.await_count, self.extractor.retry_attempts)
+        self.assertEqual([c.args[0] for c in mock_sleep.await_args_list], [4, 8])
+        self.assertTrue(any("HTTP error 500" in msg for msg in cm.output))
+
+    @patch('asyncio.sleep', new_callable=AsyncMock)
+    async def test_extract_decision_makers(self, mock_sleep):
+        """Test the full async extraction process."""
+        responses = [{"id": "12345"}, {"results": self.sample_employees}]
+        with patch.object(self.extractor, '_send', AsyncMock(side_effect=responses)):
+            result = await self.extractor.extract_decision_makers("https://www.linkedin.com/company/test-company/")
+
+        self.assertEqual([e["id"] for e in result], ["e1", "e4"])
+
+    async def test_get_all_company_employees_prefetch_window(self):
+        """Test that async prefetching returns pages in order and stops at an empty page."""
+        pages = {page: [{"id": f"{page}-{i}"} for i in range(100)] for page in range(1, 6)}
+
+        async def fake_get_company_employees(company_id, page, page_size):
+            # Later pages finish first to prove results are reordered
+            await asyncio.sleep(0.001 * (10 - page))
+            return pages.get(page, [])
+
+        with patch.object(self.extractor, 'get_company_employees', side_effect=fake_get_company_employees):
+            result = await self.extractor.get_all_company_employees("12345", prefetch_window=3)
+
+        self.assertEqual([e["id"] for e in result],
+                         [e["id"] for page in range(1, 6) for e in pages[page]])
+
+    async def test_iter_decision_makers(self):
+        """Test that the async generator yields decision makers page by page."""
+        pages = {1: [{"id": "a", "title": "CEO"}] * 100, 2: [{"id": "b", "title": "Engineer"}]}
+
+        async def fake_get_company_employees(company_id, page, page_size):
+            return pages.get(page, [])
+
+        with patch.object(self.extractor, 'get_company_data', AsyncMock(return_value={"id": "12345"})), \
+             patch.object(self.extractor, 'get_company_employees', side_effect=fake_get_company_employees):
+            result = [e async for e in self.extractor.iter_decision_makers("https://www.linkedin.com/company/test/")]
+
+        self.assertEqual(len(result), 100)
+
+    async def test_requests_run_concurrently(self):
+        """Test that many requests can be in flight on one extractor at the same time."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_send(method, url, params):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"results": []}
+
+        with patch.object(self.extractor, '_send', side_effect=fake_send):
+            await asyncio.gather(*(self.extractor.get_company_employees("12345", page) for page in range(1, 51)))
+
+        self.assertEqual(peak, 50)
+
+
+class TestTokenBucketRateLimiter(unittest.TestCase):
+
+    @patch('time.sleep')
+    def test_burst_does_not_sleep(self, mock_sleep):
+        """Test that requests within the burst proceed without waiting."""
+        limiter = TokenBucketRateLimiter(rate=1, burst=5)
+        for _ in range(5):
+            limiter.acquire()
+        mock_sleep.assert_not_called()
+
+    @patch('time.sleep')
+    def test_waits_once_tokens_are_exhausted(self, mock_sleep):
+        """Test that callers beyond the burst wait for their reserved token."""
+        limiter = TokenBucketRateLimiter(rate=2, burst=1)
+        limiter.acquire()
+        limiter.acquire()
+        limiter.acquire()
+
+        waits = [c.args[0] for c in mock_sleep.call_args_list]
+        self.assertEqual(len(waits), 2)
+        self.assertAlmostEqual(waits[0], 0.5, places=2)
+        self.assertAlmostEqual(waits[1], 1.0, places=2)
+
+    def test_thread_safety(self):
+        """Test that concurrent threads never exceed the configured rate."""
+        import threading
+        import time
+
+        limiter = TokenBucketRateLimiter(rate=200, burst=5)
+        start = time.monotonic()
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(25)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 5 burst tokens, then 20 more at 200/s take at least 0.1s
+        self.assertGreaterEqual(time.monotonic() - start, 0.095)
+
+    def test_acquire_async(self):
+        """Test that the async path waits without blocking the event loop."""
+        limiter = TokenBucketRateLimiter(rate=1, burst=1)
+
+        async def run():
+            with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+                await limiter.acquire_async()
+                await limiter.acquire_async()
+            return mock_sleep
+
+        mock_sleep = asyncio.run(run())
+        mock_sleep.assert_awaited_once()
+
+    @patch('time.sleep')
+    def test_pause_holds_back_then_resumes_at_full_burst(self, mock_sleep):
+        """Test that a pause delays every caller and the bucket is full again afterwards."""
+        limiter = TokenBucketRateLimiter(rate=1, burst=3)
+        for _ in range(3):
+            limiter.acquire()
+        limiter.pause(10)
+        for _ in range(3):
+            limiter.acquire()
+
+        waits = [c.args[0] for c in mock_sleep.call_args_list]
+        # All three callers after the pause go out together when it ends
+        self.assertEqual(len(waits), 3)
+        for wait in waits:
+            self.assertAlmostEqual(wait, 10, places=1)
+
+    def test_pause_holds_back_callers_already_waiting(self):
+        """Test that a pause set while callers sleep on reserved tokens delays them too."""
+        import threading
+        import time
+
+        limiter = TokenBucketRateLimiter(rate=20, burst=1)
+        limiter.acquire()
+        sent = []
+        threads = [threading.Thread(target=lambda: (limiter.acquire(), sent.append(time.monotonic())))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.02)
+        paused_at = time.monotonic()
+        limiter.pause(0.3)
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(sent), 4)
+        # Nobody fires during the pause, and afterwards callers are still spaced by the rate
+        self.assertGreaterEqual(min(sent) - paused_at, 0.295)
+        self.assertGreaterEqual(max(sent) - min(sent), 0.1)
+
+    def test_server_requested_delay_parsing(self):
+        """Test parsing of Retry-After and X-RateLimit-* headers."""
+        import time
+        from email.utils import formatdate
+        from linkedin_decision_maker_extractor import _server_requested_delay
+
+        self.assertEqual(_server_requested_delay({"Retry-After": "5"}, throttled=True), 5.0)
+        http_date = formatdate(time.time() + 30, usegmt=True)
+        self.assertAlmostEqual(_server_requested_delay({"Retry-After": http_date}, throttled=True), 30, delta=2)
+        self.assertAlmostEqual(
+            _server_requested_delay({"X-RateLimit-Reset": str(int(time.time()) + 20)}, throttled=True), 20, delta=2
+        )
+        self.assertIsNone(_server_requested_delay({}, throttled=True))
+        self.assertIsNone(_server_requested_delay({"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "9"}, throttled=False))
+        self.assertEqual(_server_requested_delay({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "9"}, throttled=False), 9.0)
+
+    def test_invalid_settings(self):
+        """Test that non-positive settings are rejected."""
+        with self.assertRaises(ValueError):
+            TokenBucketRateLimiter(rate=0)
+        with self.assertRaises(ValueError):
+            TokenBucketRateLimiter(rate=1, burst=0)
+
+
+class TestBatchCLI(unittest.TestCase):
+
+    def test_read_company_urls_plain_lines(self):
+        """Test reading one URL per line, skipping blanks and comments."""
+        import cli
+        lines = ["# companies\n", "https://www.linkedin.com/company/a/\n", "\n", "https://www.linkedin.com/company/b/\n"]
+        self.assertEqual(list(cli.read_company_urls(lines)),
+                         ["https://www.linkedin.com/company/a/", "https://www.linkedin.com/company/b/"])
+
+    def test_read_company_urls_csv_and_jsonl(self):
+        """Test that CSV and JSONL input are detected and the URL column is picked."""
+        import cli
+        csv_lines = ["name,company_url\n", "A,https://www.linkedin.com/company/a/\n", "B,https://www.linkedin.com/company/b/\n"]
+        jsonl_lines = ['{"name": "A", "url": "https://www.linkedin.com/company/a/"}\n',
+                       '{"name": "B", "url": "https://www.linkedin.com/company/b/"}\n']
+        expected = ["https://www.linkedin.com/company/a/", "https://www.linkedin.com/company/b/"]
+
+        self.assertEqual(list(cli.read_company_urls(csv_lines)), expected)
+        self.assertEqual(list(cli.read_company_urls(jsonl_lines)), expected)
+        self.assertEqual(list(cli.read_company_urls(csv_lines, "csv")), expected)
+
+    def test_company_slug(self):
+        """Test deriving per-company file names from URLs."""
+        import cli
+        self.assertEqual(cli.company_slug("https://www.linkedin.com/company/microsoft/"), "microsoft")
+        self.assertEqual(cli.company_slug("https://www.linkedin.com/company/a&b co?trk=1"), "a_b_co")
+
+    @patch('builtins.print')
+    def test_run_batch_per_company_and_combined(self, mock_print):
+        """Test batch extraction writes one file per company, or one combined file."""
+        import cli
+        extractor = MagicMock()
+        extractor.extract_many.side_effect = lambda urls, max_workers: (
+            (url, extractor.extract_decision_makers(url)) for url in urls)
+        results = {
+            "https://www.linkedin.com/company/a/": [{"id": "1", "title": "CEO"}],
+            "https://www.linkedin.com/company/b/": [],
+        }
+        extractor.extract_decision_makers.side_effect = lambda url: results[url]
+        args = argparse.Namespace(concurrency=2, combined=False, output="out", format="json")
+
+        counts = cli.run_batch(extractor, list(results), args, "ts")
+
+        self.assertEqual(counts, {"https://www.linkedin.com/company/a/": 1, "https://www.linkedin.com/company/b/": 0})
+        extractor.save_to_json.assert_called_once_with([{"id": "1", "title": "CEO"}], "out_a_ts.json")
+
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            args.combined = True
+            args.format = "both"
+            args.output = os.path.join(tmp, "out")
+            cli.run_batch(extractor, list(results), args, "ts")
+
+            with open(os.path.join(tmp, "out_ts.json")) as f:
+                self.assertEqual(json.load(f), [
+                    {"id": "1", "title": "CEO", "companyUrl": "https://www.linkedin.com/company/a/"}
+                ])
+            with open(os.path.join(tmp, "out_ts.csv")) as f:
+                self.assertEqual(f.read(), "id,title,companyUrl\n1,CEO,https://www.linkedin.com/company/a/\n")
+
+
+class TestCompanyIdCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = CompanyIdCache(":memory:", ttl=100, negative_ttl=10)
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_normalize_url(self):
+        """Test that URL variants of the same company share one key."""
+        variants = [
+            "https://www.linkedin.com/company/Acme/",
+            "http://linkedin.com/company/acme",
+            "www.linkedin.com/company/acme/?trk=nav",
+        ]
+        self.assertEqual({CompanyIdCache.normalize_url(v) for v in variants}, {"linkedin.com/company/acme"})
+
+    def test_hit_miss_and_ttl(self):
+        """Test hits, misses, negative entries and expiry."""
+        self.assertEqual(self.cache.get("https://www.linkedin.com/company/acme/"), (False, None))
+        self.cache.set("https://www.linkedin.com/company/acme/", 123)
+        self.cache.set("https://www.linkedin.com/company/gone/", None)
+
+        self.assertEqual(self.cache.get("linkedin.com/company/acme"), (True, "123"))
+        self.assertEqual(self.cache.get("https://www.linkedin.com/company/gone"), (True, None))
+
+        import time
+        with patch('time.time', return_value=time.time() + 50):
+            # Negative entries expire sooner than resolved ones
+            self.assertEqual(self.cache.get("https://www.linkedin.com/company/gone"), (False, None))
+            self.assertEqual(self.cache.get("https://www.linkedin.com/company/acme"), (True, "123"))
+
+        self.assertEqual(self.cache.stats, {"hits": 2, "negative_hits": 1, "misses": 2})
+
+    def test_persists_across_instances(self):
+        """Test that entries survive reopening the database file."""
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "ids.sqlite3")
+            first = CompanyIdCache(path)
+            first.set("https://www.linkedin.com/company/acme/", "42")
+            first.close()
+
+            second = CompanyIdCache(path)
+            self.assertEqual(second.get("https://www.linkedin.com/company/acme/"), (True, "42"))
+            second.close()
+
+    def test_extractor_consults_cache(self):
+        """Test that the extractor only calls the company endpoint on a cache miss."""
+        extractor = LinkedInDecisionMakerExtractor("test_api_key", company_id_cache=self.cache)
+        with patch.object(extractor, 'get_company_data', return_value={"id": "12345"}) as mock_company:
+            self.assertEqual(extractor.resolve_company_id("https://www.linkedin.com/company/acme/"), "12345")
+            self.assertEqual(extractor.resolve_company_id("https://linkedin.com/company/acme"), "12345")
+        mock_company.assert_called_once()
+
+    def test_extractor_caches_not_found(self):
+        """Test that a 404 from the company endpoint is cached as unresolved."""
+        extractor = LinkedInDecisionMakerExtractor("test_api_key", company_id_cache=self.cache)
+        not_found = requests.exceptions.HTTPError(response=MagicMock(status_code=404))
+        with patch.object(extractor, 'get_company_data', side_effect=not_found) as mock_company:
+            with self.assertRaises(requests.exceptions.HTTPError):
+                extractor.resolve_company_id("https://www.linkedin.com/company/gone/")
+            self.assertIsNone(extractor.resolve_company_id("https://www.linkedin.com/company/gone/"))
+        mock_company.assert_called_once()
+
+
+class TestTitleMatcher(unittest.TestCase):
+
+    def test_match_reports_keyword(self):
+        """Test that the matcher reports which keyword classified the title."""
+        matcher = TitleMatcher.for_keywords()
+        self.assertEqual(matcher.match("Senior Director of Engineering"), "Director")
+        self.assertEqual(matcher.match("Vice President, Sales"), "Vice President")
+        self.assertEqual(matcher.match("cto & co-founder"), "CTO")
+        self.assertIsNone(matcher.match("Software Engineer"))
+        self.assertIsNone(matcher.match(None))
+
+    def test_acronyms_match_whole_words_only(self):
+        """Test that C-suite acronyms do not match inside longer words."""
+        matcher = TitleMatcher.for_keywords()
+        self.assertIsNone(matcher.match("Project Coordinator"))
+        self.assertIsNone(matcher.match("Technical Recruiter, Cisco"))
+        self.assertTrue(matcher.is_decision_maker("COO"))
+
+    def test_same_results_as_substring_scan(self):
+        """Test that keyword matching agrees with the plain per-keyword substring scan."""
+        titles = ["CEO", "Office Manager", "Executive Assistant", "Intern", "Head of People",
+                  "Managing Partner", "svp", "Engineer", "Owner/Operator", ""]
+        # The uncached matcher takes a shorter path in is_decision_maker
+        for matcher in (TitleMatcher(acronyms=()), TitleMatcher(acronyms=(), cache_size=0)):
+            for title in titles:
+                expected = any(k.lower() in title.lower() for k in matcher.keywords)
+                self.assertEqual(matcher.is_decision_maker(title), expected, title)
+
+    def test_compiled_once_per_keyword_set(self):
+        """Test that matchers are shared per keyword set."""
+        self.assertIs(TitleMatcher.for_keywords(), TitleMatcher.for_keywords())
+        custom = TitleMatcher.for_keywords(("Lead",), ())
+        self.assertIsNot(custom, TitleMatcher.for_keywords())
+        self.assertEqual(custom.match("Team Lead"), "Lead")
+
+    def test_whitespace_variants_match(self):
+        """Test that multi-word keywords match across irregular whitespace."""
+        matcher = TitleMatcher()
+        self.assertEqual(matcher.match("Head   of\tPeople"), "Head of")
+
+    def test_title_cache_counts_hits(self):
+        """Test that repeated titles are served from the bounded cache."""
+        matcher = TitleMatcher(cache_size=2)
+        for title in ["CEO", "CEO", "Engineer", "CEO", "Engineer"]:
+            matcher.is_decision_maker(title)
+
+        stats = matcher.cache_stats
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (3, 2, 2))
+        self.assertAlmostEqual(stats["hit_rate"], 0.6)
+
+        # A third distinct title evicts the least recently used one
+        matcher.is_decision_maker("Founder")
+        self.assertEqual(matcher.cache_stats["size"], 2)
+
+        matcher.clear_cache()
+        self.assertEqual(matcher.cache_stats["hits"], 0)
+
+    def test_title_cache_disabled(self):
+        """Test that a zero cache size still classifies titles."""
+        matcher = TitleMatcher(cache_size=0)
+        self.assertTrue(matcher.is_decision_maker("Director"))
+        self.assertEqual(matcher.cache_stats["hits"], 0)
+
+    def test_title_cache_shared_across_extractors(self):
+        """Test that extractors share the default matcher and therefore its cache."""
+        first = LinkedInDecisionMakerExtractor("key_a")
+        second = LinkedInDecisionMakerExtractor("key_b")
+        self.assertIs(first.title_matcher, second.title_matcher)
+
+    def test_extractor_uses_injected_matcher(self):
+        """Test that filtering goes through the configured matcher."""
+        extractor = LinkedInDecisionMakerExtractor("test_api_key", title_matcher=TitleMatcher(("Lead",), ()))
+        employees = [{"title": "Team Lead"}, {"title": "CEO"}, {"id": "no-title"}]
+        self.assertEqual(extractor.filter_decision_makers(employees), [{"title": "Team Lead"}])
+
+
+class TestRecordWriters(unittest.TestCase):
+
+    def setUp(self):
+        import tempfile
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = lambda name: os.path.join(self.tmp.name, name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_json_writer_matches_json_dump(self):
+        """Test that the streaming JSON writer produces the same file as json.dump(indent=4)."""
+        records = [{"id": "e1", "tags": ["a", "b"], "extra": {"x": None}}, {"id": "e2"}]
+        for data in (records, []):
+            with JsonRecordWriter(self.path("out.json")) as writer:
+                writer.write_many(iter(data))
+            with open(self.path("out.json")) as f:
+                self.assertEqual(f.read(), json.dumps(data, indent=4))
+
+    def test_csv_writer_header_from_sample(self):
+        """Test that the CSV header is the union of keys seen in the first records."""
+        records = ({"id": i, "title": "CEO"} if i else {"id": i, "name": "first"} for i in range(5))
+        with CsvRecordWriter(self.path("out.csv"), sample_size=2) as writer:
+            self.assertEqual(writer.write_many(records), 5)
+        with open(self.path("out.csv")) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[0], "id,name,title")
+        self.assertEqual(lines[1:3], ["0,first,", "1,,CEO"])
+        self.assertEqual(len(lines), 6)
+
+    def test_csv_writer_warns_once_per_dropped_key(self):
+        """Test that keys missing from the sampled header are reported once each."""
+        records = [{"id": 0}, {"id": 1, "email": "a"}, {"id": 2, "email": "b", "phone": "c"}]
+        with self.assertLogs(logger, level='WARNING') as cm:
+            with CsvRecordWriter(self.path("out.csv"), sample_size=1) as writer:
+                writer.write_many(records)
+        self.assertEqual(len(cm.output), 2)
+        self.assertIn("'email'", cm.output[0])
+        self.assertIn("'phone'", cm.output[1])
+        with open(self.path("out.csv")) as f:
+            self.assertEqual(f.read(), "id\n0\n1\n2\n")
+
+    def test_csv_writer_declared_schema(self):
+        """Test that declared fieldnames fix the column order and drop unknown keys."""
+        with CsvRecordWriter(self.path("out.csv"), fieldnames=["title", "id"]) as writer:
+            writer.write({"id": "e1", "title": "CEO", "ignored": 1})
+        with open(self.path("out.csv")) as f:
+            self.assertEqual(f.read(), "title,id\nCEO,e1\n")
+
+    def test_jsonl_writer(self):
+        """Test writing one JSON object per line."""
+        with JsonLinesRecordWriter(self.path("out.jsonl")) as writer:
+            writer.write_many([{"id": "e1"}, {"id": "e2"}])
+        with open(self.path("out.jsonl")) as f:
+            self.assertEqual([json.loads(line) for line in f], [{"id": "e1"}, {"id": "e2"}])
+
+    def test_savers_consume_generator(self):
+        """Test that the extractor's savers accept a lazy iterable."""
+        extractor = LinkedInDecisionMakerExtractor("test_api_key")
+        count = extractor.save_to_jsonl(({"id": i} for i in range(3)), self.path("out.jsonl"))
+        self.assertEqual(count, 3)
+
+
+class TestImportTime(unittest.TestCase):
+    """Guard CLI start-up latency by parsing `python -X importtime` output."""
+
+    HEAVY_MODULES = ("pandas", "numpy", "aiohttp", "asyncio")
+    # Generous budget in microseconds; a cold import is ~150 ms on a developer laptop
+    IMPORT_BUDGET_US = 1_500_000
+
+    def import_times(self, module):
+        import subprocess
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True
+        )
+        times = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|")
+            times[name.strip()] = int(cumulative)
+        return times
+
+    def test_heavy_dependencies_not_imported(self):
+        """Test that importing the library or the CLI does not load pandas, aiohttp or asyncio."""
+        for module in ("linkedin_decision_maker_extractor", "cli"):
+            times = self.import_times(module)
+            self.assertIn(module, times)
+            for heavy in self.HEAVY_MODULES:
+                self.assertNotIn(heavy, times, f"importing {module} loads {heavy}")
+
+    def test_import_within_budget(self):
+        """Test that the cumulative import time of the CLI stays within budget."""
+        times = self.import_times("cli")
+        self.assertLess(times["cli"], self.IMPORT_BUDGET_US)
+
+class TestLogging(unittest.TestCase):
+
+    def setUp(self):
+        import tempfile
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = logging.getLogger()
+        self.saved = (self.root.handlers[:], self.root.level)
+
+    def tearDown(self):
+        listener = configure_logging(log_file=None, use_queue=True)
+        listener.stop()
+        for handler in self.root.handlers:
+            handler.close()
+        self.root.handlers[:], self.root.level = self.saved[0], self.saved[1]
+        self.tmp.cleanup()
+
+    def test_import_does_not_create_log_file(self):
+        """Test that importing the module has no logging side effects in the working directory."""
+        import subprocess
+        module_dir = os.path.dirname(os.path.abspath(__file__))
+        subprocess.run([sys.executable, "-c", "import linkedin_decision_maker_extractor"], cwd=self.tmp.name,
+                       env=dict(os.environ, PYTHONPATH=module_dir), check=True)
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    @patch('sys.stderr')
+    def test_queue_logging_to_rotating_file(self, mock_stderr):
+        """Test that queued records reach a rotating log file whose size is capped."""
+        log_file = os.path.join(self.tmp.name, "extractor.log")
+        listener = configure_logging(log_file=log_file, max_bytes=2000, backup_count=2)
+        self.assertIsInstance(self.root.handlers[0], logging.handlers.QueueHandler)
+
+        for i in range(200):
+            logger.info(f"message {i:03d}")
+        listener.stop()
+
+        files = sorted(os.listdir(self.tmp.name))
+        self.assertEqual(files, ["extractor.log", "extractor.log.1", "extractor.log.2"])
+        for name in files:
+            self.assertLessEqual(os.path.getsize(os.path.join(self.tmp.name, name)), 2000)
+        with open(log_file) as f:
+            self.assertTrue(f.read().splitlines()[-1].endswith("- linkedin_decision_maker_extractor - INFO - message 199"))
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_response_body_truncated_in_logs(self, mock_get, mock_sleep):
+        """Test that large response bodies are cut short in retry warnings."""
+        mock_response = MagicMock()
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=MagicMock(status_code=500, text="x" * 100000)
+        )
+        mock_get.return_value = mock_response
+        extractor = LinkedInDecisionMakerExtractor("test_api_key", rate_limiter=TokenBucketRateLimiter(rate=1e6, burst=10**6))
+
+        with self.assertLogs(logger, level='WARNING') as cm:
+            with self.assertRaises(requests.exceptions.HTTPError):
+                extractor._make_request("test_endpoint")
+
+        self.assertTrue(all(len(msg) < 1000 for msg in cm.output))
+        self.assertTrue(any("more characters" in msg for msg in cm.output))
+
+class TestCheckpointStore(unittest.TestCase):
+
+    def setUp(self):
+        import tempfile
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = CheckpointStore(self.tmp.name, fsync=False)
+        self.pages = {page: [{"id": f"{page}-{i}", "title": "CEO" if i == 0 else "Engineer"} for i in range(100)]
+                      for page in range(1, 5)}
+        self.pages[5] = [{"id": "5-0", "title": "Head of Sales"}]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def fetch(self, company_id, page, page_size):
+        self.fetched.append(page)
+        return self.pages.get(page, [])
+
+    def test_append_and_load(self):
+        """Test that pages round-trip and must be appended in order."""
+        self.assertEqual(self.store.load("123"), ([], False))
+        self.store.append_page("123", 1, self.pages[1])
+        self.store.append_page("123", 2, self.pages[2])
+        with self.assertRaises(ValueError):
+            self.store.append_page("123", 4, self.pages[4])
+
+        self.assertEqual(self.store.load("123"), ([self.pages[1], self.pages[2]], False))
+        self.store.mark_complete("123")
+        self.assertEqual(self.store.load("123")[1], True)
+
+        self.store.clear("123")
+        self.assertEqual(self.store.load("123"), ([], False))
+
+    def test_torn_write_is_ignored(self):
+        """Test that bytes written after the last recorded page are dropped, as after a crash."""
+        self.store.append_page("123", 1, self.pages[1])
+        with open(os.path.join(self.tmp.name, "123.pages.jsonl"), "ab") as f:
+            f.write(b'[{"id": "2-0", "ti')
+
+        self.assertEqual(self.store.load("123"), ([self.pages[1]], False))
+        self.store.append_page("123", 2, self.pages[2])
+        self.assertEqual(self.store.load("123"), ([self.pages[1], self.pages[2]], False))
+
+    def test_extractor_resumes_from_checkpoint(self):
+        """Test that a rerun only fetches pages after the checkpoint, and a finished scan fetches nothing."""
+        for prefetch_window in (1, 3):
+            with self.subTest(prefetch_window=prefetch_window):
+                self.store.clear()
+                extractor = LinkedInDecisionMakerExtractor("test_api_key", checkpoint_store=self.store,
+                                                           prefetch_window=prefetch_window)
+                with patch.object(extractor, 'get_company_employees', side_effect=self.fetch):
+                    # A run that dies after two pages
+                    self.fetched = []
+                    pages = extractor.iter_company_employee_pages("123")
+                    next(pages), next(pages)
+                    pages.close()
+
+                    self.fetched = []
+                    employees = extractor.get_all_company_employees("123")
+                    self.assertEqual(employees, [e for page in range(1, 6) for e in self.pages[page]])
+                    self.assertEqual(min(self.fetched), 3)
+
+                    self.fetched = []
+                    self.assertEqual(extractor.get_all_company_employees("123"), employees)
+                    self.assertEqual(self.fetched, [])
+
+    def test_failed_page_keeps_checkpoint_incomplete(self):
+        """Test that a page failing after its retries neither ends nor completes the scan."""
+        url = "https://www.linkedin.com/company/test/"
+        for prefetch_window in (1, 3):
+            with self.subTest(prefetch_window=prefetch_window):
+                self.store.clear()
+                extractor = LinkedInDecisionMakerExtractor("test_api_key", checkpoint_store=self.store,
+                                                           prefetch_window=prefetch_window)
+                extractor.company_id_cache = None
+                failing = {3}
+
+                def make_request(endpoint, params=None, method="GET"):
+                    if endpoint == "company":
+                        return {"id": "123"}
+                    if params["page"] in failing:
+                        raise requests.exceptions.ConnectionError("connection reset")
+                    return {"results": self.pages.get(params["page"], [])}
+
+                with patch.object(extractor, '_make_request', side_effect=make_request):
+                    with self.assertLogs(logger, level='ERROR'):
+                        self.assertEqual(extractor.extract_decision_makers(url), [])
+                    self.assertEqual(self.store.load("123"), ([self.pages[1], self.pages[2]], False))
+
+                    failing.clear()
+                    decision_makers = extractor.extract_decision_makers(url)
+                self.assertEqual([d["id"] for d in decision_makers], ["1-0", "2-0", "3-0", "4-0", "5-0"])
+                # Results were handed over, so the next run starts fresh
+                self.assertEqual(self.store.load("123"), ([], False))
+
+    def test_async_extractor_resumes_from_checkpoint(self):
+        """Test that the async extractor reads and writes the same checkpoints."""
+        self.store.append_page("123", 1, self.pages[1])
+        self.store.append_page("123", 2, self.pages[2])
+        extractor = AsyncLinkedInDecisionMakerExtractor("test_api_key", checkpoint_store=self.store)
+        self.fetched = []
+
+        async def fetch(company_id, page, page_size):
+            return self.fetch(company_id, page, page_size)
+
+        with patch.object(extractor, 'get_company_employees', side_effect=fetch):
+            employees = asyncio.run(extractor.get_all_company_employees("123"))
+
+        self.assertEqual(len(employees), 401)
+        self.assertEqual(self.fetched, [3, 4, 5])
+        self.assertEqual(self.store.load("123"), ([self.pages[page] for page in range(1, 6)], True))
+
+class TestSnapshotStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = SnapshotStore(":memory:")
+        self.url = "https://www.linkedin.com/company/test-company/"
+        self.records = [
+            {"id": "e1", "firstName": "John", "title": "CEO"},
+            {"id": "e2", "firstName": "Jane", "title": "CTO"},
+            {"id": "e3", "firstName": "Alice", "title": "Director of Marketing"},
+        ]
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_diff_reports_added_changed_removed(self):
+        """Test that only added, changed and removed people are reported."""
+        self.assertEqual([r["change"] for r in self.store.diff(self.url, self.records)], ["added"] * 3)
+        self.store.save(self.url, self.records)
+        # Key order and URL spelling do not matter
+        reordered = [dict(reversed(list(r.items()))) for r in self.records]
+        self.assertEqual(self.store.diff("linkedin.com/company/test-company", reordered), [])
+
+        latest = [
+            {"id": "e1", "firstName": "John", "title": "CEO"},
+            {"id": "e2", "firstName": "Jane", "title": "CTO and Co-Founder"},
+            {"id": "e4", "firstName": "Bob", "title": "VP Sales"},
+        ]
+        changes = self.store.diff(self.url, latest)
+        self.assertEqual([(r["id"], r["change"]) for r in changes], [("e2", "changed"), ("e4", "added"), ("e3", "removed")])
+        self.assertEqual(changes[2]["title"], "Director of Marketing")
+
+    @patch('builtins.print')
+    def test_run_batch_delta_skips_unchanged(self, mock_print):
+        """Test that delta mode writes changes only and nothing for unchanged or failed companies."""
+        import cli
+        extractor = MagicMock()
+        extractor.extract_many.side_effect = lambda urls, max_workers: (
+            (url, extractor.extract_decision_makers(url)) for url in urls)
+        extractor.extract_decision_makers.return_value = self.records
+        args = argparse.Namespace(concurrency=1, combined=False, output="out", format="json")
+
+        cli.run_batch(extractor, [self.url], args, "ts", self.store)
+        self.assertEqual(len(extractor.save_to_json.call_args[0][0]), 3)
+
+        extractor.save_to_json.reset_mock()
+        cli.run_batch(extractor, [self.url], args, "ts", self.store)
+        extractor.extract_decision_makers.return_value = []
+        cli.run_batch(extractor, [self.url], args, "ts", self.store)
+        extractor.save_to_json.assert_not_called()
+
+        extractor.extract_decision_makers.return_value = self.records[:2]
+        cli.run_batch(extractor, [self.url], args, "ts", self.store)
+        self.assertEqual(extractor.save_to_json.call_args[0][0], [dict(self.records[2], change="removed")])
+        self.assertEqual(len(self.store.load(self.url)), 2)
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = ResponseCache(":memory:", max_bytes=100)
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_lookup_store_and_hit(self):
+        """Test that validators are returned as conditional headers and 304s are counted."""
+        key = ResponseCache.key("https://api/company", {"b": 2, "a": 1})
+        self.assertEqual(key, ResponseCache.key("https://api/company", {"a": "1", "b": "2"}))
+        self.assertEqual(self.cache.lookup(key), ({}, None))
+
+        self.cache.store(key, {}, b"no validators")
+        self.assertEqual(self.cache.lookup(key), ({}, None))
+
+        self.cache.store(key, {"ETag": '"v1"', "Last-Modified": "Mon, 05 Oct 2026 10:00:00 GMT"}, b'{"id": 1}')
+        headers, body = self.cache.lookup(key)
+        self.assertEqual(headers, {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 05 Oct 2026 10:00:00 GMT"})
+        self.cache.hit(key, body)
+        self.assertEqual(self.cache.stats, {"hits": 1, "misses": 2, "stores": 1, "evictions": 0,
+                                            "bytes_saved": 9, "size": 9})
+
+    def test_lru_eviction_bounds_size(self):
+        """Test that the least recently used responses are evicted once max_bytes is exceeded."""
+        for name in "abc":
+            self.cache.store(name, {"ETag": name}, b"x" * 40)
+        self.cache.hit("b", b"x" * 40)
+        self.cache.store("d", {"ETag": "d"}, b"x" * 40)
+
+        self.assertEqual([name for name in "abcd" if self.cache.lookup(name)[1] is not None], ["b", "d"])
+        self.assertEqual(self.cache.stats["evictions"], 2)
+        self.assertLessEqual(self.cache.stats["size"], 100)
+
+    def test_extractors_send_conditional_requests(self):
+        """Test that sync and async extractors revalidate cached responses and serve 304 bodies."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        import threading
+        seen = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                seen.append(self.headers.get("If-None-Match"))
+                if self.headers.get("If-None-Match") == '"v1"':
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                body = json.dumps({"id": "12345"}).encode("utf-8")
+                self.send_response(200)
+                self.send_header("ETag", '"v1"')
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        limiter = TokenBucketRateLimiter(rate=1e6, burst=10**6)
+        cache = ResponseCache(":memory:")
+        try:
+            with LinkedInDecisionMakerExtractor("test_api_key", rate_limiter=limiter, response_cache=cache) as extractor:
+                extractor.base_url = base_url
+                self.assertEqual(extractor._make_request("company", {"link": "x"}), {"id": "12345"})
+                self.assertEqual(extractor._make_request("company", {"link": "x"}), {"id": "12345"})
+
+            async def run_async():
+                extractor = AsyncLinkedInDecisionMakerExtractor("test_api_key", rate_limiter=limiter, response_cache=cache)
+                extractor.base_url = base_url
+                try:
+                    return await extractor._make_request("company", {"link": "x"})
+                finally:
+                    await extractor.close()
+
+            self.assertEqual(asyncio.run(run_async()), {"id": "12345"})
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(seen, [None, '"v1"', '"v1"'])
+        self.assertEqual(cache.stats["hits"], 2)
+
+class TestFakeAPIServer(unittest.TestCase):
+    """End-to-end extraction against the fake LinkedIn API used by the benchmarks."""
+
+    def setUp(self):
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks"))
+        from stub_server import StubServer
+        self.StubServer = StubServer
+        self.url = "https://www.linkedin.com/company/test-company/"
+
+    def tearDown(self):
+        sys.path.pop(0)
+
+    def extract(self, server, prefetch_window=1):
+        limiter = TokenBucketRateLimiter(rate=1e6, burst=10**6)
+        with LinkedInDecisionMakerExtractor("test_api_key", rate_limiter=limiter, prefetch_window=prefetch_window) as extractor:
+            extractor.base_url = server.base_url
+            extractor.retry_delay = 0
+            return extractor.extract_decision_makers(self.url)
+
+    def test_sync_and_prefetched_extraction(self):
+        """Test that paging through the fake API returns every decision maker in order."""
+        with self.StubServer(employees_per_company=250) as server:
+            company_id = server.company(self.url)["id"]
+            employees = [e for page in (1, 2, 3) for e in server.employees(company_id, page, 100)]
+            expected = LinkedInDecisionMakerExtractor("test_api_key").filter_decision_makers(employees)
+
+            self.assertEqual(len(employees), 250)
+            self.assertTrue(expected)
+            self.assertEqual(self.extract(server), expected)
+            self.assertEqual(self.extract(server, prefetch_window=4), expected)
+
+    @patch('time.sleep')
+    def test_injected_429s_and_errors_are_retried(self, mock_sleep):
+        """Test that injected 429s and 500s are counted by the server and retried by the extractor."""
+        with self.StubServer(employees_per_company=100, rate_limit_rate=0.3, error_rate=0.2, seed=3) as server:
+            with self.assertLogs(logger, level='WARNING'):
+                decision_makers = self.extract(server)
+
+        self.assertGreater(server.stats["rate_limited"] + server.stats["errors"], 0)
+        self.assertTrue(decision_makers)
+
+class TestSyntheticData(unittest.TestCase):
+
+    def setUp(self):
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks"))
+        import synthetic_data
+        self.synthetic_data = synthetic_data
+
+    def tearDown(self):
+        sys.path.pop(0)
+
+    def test_generator_is_seeded_and_skewed(self):
+        """Test that equal seeds give equal records with the requested decision maker share."""
+        generate = self.synthetic_data.generate_employees
+        records = list(generate(20000, seed=5, decision_maker_share=0.1))
+
+        self.assertEqual(records, list(generate(20000, seed=5, decision_maker_share=0.1)))
+        self.assertNotEqual(records, list(generate(20000, seed=6, decision_maker_share=0.1)))
+        self.assertEqual(records[-1]["id"], "1000-19999")
+        self.assertEqual(next(generate(1, company_id="7", first_index=300))["id"], "7-300")
+
+        matcher = TitleMatcher()
+        share = sum(matcher.is_decision_maker(r["title"]) for r in records) / len(records)
+        self.assertAlmostEqual(share, 0.1, delta=0.01)
+        self.assertTrue(any(r["title"] is None for r in records))
+
+    def test_jsonl_output(self):
+        """Test that the CLI writes the same records as the library function."""
+        import io
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "employees.jsonl")
+            with patch('sys.stderr', io.StringIO()):
+                self.synthetic_data.main(["--count", "250", "--seed", "3", "--output", path])
+            with open(path) as f:
+                records = [json.loads(line) for line in f]
+        self.assertEqual(records, list(self.synthetic_data.generate_employees(250, seed=3)))
+
+class TestExtractMany(unittest.TestCase):
+
+    def setUp(self):
+        self.limiter = InFlightLimiter(3)
+        self.extractor = LinkedInDecisionMakerExtractor(
+            "test_api_key", rate_limiter=TokenBucketRateLimiter(rate=1e6, burst=10**6), in_flight_limiter=self.limiter
+        )
+
+    def test_results_yielded_as_completed(self):
+        """Test that a slow company does not hold back the ones that finish first."""
+        import time
+
+        def extract(company_url):
+            time.sleep(0.3 if "slow" in company_url else 0.01)
+            return [{"id": company_url}]
+
+        with patch.object(self.extractor, 'extract_decision_makers', side_effect=extract):
+            urls = [f"https://www.linkedin.com/company/{name}/" for name in ("slow", "a", "b", "c")]
+            results = list(self.extractor.extract_many(urls, max_workers=4))
+
+        self.assertEqual(results[-1][0], urls[0])
+        self.assertEqual(sorted(results), sorted((url, [{"id": url}]) for url in urls))
+
+    @patch('requests.Session.get')
+    def test_in_flight_cap_is_shared(self, mock_get):
+        """Test that concurrent requests never exceed the in-flight cap, whatever the worker count."""
+        import threading
+        import time
+        active = []
+        lock = threading.Lock()
+
+        def get(*args, **kwargs):
+            with lock:
+                active.append(self.limiter.in_flight)
+            time.sleep(0.02)
+            response = MagicMock()
+            response.json.return_value = {"id": "12345", "results": [{"id": "e1", "title": "CEO"}]}
+            return response
+
+        mock_get.side_effect = get
+        urls = [f"https://www.linkedin.com/company/{i}/" for i in range(12)]
+        results = dict(self.extractor.extract_many(urls, max_workers=8))
+
+        self.assertEqual(len(results), 12)
+        self.assertLessEqual(max(active), 3)
+        self.assertEqual(self.limiter.peak_in_flight, 3)
+        self.assertEqual(self.limiter.in_flight, 0)
+
+    def test_defaults_fit_the_connection_pool(self):
+        """Test that the default pool covers the in-flight cap, so default workers never outgrow it."""
+        for prefetch_window in (1, 3):
+            extractor = LinkedInDecisionMakerExtractor("test_api_key", prefetch_window=prefetch_window,
+                                                       in_flight_limiter=InFlightLimiter(16))
+            self.assertEqual(extractor.pool_maxsize, 16)
+            with patch.object(extractor, 'extract_decision_makers', return_value=[]), \
+                 patch.object(logger, 'warning') as mock_warning:
+                list(extractor.extract_many(["https://www.linkedin.com/company/a/"]))
+            mock_warning.assert_not_called()
+
+        # With a smaller explicit pool, the default worker count shrinks to fit it
+        with patch.object(self.extractor, 'pool_maxsize', 2), \
+             patch.object(self.extractor, 'extract_decision_makers', return_value=[]), \
+             patch.object(logger, 'warning') as mock_warning:
+            list(self.extractor.extract_many(["https://www.linkedin.com/company/a/"]))
+        mock_warning.assert_not_called()
+
+    def test_default_in_flight_limiter_is_shared_per_api_key(self):
+        """Test that extractors using the same API key share one in-flight cap."""
+        first = LinkedInDecisionMakerExtractor("shared_key")
+        second = LinkedInDecisionMakerExtractor("shared_key")
+        self.assertIs(first.in_flight_limiter, second.in_flight_limiter)
+        self.assertIs(first.in_flight_limiter, InFlightLimiter.for_key("shared_key"))
+
+class TestApiKeyPool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = ApiKeyPool(["pool_key_a", "pool_key_b", "pool_key_c"], rate=1e6, burst=10**6)
+
+    def test_requests_spread_over_least_loaded_keys(self):
+        """Test that concurrent requests are spread over every key before any key gets a second one."""
+        keys = [self.pool.acquire() for _ in range(3)]
+        self.assertEqual(sorted(keys), self.pool.api_keys)
+        self.pool.release("pool_key_b")
+        self.assertEqual(self.pool.acquire(), "pool_key_b")
+
+    def test_prefers_key_with_most_remaining_quota(self):
+        """Test that idle keys are ranked by the X-RateLimit-Remaining they last reported."""
+        self.pool.update("pool_key_a", {"X-RateLimit-Remaining": "5"}, throttled=False)
+        self.pool.update("pool_key_b", {"X-RateLimit-Remaining": "50"}, throttled=False)
+        self.pool.update("pool_key_c", {"X-RateLimit-Remaining": "10"}, throttled=False)
+        self.assertEqual(self.pool.acquire(), "pool_key_b")
+
+    def test_throttled_key_cools_down(self):
+        """Test that a 429 sidelines only that key and the retry can go out at once on another."""
+        wait = self.pool.update("pool_key_a", {"Retry-After": "30"}, throttled=True)
+
+        self.assertEqual(wait, 0.0)
+        used = {self.pool.acquire() for _ in range(10)}
+        self.assertEqual(used, {"pool_key_b", "pool_key_c"})
+        stats = self.pool.stats
+        self.assertEqual(stats["pool_key_a"]["throttled"], 1)
+        self.assertGreater(stats["pool_key_a"]["cooldown"], 29)
+
+    def test_wait_when_every_key_is_cooling_down(self):
+        """Test that the retry delay is the time until the first key recovers."""
+        self.pool.update("pool_key_a", {"Retry-After": "30"}, throttled=True)
+        self.pool.update("pool_key_b", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "20"}, throttled=False)
+        wait = self.pool.update("pool_key_c", {}, throttled=True)
+
+        self.assertAlmostEqual(wait, self.pool.default_cooldown, delta=0.5)
+
+    def test_requires_a_key(self):
+        """Test that an empty pool is rejected."""
+        with self.assertRaises(ValueError):
+            ApiKeyPool([])
+
+    @patch('requests.Session.get')
+    def test_extractor_retries_429_on_another_key(self, mock_get):
+        """Test that the extractor authenticates with the pooled key and moves off a throttled one."""
+        throttled = MagicMock(status_code=429, headers={"Retry-After": "60"}, text="Too Many Requests")
+        throttled.raise_for_status.side_effect = requests.exceptions.HTTPError(response=throttled)
+        ok = MagicMock(status_code=200, headers={})
+        ok.json.return_value = {"id": "12345"}
+        mock_get.side_effect = [throttled, ok]
+        extractor = LinkedInDecisionMakerExtractor(key_pool=self.pool)
+
+        with patch('time.sleep') as mock_sleep:
+            self.assertEqual(extractor._make_request("company", {"link": "x"}), {"id": "12345"})
+
+        mock_sleep.assert_not_called()
+        first, second = (call.kwargs["headers"]["Authorization"] for call in mock_get.call_args_list)
+        self.assertEqual(first, "Bearer pool_key_a")
+        self.assertNotEqual(second, first)
+        self.assertEqual(extractor.api_key, "pool_key_a")
+        self.assertTrue(all(stats["in_flight"] == 0 for stats in self.pool.stats.values()))
+
+class _FakeProcessExtractor:
+    """Picklable stand-in for an extractor built inside a worker process."""
+
+    def extract_many(self, company_urls):
+        for company_url in company_urls:
+            yield company_url, [{"id": f"{company_url}-1", "title": "CEO"}, {"id": f"{company_url}-2", "title": None},
+                                {"name": "no id", "title": "Founder", "pid": os.getpid()}]
+
+
+class _LoggingProcessExtractor(_FakeProcessExtractor):
+    """Fake worker extractor that logs the process it ran in."""
+
+    def extract_many(self, company_urls):
+        logging.getLogger("linkedin_decision_maker_extractor").warning(f"worker {os.getpid()} got a batch")
+        return super().extract_many(company_urls)
+
+
+def _acquire_from_shared_limiter(limiter, count):
+    for _ in range(count):
+        limiter.acquire()
+
+
+class TestProcessSharding(unittest.TestCase):
+
+    def test_results_round_trip_through_compact_batches(self):
+        """Test that records with differing fields survive encoding unchanged and keys are not repeated."""
+        from linkedin_decision_maker_extractor import _decode_results, _encode_results
+        records = [{"id": str(i), "firstName": "A", "title": "CEO"} for i in range(50)]
+        records.append({"id": "x", "title": None, "extra": [1, 2]})
+        results = [("https://www.linkedin.com/company/a/", records), ("https://www.linkedin.com/company/b/", [])]
+
+        payload = _encode_results(results)
+
+        self.assertIsInstance(payload, bytes)
+        self.assertEqual(_decode_results(payload), results)
+        self.assertEqual(payload.count(b"firstName"), 1)
+
+    def test_shared_limiter_budget_spans_processes(self):
+        """Test that processes drawing from one ProcessSharedRateLimiter share its rate."""
+        import multiprocessing
+        import time
+        limiter = ProcessSharedRateLimiter(rate=20, burst=1)
+        workers = [multiprocessing.Process(target=_acquire_from_shared_limiter, args=(limiter, 4)) for _ in range(2)]
+
+        start = time.monotonic()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=10)
+        elapsed = time.monotonic() - start
+
+        self.assertTrue(all(worker.exitcode == 0 for worker in workers))
+        # 8 tokens at 20/s with one token up front take at least 7/20 s
+        self.assertGreaterEqual(elapsed, 0.3)
+
+    def test_extract_many_in_processes(self):
+        """Test that every company comes back once from the worker processes."""
+        urls = [f"https://www.linkedin.com/company/{i}/" for i in range(9)]
+
+        results = dict(extract_many_in_processes(urls, _FakeProcessExtractor, processes=2, batch_size=2))
+
+        self.assertEqual(sorted(results), sorted(urls))
+        self.assertEqual(results[urls[0]][:2], [{"id": f"{urls[0]}-1", "title": "CEO"},
+                                                {"id": f"{urls[0]}-2", "title": None}])
+        self.assertNotIn(os.getpid(), {records[2]["pid"] for records in results.values()})
+
+    def test_worker_log_records_reach_the_parent_handlers(self):
+        """Test that worker log lines are written by the parent's queued logging setup."""
+        import tempfile
+        from linkedin_decision_maker_extractor import configure_logging
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        log_file = os.path.join(tempfile.mkdtemp(), "extractor.log")
+        urls = [f"https://www.linkedin.com/company/{i}/" for i in range(6)]
+
+        listener = configure_logging(logging.INFO, log_file, use_queue=True)
+        try:
+            results = dict(extract_many_in_processes(urls, _LoggingProcessExtractor, processes=2, batch_size=1))
+        finally:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+            root.handlers[:] = saved_handlers
+            root.setLevel(saved_level)
+
+        self.assertEqual(sorted(results), sorted(urls))
+        with open(log_file, encoding="utf-8") as f:
+            lines = [line for line in f if "got a batch" in line]
+        self.assertEqual(len(lines), len(urls))
+        self.assertNotIn(f"worker {os.getpid()} ", "".join(lines))
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def setUp(self):
+        self.extractor = LinkedInDecisionMakerExtractor(
+            "test_api_key", rate_limiter=TokenBucketRateLimiter(rate=1e6, burst=10**6)
+        )
+        self.extractor.retry_attempts = 5
+        error = MagicMock()
+        error.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=MagicMock(status_code=500, text="Server Error", headers={})
+        )
+        patcher = patch('requests.Session.get', return_value=error)
+        self.mock_get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_backoff_strategies(self):
+        """Test that jittered delays stay within their bounds and the cap."""
+        from linkedin_decision_maker_extractor import _backoff_delay
+        self.assertEqual([_backoff_delay("exponential", 2, attempt, 0, 60) for attempt in (1, 2, 6)], [4, 8, 60])
+        for _ in range(200):
+            self.assertTrue(0 <= _backoff_delay("full_jitter", 2, 3, 0, 60) <= 16)
+            self.assertTrue(2 <= _backoff_delay("decorrelated_jitter", 2, 3, 5, 60) <= 15)
+            self.assertLessEqual(_backoff_delay("decorrelated_jitter", 2, 3, 50, 60), 60)
+        with self.assertRaises(ValueError):
+            _backoff_delay("linear", 2, 1, 0, 60)
+
+    @patch('time.sleep')
+    def test_jittered_retries_vary(self, mock_sleep):
+        """Test that full jitter does not make every failing request wait the same time."""
+        self.extractor.backoff = "full_jitter"
+        with self.assertLogs(logger, level='WARNING'):
+            for _ in range(5):
+                with self.assertRaises(requests.exceptions.HTTPError):
+                    self.extractor._make_request("test_endpoint")
+
+        waits = [c.args[0] for c in mock_sleep.call_args_list]
+        self.assertEqual(len(waits), 20)
+        self.assertGreater(len(set(waits)), 1)
+
+    @patch('time.sleep')
+    def test_retry_budget_is_shared_by_requests(self, mock_sleep):
+        """Test that once the run's retry budget is spent, requests fail on their first error."""
+        self.extractor.retry_budget = RetryBudget(max_retries=3)
+        with self.assertLogs(logger, level='WARNING') as cm:
+            for _ in range(2):
+                with self.assertRaises(requests.exceptions.HTTPError):
+                    self.extractor._make_request("test_endpoint")
+
+        self.assertEqual(self.mock_get.call_count, 5)  # 4 + 1 attempts, not 2 x 5
+        self.assertEqual(mock_sleep.call_count, 3)
+        self.assertEqual(self.extractor.retry_budget.stats["denied"], 2)
+        self.assertTrue(any("Retry budget exhausted" in msg for msg in cm.output))
+
+    def test_retry_time_budget(self):
+        """Test that the budget refuses a retry whose backoff would exceed the time allowed."""
+        budget = RetryBudget(max_retry_time=10)
+        self.assertTrue(budget.try_spend(4))
+        self.assertTrue(budget.try_spend(6))
+        self.assertFalse(budget.try_spend(0.5))
+        self.assertEqual(budget.stats, {"retries": 2, "retry_time": 10.0, "denied": 1})
+
+    @patch('time.sleep')
+    def test_request_deadline_stops_retries(self, mock_sleep):
+        """Test that a retry whose backoff would overrun the deadline is not attempted."""
+        self.extractor.request_deadline = 3
+        with self.assertLogs(logger, level='WARNING') as cm:
+            with self.assertRaises(requests.exceptions.HTTPError):
+                self.extractor._make_request("test_endpoint")
+
+        # The first backoff alone (4s) would overrun the deadline
+        mock_sleep.assert_not_called()
+        self.assertEqual(self.mock_get.call_count, 1)
+        self.assertTrue(any("request deadline" in msg for msg in cm.output))
+
+    def test_attempt_timeout_capped_by_deadline(self):
+        """Test that one attempt's timeouts shrink to the time left, and none is sent once it is gone."""
+        self.extractor.request_deadline = 2
+        self.extractor.connect_timeout, self.extractor.read_timeout = 3, 10
+        with self.assertLogs(logger, level='WARNING'):
+            with self.assertRaises(requests.exceptions.HTTPError):
+                self.extractor._make_request("test_endpoint")
+        connect, read = self.mock_get.call_args.kwargs["timeout"]
+        self.assertLessEqual(connect, 2)
+        self.assertLessEqual(read, 2)
+
+        self.mock_get.reset_mock()
+        self.extractor.request_deadline = 0
+        with self.assertLogs(logger, level='ERROR'):
+            with self.assertRaises(requests.exceptions.Timeout):
+                self.extractor._make_request("test_endpoint")
+        self.mock_get.assert_not_called()
+
+    def test_async_attempt_cut_off_at_deadline(self):
+        """Test that a hanging async attempt is abandoned when the deadline passes."""
+        async def run():
+            extractor = AsyncLinkedInDecisionMakerExtractor(
+                "test_api_key", rate_limiter=TokenBucketRateLimiter(rate=1e6, burst=10**6)
+            )
+            extractor.request_deadline = 0.1
+
+            async def hang(*args):
+                await asyncio.sleep(5)
+
+            try:
+                with patch.object(extractor, '_send', side_effect=hang):
+                    await extractor._make_request("company")
+            finally:
+                await extractor.close()
+
+        start = time.monotonic()
+        with self.assertLogs(logger, level='ERROR'):
+            with self.assertRaises(asyncio.TimeoutError):
+                asyncio.run(run())
+        self.assertLess(time.monotonic() - start, 1)
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def test_opens_at_failure_rate_and_recovers_through_probes(self):
+        """Test the closed -> open -> half-open -> closed cycle."""
+        import time
+        breaker = CircuitBreaker(failure_rate_threshold=0.5, minimum_calls=4, recovery_timeout=0.05,
+                                 half_open_max_calls=2)
+        for failed in (False, True, False):
+            breaker.allow_request()
+            breaker.record_failure() if failed else breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+        with self.assertLogs(logger, level='WARNING'):
+            breaker.allow_request()
+            breaker.record_failure()  # 2 of 4 failed
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpenError) as cm:
+            breaker.allow_request()
+        self.assertGreater(cm.exception.retry_after, 0)
+
+        time.sleep(0.06)
+        probes = [breaker.allow_request(), breaker.allow_request()]
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertNotIn(None, probes)
+        with self.assertRaises(CircuitOpenError):
+            breaker.allow_request()  # Only two probes at a time
+        for probe in probes:
+            breaker.record_success(probe)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(breaker.stats, {"state": "closed", "times_opened": 1, "rejected": 2})
+
+    def test_only_probe_outcomes_count_while_half_open(self):
+        """Test that requests admitted before the circuit opened neither close nor reopen it."""
+        import time
+        breaker = CircuitBreaker(minimum_calls=1, recovery_timeout=0.01, half_open_max_calls=1)
+        self.assertIsNone(breaker.allow_request())
+        self.assertIsNone(breaker.allow_request())
+        with self.assertLogs(logger, level='WARNING'):
+            breaker.record_failure()
+        breaker.record_success()  # Answered while open: ignored
+        time.sleep(0.02)
+
+        probe = breaker.allow_request()
+        breaker.record_success()  # The straggler admitted while closed
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertEqual(breaker.times_opened, 1)
+
+        with self.assertLogs(logger, level='INFO'):
+            breaker.record_success(probe)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(len(breaker._outcomes), 0)
+
+    @patch('requests.Session.get')
+    def test_probe_slot_released_when_outcome_is_unknown(self, mock_get):
+        """Test that a probe ending in an unclassified error or a cancellation does not wedge the circuit."""
+        import time
+        breaker = CircuitBreaker(minimum_calls=1, recovery_timeout=0.01, half_open_max_calls=1)
+        with self.assertLogs(logger, level='WARNING'):
+            breaker.record_failure()
+        time.sleep(0.02)
+
+        extractor = LinkedInDecisionMakerExtractor(
+            "test_api_key", rate_limiter=TokenBucketRateLimiter(rate=1e6, burst=10**6), circuit_breaker=breaker
+        )
+        mock_get.side_effect = ValueError("unexpected")
+        with self.assertRaises(ValueError):
+            extractor._make_request("company")
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+
+        async def cancelled_probe():
+            async_extractor = AsyncLinkedInDecisionMakerExtractor(
+                "test_api_key", rate_limiter=TokenBucketRateLimiter(rate=1e6, burst=10**6), circuit_breaker=breaker
+            )
+
+            async def hang(*args):
+                await asyncio.sleep(5)
+
+            try:
+                with patch.object(async_extractor, '_send', side_effect=hang):
+                    task = asyncio.ensure_future(async_extractor._make_request("company"))
+                    await asyncio.sleep(0.01)
+                    task.cancel()
+                    with self.assertRaises(asyncio.CancelledError):
+                        await task
+            finally:
+                await async_extractor.close()
+
+        asyncio.run(cancelled_probe())
+
+        # The slot came back both times, so the next probe goes through and closes the circuit
+        probe = breaker.allow_request()
+        with self.assertLogs(logger, level='INFO'):
+            breaker.record_success(probe)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    @patch('requests.Session.get')
+    def test_undecodable_body_records_one_outcome(self, mock_get):
+        """Test that a body that fails to decode counts as a failure only, never also as a success."""
+        breaker = CircuitBreaker()
+        extractor = LinkedInDecisionMakerExtractor(
+            "test_api_key", rate_limiter=TokenBucketRateLimiter(rate=1e6, burst=10**6), circuit_breaker=breaker
+        )
+        extractor.retry_attempts = 1
+        response = MagicMock(status_code=200, headers={})
+        response.json.side_effect = requests.exceptions.JSONDecodeError("Expecting value", "<html>", 0)
+        mock_get.return_value = response
+
+        with patch.object(breaker, 'record_success') as mock_success, \
+                patch.object(breaker, 'record_failure') as mock_failure:
+            with self.assertLogs(logger, level='ERROR'):
+                with self.assertRaises(requests.exceptions.JSONDecodeError):
+                    extractor._make_request("company")
+        mock_success.assert_not_called()
+        mock_failure.assert_called_once_with(None)
+
+    def test_failed_probe_reopens(self):
+        """Test that a failure while half-open opens the circuit again."""
+        import time
+        breaker = CircuitBreaker(minimum_calls=1, recovery_timeout=0.01)
+        with self.assertLogs(logger, level='WARNING'):
+            breaker.record_failure()
+            time.sleep(0.02)
+            breaker.record_failure(breaker.allow_request())
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(breaker.times_opened, 2)
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_extractor_fails_fast_while_open(self, mock_get, mock_sleep):
+        """Test that once server errors open the circuit no more requests are sent."""
+        error = MagicMock()
+        error.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=MagicMock(status_code=503, text="Unavailable", headers={})
+        )
+        mock_get.return_value = error
+        extractor = LinkedInDecisionMakerExtractor(
+            "test_api_key", rate_limiter=TokenBucketRateLimiter(rate=1e6, burst=10**6),
+            circuit_breaker=CircuitBreaker(minimum_calls=2, recovery_timeout=60)
+        )
+
+        with self.assertLogs(logger, level='WARNING'):
+            with self.assertRaises(CircuitOpenError):
+                extractor._make_request("test_endpoint")
+            with self.assertRaises(CircuitOpenError):
+                extractor.extract_decision_makers("https://www.linkedin.com/company/test/")
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_not_found_does_not_count_as_failure(self, mock_get, mock_sleep):
+        """Test that client errors show the API is up and leave the circuit closed."""
+        not_found = MagicMock()
+        not_found.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=MagicMock(status_code=404, text="Not Found", headers={})
+        )
+        mock_get.return_value = not_found
+        breaker = CircuitBreaker(minimum_calls=1)
+        extractor = LinkedInDecisionMakerExtractor(
+            "test_api_key", rate_limiter=TokenBucketRateLimiter(rate=1e6, burst=10**6), circuit_breaker=breaker
+        )
+
+        with self.assertLogs(logger, level='WARNING'):
+            with self.assertRaises(requests.exceptions.HTTPError):
+                extractor._make_request("test_endpoint")
+
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    @patch('time.sleep')
+    def test_extract_many_parks_companies(self, mock_sleep):
+        """Test that a company hitting an open circuit waits and is retried instead of failing."""
+        extractor = LinkedInDecisionMakerExtractor("test_api_key", circuit_breaker=CircuitBreaker())
+        calls = []
+
+        def extract(company_url):
+            calls.append(company_url)
+            if len(calls) == 1:
+                raise CircuitOpenError(5.0)
+            return [{"id": "e1", "title": "CEO"}]
+
+        with patch.object(extractor, 'extract_decision_makers', side_effect=extract):
+            with self.assertLogs(logger, level='WARNING'):
+                results = list(extractor.extract_many(["https://www.linkedin.com/company/a/"], max_workers=1))
+
+        self.assertEqual(results, [("https://www.linkedin.com/company/a/", [{"id": "e1", "title": "CEO"}])])
+        mock_sleep.assert_called_once_with(5.0)
+
+    @patch('time.sleep')
+    def test_parking_gives_up_after_max_park_time(self, mock_sleep):
+        """Test that a company parked for longer than max_park_time is skipped."""
+        extractor = LinkedInDecisionMakerExtractor("test_api_key", circuit_breaker=CircuitBreaker())
+        extractor.max_park_time = 1
+        with patch.object(extractor, 'extract_decision_makers', side_effect=CircuitOpenError(5.0)):
+            with self.assertLogs(logger, level='ERROR'):
+                results = dict(extractor.extract_many(["https://www.linkedin.com/company/a/"], max_workers=1))
+
+        self.assertEqual(results, {"https://www.linkedin.com/company/a/": []})
+        mock_sleep.assert_not_called()
+
+class TestRetryClassification(unittest.TestCase):
+
+    def setUp(self):
+        self.extractor = LinkedInDecisionMakerExtractor(
+            "test_api_key", rate_limiter=TokenBucketRateLimiter(rate=1e6, burst=10**6)
+        )
+
+    def http_error(self, status):
+        response = MagicMock(status_code=status, text="error", headers={})
+        return requests.exceptions.HTTPError(response=response)
+
+    def test_classifier(self):
+        """Test which statuses and exceptions are treated as transient."""
+        for status in (408, 429, 500, 502, 503, 504):
+            self.assertTrue(is_retryable(self.http_error(status)), status)
+        for status in (400, 401, 403, 404, 422):
+            self.assertFalse(is_retryable(self.http_error(status)), status)
+        self.assertTrue(is_retryable(requests.exceptions.ConnectionError()))
+        self.assertTrue(is_retryable(requests.exceptions.ReadTimeout()))
+        self.assertFalse(is_retryable(requests.exceptions.InvalidURL()))
+        self.assertFalse(is_retryable(requests.exceptions.TooManyRedirects()))
+        self.assertTrue(is_retryable(aiohttp.ClientResponseError(MagicMock(), (), status=503)))
+        self.assertFalse(is_retryable(aiohttp.ClientResponseError(MagicMock(), (), status=404)))
+        self.assertTrue(is_retryable(aiohttp.ServerDisconnectedError()))
+        self.assertTrue(is_retryable(asyncio.TimeoutError()))
+        self.assertTrue(is_retryable(self.http_error(404), retryable_status_codes={404}))
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_not_found_fails_without_retrying(self, mock_get, mock_sleep):
+        """Test that a permanent 4xx costs one request and no backoff."""
+        response = MagicMock()
+        response.raise_for_status.side_effect = self.http_error(404)
+        mock_get.return_value = response
+
+        with self.assertLogs(logger, level='ERROR') as cm:
+            with self.assertRaises(requests.exceptions.HTTPError):
+                self.extractor._make_request("company", {"link": "https://www.linkedin.com/company/gone/"})
+
+        self.assertEqual(mock_get.call_count, 1)
+        mock_sleep.assert_not_called()
+        self.assertTrue(any("HTTP 404 is a permanent error" in msg for msg in cm.output))
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_connection_errors_are_still_retried(self, mock_get, mock_sleep):
+        """Test that transient transport errors keep the retry policy."""
+        mock_get.side_effect = requests.exceptions.ConnectionError("reset")
+        with self.assertLogs(logger, level='WARNING'):
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                self.extractor._make_request("test_endpoint")
+        self.assertEqual(mock_get.call_count, self.extractor.retry_attempts)
+
+    @patch('requests.Session.get')
+    def test_unauthorized_aborts_batch(self, mock_get):
+        """Test that a 401 is raised as AuthenticationError through extract_decision_makers and extract_many."""
+        response = MagicMock()
+        response.raise_for_status.side_effect = self.http_error(401)
+        mock_get.return_value = response
+        urls = [f"https://www.linkedin.com/company/{i}/" for i in range(5)]
+
+        with self.assertLogs(logger, level='ERROR'):
+            with self.assertRaises(AuthenticationError):
+                self.extractor.extract_decision_makers(urls[0])
+            with self.assertRaises(AuthenticationError):
+                list(self.extractor.extract_many(urls, max_workers=1))
+
+        self.assertLessEqual(mock_get.call_count, 4)
+
+
+class TestAsyncRetryClassification(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.extractor = AsyncLinkedInDecisionMakerExtractor("test_api_key", rate_limiter=TokenBucketRateLimiter(rate=1e6, burst=10**6))
+
+    async def asyncTearDown(self):
+        await self.extractor.close()
+
+    @patch('asyncio.sleep', new_callable=AsyncMock)
+    async def test_permanent_errors(self, mock_sleep):
+        """Test that the async extractor fails a 404 at once and raises AuthenticationError for a 401."""
+        not_found = aiohttp.ClientResponseError(MagicMock(), (), status=404, message="Not Found")
+        unauthorized = aiohttp.ClientResponseError(MagicMock(), (), status=401, message="Unauthorized")
+        with patch.object(self.extractor, '_send', AsyncMock(side_effect=[not_found, unauthorized])) as mock_send:
+            with self.assertLogs(logger, level='ERROR'):
+                with self.assertRaises(aiohttp.ClientResponseError):
+                    await self.extractor._make_request("company")
+                with self.assertRaises(AuthenticationError):
+                    await self.extractor.extract_decision_makers("https://www.linkedin.com/company/test/")
+
+        self.assertEqual(mock_send.await_count, 2)
+        mock_sleep.assert_not_awaited()
+
+class TestTimeoutsAndHedging(unittest.TestCase):
+
+    def setUp(self):
+        self.extractor = LinkedInDecisionMakerExtractor(
+            "test_api_key", timeout=30, connect_timeout=3, read_timeout=10,
+            rate_limiter=TokenBucketRateLimiter(rate=1e6, burst=10**6)
+        )
+
+    def tearDown(self):
+        self.extractor.close()
+
+    def test_latency_histogram(self):
+        """Test per-endpoint percentiles and the minimum sample count."""
+        histogram = LatencyHistogram()
+        for i in range(1, 101):
+            histogram.record("company_employee", i / 1000)
+        histogram.record("company", 0.5)
+
+        self.assertEqual(histogram.count("company_employee"), 100)
+        p50 = histogram.percentile("company_employee", 0.5)
+        p95 = histogram.percentile("company_employee", 0.95)
+        # Buckets are 25% wide, so a percentile is at most a quarter above the true value
+        self.assertTrue(0.05 <= p50 <= 0.05 * 1.25, p50)
+        self.assertTrue(0.095 <= p95 <= 0.095 * 1.25, p95)
+        self.assertIsNone(histogram.percentile("company", 0.5, min_samples=20))
+        self.assertIsNone(histogram.percentile("unknown", 0.5))
+        self.assertEqual(histogram.stats["company"]["count"], 1)
+
+    @patch('requests.Session.get')
+    def test_connect_and_read_timeouts(self, mock_get):
+        """Test that requests get a (connect, read) timeout and a streamed body."""
+        response = MagicMock(status_code=200, headers={})
+        response.iter_content.return_value = iter([b'{"id": "1"}'])
+        response.json.return_value = {"id": "1"}
+        mock_get.return_value = response
+
+        self.assertEqual(self.extractor._make_request("company"), {"id": "1"})
+        self.assertEqual(mock_get.call_args.kwargs["timeout"], (3, 10))
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+        self.assertEqual(response._content, b'{"id": "1"}')
+        self.assertEqual(self.extractor.latency_histogram.count("company"), 1)
+
+    def test_total_timeout(self):
+        """Test that the watchdog ends a read blocked mid-body at the total timeout."""
+        import threading
+        shut_down = threading.Event()
+        response = MagicMock()
+        response.raw.connection.sock.shutdown.side_effect = lambda how: shut_down.set()
+
+        def trickle(chunk_size):
+            yield b"{"
+            self.assertTrue(shut_down.wait(5))
+            raise requests.exceptions.ChunkedEncodingError("Connection broken")
+
+        response.iter_content.side_effect = trickle
+        started = time.monotonic()
+        with self.assertRaises(requests.exceptions.ReadTimeout):
+            self.extractor._read_body(response, started, 0.1)
+        self.assertLess(time.monotonic() - started, 2)
+        response.close.assert_called_once()
+
+    def test_complete_body_kept_after_total_timeout(self):
+        """Test that a body read completely is not discarded because the deadline passed meanwhile."""
+        response = MagicMock()
+        response.iter_content.return_value = iter([b"{", b"}"])
+        self.extractor._read_body(response, time.monotonic() - 31, 30)
+        self.assertEqual(response._content, b"{}")
+        response.close.assert_not_called()
+
+    def test_total_timeout_bounds_a_trickling_server(self):
+        """Test against a real server that the total timeout holds when every byte beats the read timeout."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        import threading
+        body = json.dumps({"id": "12345", "name": "x" * 100}).encode("utf-8")
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                delay = float(self.path.rsplit("=", 1)[-1])
+                for i in range(len(body)):
+                    self.wfile.write(body[i:i + 1])
+                    self.wfile.flush()
+                    time.sleep(delay)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        extractor = LinkedInDecisionMakerExtractor(
+            "test_api_key", timeout=0.5, read_timeout=0.2, rate_limiter=TokenBucketRateLimiter(rate=1e6, burst=10**6)
+        )
+        extractor.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        extractor.retry_attempts = 1
+        try:
+            # About 1.2s to send the body: cut off at the 0.5s total timeout
+            started = time.monotonic()
+            with self.assertLogs(logger, level='ERROR'):
+                with self.assertRaises(requests.exceptions.ReadTimeout):
+                    extractor._make_request("company", {"delay": 0.01})
+            self.assertLess(time.monotonic() - started, 0.9)
+
+            # The same trickle finishing in time is returned whole
+            self.assertEqual(extractor._make_request("company", {"delay": 0}), json.loads(body))
+        finally:
+            extractor.close()
+            server.shutdown()
+            server.server_close()
+
+    def test_hedged_page_request(self):
+        """Test that a page slower than the hedge percentile is requested again and the fast answer used."""
+        self.extractor.hedge_percentile = 0.95
+        for _ in range(20):
+            self.extractor.latency_histogram.record("company_employee", 0.01)
+
+        def make_request(endpoint, params):
+            if make_request.calls == 0:
+                make_request.calls += 1
+                time.sleep(0.5)
+                return {"results": ["slow"]}
+            return {"results": ["fast"]}
+        make_request.calls = 0
+
+        with patch.object(self.extractor, '_make_request', side_effect=make_request) as mock_request:
+            self.assertEqual(self.extractor.get_company_employees("1"), ["fast"])
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(self.extractor.hedged_requests, 1)
+
+    def test_concurrent_hedging_shares_one_executor(self):
+        """Test that threads hedging at once create a single executor and every hedge is counted."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        self.extractor.hedge_percentile = 0.95
+        for _ in range(20):
+            self.extractor.latency_histogram.record("company_employee", 0.001)
+        barrier = threading.Barrier(8)
+
+        def make_request(endpoint, params):
+            time.sleep(0.05)
+            return {"results": [params["page"]]}
+
+        def fetch(page):
+            barrier.wait()
+            results[page] = self.extractor.get_company_employees("1", page)
+
+        results = {}
+        with patch.object(self.extractor, '_make_request', side_effect=make_request), \
+             patch('linkedin_decision_maker_extractor.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_executor:
+            threads = [threading.Thread(target=fetch, args=(page,)) for page in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(results, {page: [page] for page in range(8)})
+        self.assertEqual(mock_executor.call_count, 1)
+        self.assertEqual(self.extractor.hedged_requests, 8)
+
+    def test_no_hedge_before_enough_samples(self):
+        """Test that hedging waits for hedge_min_samples latencies."""
+        self.extractor.hedge_percentile = 0.95
+        self.extractor.latency_histogram.record("company_employee", 0.01)
+        with patch.object(self.extractor, '_make_request', return_value={"results": []}) as mock_request:
+            self.extractor.get_company_employees("1")
+        mock_request.assert_called_once()
+        self.assertIsNone(self.extractor._hedge_executor)
+
+
+class TestAsyncHedging(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.extractor = AsyncLinkedInDecisionMakerExtractor("test_api_key", rate_limiter=TokenBucketRateLimiter(rate=1e6, burst=10**6))
+
+    async def asyncTearDown(self):
+        await self.extractor.close()
+
+    async def test_hedged_page_request(self):
+        """Test that the async extractor hedges a slow page and cancels the losing request."""
+        self.extractor.hedge_percentile = 0.95
+        for _ in range(20):
+            self.extractor.latency_histogram.record("company_employee", 0.01)
+        cancelled = []
+
+        async def make_request(endpoint, params):
+            if not cancelled:
+                cancelled.append(False)
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled[0] = True
+                    raise
+            return {"results": ["fast"]}
+
+        with patch.object(self.extractor, '_make_request', side_effect=make_request):
+            self.assertEqual(await self.extractor.get_company_employees("1"), ["fast"])
+            await asyncio.sleep(0)
+        self.assertEqual(cancelled, [True])
+        self.assertEqual(self.extractor.hedged_requests, 1)
+
+
 # Now, we define the TestCLI class with all its methods
 class TestCLI(unittest.TestCase):
     @patch('cli.argparse.ArgumentParser')